@@ -1,2 +1,3 @@
 from . import search
 from . import sort
+from . import sliding_window
@@ -0,0 +1 @@
+from .sliding_window_extremes import sliding_window_max, sliding_window_min
@@ -0,0 +1,66 @@
+from ds import MonotonicQueue
+from typing import TypeVar, Iterable, Iterator
+
+T = TypeVar("T")
+
+_NUMPY_BLOCK_SIZE: int = 4096 # The number of elements of a NumPy array converted to Python values at a time
+
+def _values(iterable: Iterable[T]) -> Iterator[T]:
+    """Lazily yield the values of an iterable, converting a NumPy array a block at a time.
+
+    Iterating a NumPy array directly boxes every element as a NumPy scalar, which is slow to compare. Slicing out a block and calling `tolist` converts the whole block to plain Python values in one C-level pass instead, while still never materialising more than one block of the array. NumPy is detected by duck typing so it is not a dependency.
+    """
+    if hasattr(iterable, "tolist") and hasattr(iterable, "ndim"):
+        for start in range(0, len(iterable), _NUMPY_BLOCK_SIZE):
+            yield from iterable[start:start + _NUMPY_BLOCK_SIZE].tolist()
+        # rof
+    else:
+        yield from iterable
+    # fi
+# fed
+
+def _sliding_window_extremes(iterable: Iterable[T], k: int, increasing: bool) -> Iterator[T]:
+    """Return an iterator over the minimum of each window of k consecutive values if increasing, or the maximum otherwise, or raise a ValueError if k is less than 1.
+
+    This is a plain function rather than a generator so the window size is checked when it is called, not when the first value is requested.
+    """
+    if k < 1:
+        raise ValueError("Window size must be at least 1")
+    # fi
+
+    return _window_extremes(iterable, k, increasing)
+# fed
+
+def _window_extremes(iterable: Iterable[T], k: int, increasing: bool) -> Iterator[T]:
+    """Lazily yield the minimum of each window of k consecutive values if increasing, or the maximum otherwise, for a window size already checked to be at least 1."""
+    window: MonotonicQueue = MonotonicQueue(increasing)
+
+    for i, value in enumerate(_values(iterable)):
+        window.enqueue((value, i))
+
+        # drop the front once it has slid out of the window
+        if window.front()[1] <= i - k:
+            window.dequeue()
+        # fi
+
+        if i >= k - 1:
+            yield window.front()[0]
+        # fi
+    # rof
+# fed
+
+def sliding_window_max(iterable: Iterable[T], k: int) -> Iterator[T]:
+    """Lazily yield the maximum of each window of k consecutive values of an iterable, or raise a ValueError if k is less than 1.
+
+    The first maximum is yielded once k values have been read and one more is yielded per value after that, so n values give n - k + 1 maxima and none if there are fewer than k. Values are kept in a monotonic queue as `(value, index)` pairs which is non-increasing from front to back, so the front is the maximum of the window and is dropped once its index slides out. Every value is enqueued and removed at most once so time complexity is O(n) in total, O(1) amortized per value, regardless of k, and space complexity is O(k). The iterable is consumed lazily, so this works on unbounded streams, and NumPy arrays are read a block at a time.
+    """
+    return _sliding_window_extremes(iterable, k, False)
+# fed
+
+def sliding_window_min(iterable: Iterable[T], k: int) -> Iterator[T]:
+    """Lazily yield the minimum of each window of k consecutive values of an iterable, or raise a ValueError if k is less than 1.
+
+    This mirrors `sliding_window_max` with a monotonic queue which is non-decreasing from front to back, so time complexity is O(n) in total and space complexity is O(k).
+    """
+    return _sliding_window_extremes(iterable, k, True)
+# fed
@@ -3,27 +3,113 @@ from typing import TypeVar
 
 T = TypeVar("T")
 
+_INSERTION_SORT_THRESHOLD: int = 16 # Partitions of at most this many elements are finished with insertion sort
+_NINTHER_THRESHOLD: int = 40 # Partitions of more than this many elements pick their pivot with Tukey's ninther rather than a median of three
+
 def quick_sort(arr: Array[T]) -> None:
-    """Sort an array using the quick sort algorithm."""
-    def _quick_sort_rec(arr: Array[T], low: int, high: int) -> None:
-        """Sorts a portion of an array within the given high and low bounds using the Hoare partition scheme.
-        
-        Arguments
-        ---------
-        arr
-            The base array that is being sorted.
+    """Sort an array in place using introsort, a quick sort that falls back to heap sort and insertion sort.
 
-        low
-            The lower boundary/index of the portion that will be sorted.
+    A plain quick sort that always pivots on the first element goes quadratic on already sorted input and recurses once per element. Here the pivot is the median of the first, middle and last elements (or for large partitions the median of three such medians, Tukey's ninther), so sorted, reverse sorted and many other common inputs split evenly. Quick sort only recurses into the smaller side of each partition and loops on the larger side, so the recursion is at most O(log(n)) deep. If the partitioning still goes deeper than 2 log(n) levels on some adversarial input, the remaining range is heap sorted instead, which bounds the worst case at O(n log(n)). Partitions of a few elements are finished with insertion sort, which has less overhead than partitioning at that size.
 
-        high
-            The higher boundary/index of the portion that will be sorted.
-        """
-        if low >= high:
-            return
+    Time complexity is O(n log(n)) in the best, average and worst cases, and space complexity is O(log(n)) for the recursion. Elements are only read and written through `get` and `set`, so any array or array view can be sorted.
+    """
+    def _swap(i: int, j: int) -> None:
+        """Swap the elements at the two given indices."""
+        temp: T = arr.get(i)
+        arr.set(i, arr.get(j))
+        arr.set(j, temp)
+    # fed
+
+    def _insertion_sort(low: int, high: int) -> None:
+        """Sort the elements from the low index to the high index inclusive by inserting each into the sorted run before it, shifting larger elements up one slot."""
+        for i in range(low + 1, high + 1):
+            current: T = arr.get(i)
+            j: int = i - 1
+
+            while j >= low and arr.get(j) > current:
+                arr.set(j + 1, arr.get(j))
+                j -= 1
+            # elihw
+
+            arr.set(j + 1, current)
+        # rof
+    # fed
+
+    def _sift_down(low: int, root: int, end: int) -> None:
+        """Move the element at the root of a max heap stored from the low index down until both its children are smaller, considering only heap positions before the end."""
+        while True:
+            child: int = 2 * root + 1
+
+            if child >= end:
+                return
+            # fi
+
+            # pick the larger child
+            if child + 1 < end and arr.get(low + child + 1) > arr.get(low + child):
+                child += 1
+            # fi
+
+            if not arr.get(low + child) > arr.get(low + root):
+                return
+            # fi
+
+            _swap(low + root, low + child)
+            root = child
+        # elihw
+    # fed
+
+    def _heap_sort(low: int, high: int) -> None:
+        """Sort the elements from the low index to the high index inclusive by building a max heap over them and repeatedly moving its root to the end."""
+        count: int = high - low + 1
+
+        for root in range(count // 2 - 1, -1, -1):
+            _sift_down(low, root, count)
+        # rof
+
+        for end in range(count - 1, 0, -1):
+            _swap(low, low + end)
+            _sift_down(low, 0, end)
+        # rof
+    # fed
+
+    def _median_of_three(a: int, b: int, c: int) -> int:
+        """Return whichever of the three given indices holds the median of their elements."""
+        x: T = arr.get(a)
+        y: T = arr.get(b)
+        z: T = arr.get(c)
+
+        if x < y:
+            return b if y < z else c if x < z else a
         # fi
 
-        pivot: int = arr.get(low)
+        return a if x < z else c if y < z else b
+    # fed
+
+    def _choose_pivot(low: int, high: int) -> int:
+        """Return the index of the pivot for the elements from the low index to the high index inclusive, a median of three or for large partitions Tukey's ninther."""
+        mid: int = low + (high - low) // 2
+
+        if high - low + 1 <= _NINTHER_THRESHOLD:
+            return _median_of_three(low, mid, high)
+        # fi
+
+        step: int = (high - low + 1) // 8
+
+        return _median_of_three(
+            _median_of_three(low, low + step, low + 2 * step),
+            _median_of_three(mid - step, mid, mid + step),
+            _median_of_three(high - 2 * step, high - step, high),
+        )
+    # fed
+
+    def _partition(low: int, high: int) -> int:
+        """Partition the elements from the low index to the high index inclusive using the Hoare partition scheme and return the index that splits them.
+
+        The chosen pivot is swapped to the low index first, so it is the first element as in the textbook scheme, which guarantees both sides are non-empty. Every element up to and including the returned index is then at most the pivot and every element after it is at least the pivot.
+        """
+        _swap(low, _choose_pivot(low, high))
+
+        pivot: T = arr.get(low)
         i: int = low - 1
         j: int = high + 1
 
@@ -41,18 +127,51 @@ def quick_sort(arr: Array[T]) -> None:
             # elihw
 
             if i >= j:
-                break
+                return j
             # fi
 
-            temp: T = arr.get(i)
-            arr.set(i, arr.get(j))
-            arr.set(j, temp)
+            _swap(i, j)
         # elihw
+    # fed
 
-        _quick_sort_rec(arr, low, j)
-        _quick_sort_rec(arr, j + 1, high)
+    def _introsort(low: int, high: int, depth: int) -> None:
+        """Sort the elements from the low index to the high index inclusive, partitioning until the range is small or the depth budget runs out.
+
+        Arguments
+        ---------
+        low
+            The lower boundary/index of the portion that will be sorted.
+
+        high
+            The higher boundary/index of the portion that will be sorted.
+
+        depth
+            The number of levels of partitioning left before falling back to heap sort.
+        """
+        while high - low + 1 > _INSERTION_SORT_THRESHOLD:
+            if depth == 0:
+                _heap_sort(low, high)
+
+                return
+            # fi
+
+            depth -= 1
+            split: int = _partition(low, high)
+
+            # recurse into the smaller side and loop on the larger side so the recursion depth stays logarithmic
+            if split - low < high - split:
+                _introsort(low, split, depth)
+                low = split + 1
+            else:
+                _introsort(split + 1, high, depth)
+                high = split
+            # fi
+        # elihw
+
+        _insertion_sort(low, high)
     # fed
 
-    _quick_sort_rec(arr, 0, arr.length() - 1)
-# fed
+    length: int = arr.length()
 
+    _introsort(0, length - 1, 2 * length.bit_length())
+# fed
@@ -1 +1,2 @@
-from .breadth_first_search import breadth_first_search
+from .breadth_first_search import breadth_first_search, bfs_iter, level_order
+from .depth_first_search import dfs_iter, PRE_ORDER, IN_ORDER, POST_ORDER
@@ -1,36 +1,97 @@
 from ds import BinarySearchTree, Queue, Array
-from typing import TypeVar
+from typing import TypeVar, Iterator, Callable, Any
 
 T = TypeVar("T")
 
-def breadth_first_search(bst: BinarySearchTree[T], value: T) -> bool:
-    """Perform a breadth first search on a binary search tree to see if the given target is within the tree.
-    
-    Time complexity in the best case occurs when the target value is the first node in the tree which leads to O(1). In the worst case, time complexity is O(n) given that it made be the bottom right node, leading us to have to traverse n nodes. In the average case, we have traverse n / 2 nodes to leading to O(n), Space complexity is O(1) in the best case and O(n) in the average and worst cases given that we have to store a fraction of the tree's nodes in a queue, at worst being n / 2.
+def bfs_iter(bst: BinarySearchTree[T]) -> Iterator[T]:
+    """Lazily yield the values of a binary search tree in breadth first order, level by level from the root and left to right within a level.
+
+    The frontier of nodes still to visit is held in a ring buffer queue, so each node costs one write into a slot of a contiguous buffer rather than a linked list node. Values are yielded as they are dequeued, so a caller that stops early never visits the rest of the tree. Nodes are read through the tree's `_value_of`, `_left_of` and `_right_of` hooks and compared with its `_NIL`, so the same walk covers node objects and the indices of a `CompactBinarySearchTree`. Time complexity is O(n) to exhaust and space complexity is O(w) where w is the widest level of the tree, at worst about n / 2.
     """
-    if bst.root is None:
-        return False
+    nil: Any = bst._NIL
+    value_of: Callable[[Any], T] = bst._value_of
+    left_of: Callable[[Any], Any] = bst._left_of
+    right_of: Callable[[Any], Any] = bst._right_of
+
+    if bst.root == nil:
+        return
     # fi
-    
-    queue: Queue[BinarySearchTree.Node] = Queue(Array(bst.root))
+
+    queue: Queue[Any] = Queue(engine=Queue.RING_BUFFER)
+    queue.enqueue(bst.root)
 
     while queue.length() != 0:
-        node = queue.dequeue()
+        node: Any = queue.dequeue()
 
-        if node.value == value:
-            return True
+        yield value_of(node)
+
+        left: Any = left_of(node)
+        right: Any = right_of(node)
 
-        if node.left is not None:
-            queue.enqueue(node.left)
+        if left != nil:
+            queue.enqueue(left)
         # fi
 
-        if node.right is not None:
-            queue.enqueue(node.right)
+        if right != nil:
+            queue.enqueue(right)
         # fi
     # elihw
+# fed
 
-    return False
+def level_order(bst: BinarySearchTree[T]) -> Iterator[Array[T]]:
+    """Lazily yield the values of a binary search tree one level at a time from the root down, each level as an array of its values from left to right.
+
+    The queue is drained one level at a time: its length when a level starts is the number of nodes in that level, and the children enqueued while they are dequeued make up the next level. Nodes are read through the tree's hooks as in `bfs_iter`. Time complexity is O(n) to exhaust and space complexity is O(w) where w is the widest level of the tree.
+    """
+    nil: Any = bst._NIL
+    value_of: Callable[[Any], T] = bst._value_of
+    left_of: Callable[[Any], Any] = bst._left_of
+    right_of: Callable[[Any], Any] = bst._right_of
+
+    if bst.root == nil:
+        return
+    # fi
+
+    queue: Queue[Any] = Queue(engine=Queue.RING_BUFFER)
+    queue.enqueue(bst.root)
+
+    while queue.length() != 0:
+        width: int = queue.length()
+        level: Array[T] = Array()
+
+        level.reserve(width)
+
+        for _ in range(width):
+            node: Any = queue.dequeue()
+
+            level.push(value_of(node))
+
+            left: Any = left_of(node)
+            right: Any = right_of(node)
+
+            if left != nil:
+                queue.enqueue(left)
+            # fi
+
+            if right != nil:
+                queue.enqueue(right)
+            # fi
+        # rof
+
+        yield level
+    # elihw
 # fed
-        
-        
+
+def breadth_first_search(bst: BinarySearchTree[T], value: T) -> bool:
+    """Perform a breadth first search on a binary search tree to see if the given target is within the tree.
     
+    Time complexity in the best case occurs when the target value is the first node in the tree which leads to O(1). In the worst case, time complexity is O(n) given that it made be the bottom right node, leading us to have to traverse n nodes. In the average case, we have traverse n / 2 nodes to leading to O(n), Space complexity is O(1) in the best case and O(n) in the average and worst cases given that we have to store a fraction of the tree's nodes in a queue, at worst being n / 2. The search stops as soon as the target is found since `bfs_iter` yields lazily.
+    """
+    for node_value in bfs_iter(bst):
+        if node_value == value:
+            return True
+        # fi
+    # rof
+
+    return False
+# fed
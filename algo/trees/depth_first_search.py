@@ -0,0 +1,119 @@
+from ds import BinarySearchTree, Stack
+from typing import TypeVar, Iterator, Callable, Any
+
+T = TypeVar("T")
+
+PRE_ORDER: str = "pre" # Visit a node before its left and right subtrees
+IN_ORDER: str = "in" # Visit a node between its left and right subtrees, which yields the values of a binary search tree in sorted order
+POST_ORDER: str = "post" # Visit a node after its left and right subtrees
+
+def dfs_iter(bst: BinarySearchTree[T], order: str = IN_ORDER) -> Iterator[T]:
+    """Lazily yield the values of a binary search tree in depth first pre-order, in-order or post-order, or raise a ValueError if the order is unknown.
+
+    The traversal is iterative, keeping the path of nodes being visited on a stack rather than the call stack, so a degenerate tree of any depth is traversed without hitting the recursion limit. Values are yielded as they are visited, so a caller that stops early never visits the rest of the tree. Nodes are read through the tree's `_value_of`, `_left_of` and `_right_of` hooks and compared with its `_NIL`, so the same walk covers node objects and the indices of a `CompactBinarySearchTree`. Time complexity is O(n) to exhaust and space complexity is O(h).
+
+    Arguments
+    ---------
+    bst
+        The binary search tree to traverse.
+
+    order
+        One of `PRE_ORDER`, `IN_ORDER` or `POST_ORDER`.
+    """
+    if order not in (PRE_ORDER, IN_ORDER, POST_ORDER):
+        raise ValueError(f"Unknown depth first order: {order}")
+    # fi
+
+    return _pre_order(bst) if order == PRE_ORDER else _in_order(bst) if order == IN_ORDER else _post_order(bst)
+# fed
+
+def _pre_order(bst: BinarySearchTree[T]) -> Iterator[T]:
+    """Lazily yield the values of a binary search tree in pre-order, pushing the right child before the left so the left subtree is visited first."""
+    nil: Any = bst._NIL
+    value_of: Callable[[Any], T] = bst._value_of
+    left_of: Callable[[Any], Any] = bst._left_of
+    right_of: Callable[[Any], Any] = bst._right_of
+
+    if bst.root == nil:
+        return
+    # fi
+
+    stack: Stack[Any] = Stack()
+    stack.push(bst.root)
+
+    while stack.size() != 0:
+        node: Any = stack.pop()
+
+        yield value_of(node)
+
+        left: Any = left_of(node)
+        right: Any = right_of(node)
+
+        if right != nil:
+            stack.push(right)
+        # fi
+
+        if left != nil:
+            stack.push(left)
+        # fi
+    # elihw
+# fed
+
+def _in_order(bst: BinarySearchTree[T]) -> Iterator[T]:
+    """Lazily yield the values of a binary search tree in-order, stacking the nodes passed on the way down each leftmost path."""
+    nil: Any = bst._NIL
+    value_of: Callable[[Any], T] = bst._value_of
+    left_of: Callable[[Any], Any] = bst._left_of
+    right_of: Callable[[Any], Any] = bst._right_of
+
+    stack: Stack[Any] = Stack()
+    node: Any = bst.root
+
+    while stack.size() != 0 or node != nil:
+        while node != nil:
+            stack.push(node)
+            node = left_of(node)
+        # elihw
+
+        node = stack.pop()
+
+        yield value_of(node)
+
+        node = right_of(node)
+    # elihw
+# fed
+
+def _post_order(bst: BinarySearchTree[T]) -> Iterator[T]:
+    """Lazily yield the values of a binary search tree in post-order.
+
+    A node on top of the stack is only visited once its right subtree is empty or is the subtree that was just finished, which is tracked by remembering the last node visited.
+    """
+    nil: Any = bst._NIL
+    value_of: Callable[[Any], T] = bst._value_of
+    left_of: Callable[[Any], Any] = bst._left_of
+    right_of: Callable[[Any], Any] = bst._right_of
+
+    stack: Stack[Any] = Stack()
+    node: Any = bst.root
+    last: Any = nil
+
+    while stack.size() != 0 or node != nil:
+        while node != nil:
+            stack.push(node)
+            node = left_of(node)
+        # elihw
+
+        top: Any = stack.peek()
+        right: Any = right_of(top)
+
+        if right != nil and right != last:
+            node = right # finish the right subtree first
+        else:
+            stack.pop()
+
+            yield value_of(top)
+
+            last = top
+        # fi
+    # elihw
+# fed
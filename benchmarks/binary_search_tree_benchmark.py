@@ -0,0 +1,61 @@
+"""Compare the height and throughput of the unbalanced `BinarySearchTree` against the AVL balanced tree on sorted and random inserts.
+
+Run from the repository root with `python -m benchmarks.binary_search_tree_benchmark`.
+"""
+import random
+import time
+from typing import List, Tuple
+from ds import BinarySearchTree
+
+N: int = 3_000 # The number of values inserted, searched and deleted per run, kept small since the unbalanced tree degenerates on sorted input
+
+def bench(balance: str | None, values: List[int]) -> Tuple[int, float, float, float]:
+    """Insert, search for and delete every value and return the height after inserting and the throughput of each operation in ops/sec."""
+    tree: BinarySearchTree[int] = BinarySearchTree(balance)
+
+    start: float = time.perf_counter()
+
+    for value in values:
+        tree.insert(value)
+    # rof
+
+    inserted: float = time.perf_counter()
+    height: int = tree.height()
+
+    for value in values:
+        tree.search(value)
+    # rof
+
+    searched: float = time.perf_counter()
+
+    for value in values:
+        tree.delete(value)
+    # rof
+
+    deleted: float = time.perf_counter()
+
+    return height, N / (inserted - start), N / (searched - inserted), N / (deleted - searched)
+# fed
+
+def main() -> None:
+    """Print the height and the insert, search and delete throughput of each tree on each workload."""
+    shuffled: List[int] = list(range(N))
+    random.shuffle(shuffled)
+
+    workloads = [("sorted", list(range(N))), ("random", shuffled)]
+
+    print(f"{N} values")
+    print(f"{'tree':<8} {'workload':<9} {'height':>7} {'insert/s':>12} {'search/s':>12} {'delete/s':>12}")
+
+    for workload, values in workloads:
+        for name, balance in [("plain", None), ("avl", BinarySearchTree.AVL)]:
+            height, inserts, searches, deletes = bench(balance, values)
+
+            print(f"{name:<8} {workload:<9} {height:>7} {inserts:>12,.0f} {searches:>12,.0f} {deletes:>12,.0f}")
+        # rof
+    # rof
+# fed
+
+if __name__ == "__main__":
+    main()
+# fi
@@ -0,0 +1,156 @@
+"""Compare the throughput of `BlockingQueue` and `AsyncQueue` against the standard library queues under multi-producer/multi-consumer load.
+
+Run from the repository root with `python -m benchmarks.blocking_queue_benchmark`.
+"""
+import asyncio
+import queue
+import threading
+import time
+from typing import Callable
+from ds import BlockingQueue, AsyncQueue
+
+ITEMS: int = 200_000 # The total number of items passed through each queue
+PRODUCERS: int = 4 # The number of producer threads or tasks
+CONSUMERS: int = 4 # The number of consumer threads or tasks
+MAXSIZE: int = 1024 # The bound of each queue
+BATCH: int = 64 # The batch size for `get_many`
+
+def _time_threads(put: Callable[[int], None], finish: Callable[[], None], consume: Callable[[], None]) -> float:
+    """Run the producer and consumer threads, calling finish once every producer is done, and return the elapsed time in seconds."""
+    per_producer: int = ITEMS // PRODUCERS
+    finished: threading.Barrier = threading.Barrier(PRODUCERS, action=finish)
+
+    def produce() -> None:
+        for i in range(per_producer):
+            put(i)
+        # rof
+
+        finished.wait()
+    # fed
+
+    threads = [threading.Thread(target=produce) for _ in range(PRODUCERS)] + [threading.Thread(target=consume) for _ in range(CONSUMERS)]
+    start: float = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+    # rof
+
+    for thread in threads:
+        thread.join()
+    # rof
+
+    return time.perf_counter() - start
+# fed
+
+def bench_stdlib_queue() -> float:
+    """Time `queue.Queue`, stopping each consumer with a None sentinel."""
+    q: queue.Queue = queue.Queue(MAXSIZE)
+
+    def finish() -> None:
+        for _ in range(CONSUMERS):
+            q.put(None)
+        # rof
+    # fed
+
+    def consume() -> None:
+        while q.get() is not None:
+            pass
+        # elihw
+    # fed
+
+    return _time_threads(q.put, finish, consume)
+# fed
+
+def bench_blocking_queue(batched: bool) -> float:
+    """Time `BlockingQueue`, closing it once the producers are done so the consumers stop when it is drained."""
+    q: BlockingQueue[int] = BlockingQueue(MAXSIZE)
+
+    def consume() -> None:
+        try:
+            while True:
+                if batched:
+                    q.get_many(BATCH)
+                else:
+                    q.get()
+                # fi
+            # elihw
+        except BlockingQueue.QueueClosedError:
+            pass
+        # yrt
+    # fed
+
+    return _time_threads(q.put, q.close, consume)
+# fed
+
+async def bench_async_queue(stdlib: bool, batched: bool) -> float:
+    """Time `asyncio.Queue` stopped with None sentinels or `AsyncQueue` stopped by closing it."""
+    q = asyncio.Queue(MAXSIZE) if stdlib else AsyncQueue(MAXSIZE)
+    per_producer: int = ITEMS // PRODUCERS
+
+    async def produce() -> None:
+        for i in range(per_producer):
+            await q.put(i)
+        # rof
+    # fed
+
+    async def consume() -> None:
+        if stdlib:
+            while await q.get() is not None:
+                pass
+            # elihw
+
+            return
+        # fi
+
+        try:
+            while True:
+                if batched:
+                    await q.get_many(BATCH)
+                else:
+                    await q.get()
+                # fi
+            # elihw
+        except AsyncQueue.QueueClosedError:
+            pass
+        # yrt
+    # fed
+
+    start: float = time.perf_counter()
+    consumers = [asyncio.create_task(consume()) for _ in range(CONSUMERS)]
+
+    await asyncio.gather(*(produce() for _ in range(PRODUCERS)))
+
+    if stdlib:
+        for _ in range(CONSUMERS):
+            await q.put(None)
+        # rof
+    else:
+        await q.close()
+    # fi
+
+    await asyncio.gather(*consumers)
+
+    return time.perf_counter() - start
+# fed
+
+def main() -> None:
+    """Print the throughput of each queue in items per second."""
+    results = [
+        ("queue.Queue", bench_stdlib_queue()),
+        ("BlockingQueue.get", bench_blocking_queue(False)),
+        ("BlockingQueue.get_many", bench_blocking_queue(True)),
+        ("asyncio.Queue", asyncio.run(bench_async_queue(True, False))),
+        ("AsyncQueue.get", asyncio.run(bench_async_queue(False, False))),
+        ("AsyncQueue.get_many", asyncio.run(bench_async_queue(False, True))),
+    ]
+
+    print(f"{PRODUCERS} producers, {CONSUMERS} consumers, {ITEMS} items, maxsize {MAXSIZE}")
+
+    for name, elapsed in results:
+        print(f"{name:<24} {ITEMS / elapsed:>12,.0f} items/s")
+    # rof
+# fed
+
+if __name__ == "__main__":
+    main()
+# fi
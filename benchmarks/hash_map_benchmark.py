@@ -0,0 +1,58 @@
+"""Compare the throughput and the worst-case latency of a single `set` for `HashMap` resizing all at once against resizing incrementally.
+
+Run from the repository root with `python -m benchmarks.hash_map_benchmark`. The garbage collector is disabled while timing so its pauses are not mistaken for resizes.
+"""
+import gc
+import time
+from typing import List, Tuple
+from ds import HashMap
+
+N: int = 1_000_000 # The number of keys inserted per run
+REHASH_STEP: int = 4 # The number of old buckets migrated per operation by the incremental engine
+MAX_LATENCY_RATIO: float = 0.1 # The largest worst-case latency of the incremental engine allowed, as a fraction of that of the stop-the-world engine
+
+def bench(rehash_step: int | None) -> Tuple[float, int, int]:
+    """Insert N keys and return the total time in seconds together with the worst and 99.9th percentile latency of a single `set` in nanoseconds."""
+    hash_map: HashMap[int, int] = HashMap(rehash_step=rehash_step)
+    latencies: List[int] = [0] * N
+    clock = time.perf_counter_ns
+
+    gc.disable()
+
+    try:
+        start: int = clock()
+
+        for i in range(N):
+            before: int = clock()
+            hash_map.set(i, i)
+            latencies[i] = clock() - before
+        # rof
+
+        elapsed: int = clock() - start
+    finally:
+        gc.enable()
+    # yrt
+
+    latencies.sort()
+
+    return elapsed / 1e9, latencies[-1], latencies[int(N * 0.999)]
+# fed
+
+def main() -> None:
+    """Print the throughput and latency of each resizing strategy and check that incremental resizing bounds the worst case."""
+    stop_the_world: Tuple[float, int, int] = bench(None)
+    incremental: Tuple[float, int, int] = bench(REHASH_STEP)
+
+    print(f"{N} sets of int keys")
+    print(f"{'resizing':<24} {'sets/s':>12} {'worst':>12} {'p99.9':>12}")
+
+    for name, (elapsed, worst, p999) in (("all at once", stop_the_world), (f"incremental, step {REHASH_STEP}", incremental)):
+        print(f"{name:<24} {N / elapsed:>12,.0f} {worst / 1e6:>10.2f}ms {p999 / 1e3:>10.1f}us")
+    # rof
+
+    assert incremental[1] < stop_the_world[1] * MAX_LATENCY_RATIO, "incremental resizing did not bound the worst-case latency of a set"
+# fed
+
+if __name__ == "__main__":
+    main()
+# fi
@@ -0,0 +1,176 @@
+"""Compare the throughput of `SharedRingQueue` against `multiprocessing.Queue` passing fixed-size records from a producer process to a consumer process, after a stress run that checks every record arrives intact and in order.
+
+Run from the repository root with `python -m benchmarks.shared_ring_queue_benchmark`.
+"""
+import multiprocessing
+import random
+import time
+from ds import SharedRingQueue
+
+RECORDS: int = 500_000 # The number of records passed through each queue
+RECORD_FORMAT: str = "qd" # The layout of a record, an integer and a double
+CAPACITY: int = 4096 # The capacity of the ring buffer
+BATCH: int = 256 # The batch size for the batched ring buffer methods
+STRESS_RECORDS: int = 2_000_000 # The number of records passed through the stress run
+STRESS_CAPACITY: int = 64 # The capacity of the ring buffer in the stress run, small so the indices wrap and the queue is often full or empty
+
+def produce_ring(name: str, batched: bool) -> None:
+    """Attach to the ring buffer and enqueue every record, spinning while it is full."""
+    ring: SharedRingQueue = SharedRingQueue(RECORD_FORMAT, CAPACITY, name, create=False)
+    sent: int = 0
+
+    while sent < RECORDS:
+        if batched:
+            sent += ring.enqueue_many((i, i * 0.5) for i in range(sent, min(sent + BATCH, RECORDS)))
+        else:
+            try:
+                ring.enqueue((sent, sent * 0.5))
+                sent += 1
+            except SharedRingQueue.QueueIndexError:
+                pass
+            # yrt
+        # fi
+    # elihw
+
+    ring.close()
+# fed
+
+def bench_ring(batched: bool) -> float:
+    """Time the ring buffer with the consumer in this process, spinning while it is empty."""
+    ring: SharedRingQueue = SharedRingQueue(RECORD_FORMAT, CAPACITY)
+    producer = multiprocessing.Process(target=produce_ring, args=(ring.name(), batched))
+    received: int = 0
+    start: float = time.perf_counter()
+
+    producer.start()
+
+    while received < RECORDS:
+        if batched:
+            received += ring.dequeue_many(BATCH).length()
+        else:
+            try:
+                ring.dequeue()
+                received += 1
+            except SharedRingQueue.QueueIndexError:
+                pass
+            # yrt
+        # fi
+    # elihw
+
+    elapsed: float = time.perf_counter() - start
+
+    producer.join()
+    ring.close()
+    ring.unlink()
+
+    return elapsed
+# fed
+
+def produce_pipe(queue: multiprocessing.Queue) -> None:
+    """Put every record on the multiprocessing queue."""
+    for i in range(RECORDS):
+        queue.put((i, i * 0.5))
+    # rof
+# fed
+
+def bench_pipe() -> float:
+    """Time `multiprocessing.Queue` with the consumer in this process."""
+    queue: multiprocessing.Queue = multiprocessing.Queue(CAPACITY)
+    producer = multiprocessing.Process(target=produce_pipe, args=(queue,))
+    start: float = time.perf_counter()
+
+    producer.start()
+
+    for _ in range(RECORDS):
+        queue.get()
+    # rof
+
+    elapsed: float = time.perf_counter() - start
+
+    producer.join()
+
+    return elapsed
+# fed
+
+def produce_stress(name: str) -> None:
+    """Attach to the ring buffer and enqueue every record, randomly one at a time or in batches of random size, spinning while it is full."""
+    ring: SharedRingQueue = SharedRingQueue(RECORD_FORMAT, STRESS_CAPACITY, name, create=False)
+    sent: int = 0
+
+    while sent < STRESS_RECORDS:
+        if random.random() < 0.5:
+            stop: int = min(sent + random.randint(1, 2 * STRESS_CAPACITY), STRESS_RECORDS)
+            sent += ring.enqueue_many((i, i * 0.5) for i in range(sent, stop))
+        else:
+            try:
+                ring.enqueue((sent, sent * 0.5))
+                sent += 1
+            except SharedRingQueue.QueueIndexError:
+                pass
+            # yrt
+        # fi
+    # elihw
+
+    ring.close()
+# fed
+
+def stress() -> None:
+    """Pass records through a small ring buffer with a random mix of single and batched calls on both sides and raise an AssertionError if any record is lost, repeated, torn or out of order."""
+    ring: SharedRingQueue = SharedRingQueue(RECORD_FORMAT, STRESS_CAPACITY)
+    producer = multiprocessing.Process(target=produce_stress, args=(ring.name(),))
+    expected: int = 0
+
+    producer.start()
+
+    try:
+        while expected < STRESS_RECORDS:
+            if random.random() < 0.5:
+                records = ring.dequeue_many(random.randint(0, 2 * STRESS_CAPACITY))
+                received = [records.get(i) for i in range(records.length())]
+            else:
+                try:
+                    received = [ring.dequeue()]
+                except SharedRingQueue.QueueIndexError:
+                    received = []
+                # yrt
+            # fi
+
+            for record in received:
+                assert record == (expected, expected * 0.5), (record, expected)
+                expected += 1
+            # rof
+        # elihw
+
+        assert ring.length() == 0, ring.length()
+    except BaseException:
+        producer.terminate() # the producer would otherwise spin on a full queue forever
+        raise
+    finally:
+        producer.join()
+        ring.close()
+        ring.unlink()
+    # yrt
+
+    print(f"stress: {STRESS_RECORDS} records through capacity {STRESS_CAPACITY}, all in order")
+# fed
+
+def main() -> None:
+    """Run the stress check, then print the throughput of each queue in records per second."""
+    stress()
+
+    results = [
+        ("multiprocessing.Queue", bench_pipe()),
+        ("SharedRingQueue", bench_ring(False)),
+        ("SharedRingQueue batched", bench_ring(True)),
+    ]
+
+    print(f"{RECORDS} records of format {RECORD_FORMAT!r}, capacity {CAPACITY}")
+
+    for name, elapsed in results:
+        print(f"{name:<24} {RECORDS / elapsed:>12,.0f} records/s")
+    # rof
+# fed
+
+if __name__ == "__main__":
+    main()
+# fi
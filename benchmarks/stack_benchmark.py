@@ -0,0 +1,102 @@
+"""Compare the per-operation cost of `Stack` push and pop against a raw Python list.
+
+Run from the repository root with `python -m benchmarks.stack_benchmark`.
+"""
+import time
+from typing import Callable
+from ds import Stack
+
+OPS: int = 1_000_000 # The number of pushes, and then pops, per run
+DEPTH: int = 64 # The depth the stack is filled to and drained from in the repeated push/pop pattern
+BATCH: int = 64 # The batch size for `push_many` and `pop_many`
+REPEATS: int = 5 # The number of runs, of which the fastest is reported
+
+def _best(run: Callable[[], None]) -> float:
+    """Return the fastest elapsed time in seconds of several runs."""
+    best: float = float("inf")
+
+    for _ in range(REPEATS):
+        start: float = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    # rof
+
+    return best
+# fed
+
+def bench_list() -> float:
+    """Time filling and draining a list to a shallow depth with `append` and `pop`."""
+    def run() -> None:
+        stack: list = []
+        push = stack.append
+        pop = stack.pop
+
+        for _ in range(OPS // DEPTH):
+            for i in range(DEPTH):
+                push(i)
+            # rof
+
+            for _ in range(DEPTH):
+                pop()
+            # rof
+        # rof
+    # fed
+
+    return _best(run)
+# fed
+
+def bench_stack() -> float:
+    """Time filling and draining a `Stack` to a shallow depth with `push` and `pop`."""
+    def run() -> None:
+        stack: Stack[int] = Stack()
+        push = stack.push
+        pop = stack.pop
+
+        for _ in range(OPS // DEPTH):
+            for i in range(DEPTH):
+                push(i)
+            # rof
+
+            for _ in range(DEPTH):
+                pop()
+            # rof
+        # rof
+    # fed
+
+    return _best(run)
+# fed
+
+def bench_stack_batched() -> float:
+    """Time filling and draining a `Stack` to a shallow depth with `push_many` and `pop_many`."""
+    values = range(BATCH)
+
+    def run() -> None:
+        stack: Stack[int] = Stack()
+
+        for _ in range(OPS // BATCH):
+            stack.push_many(values)
+            stack.pop_many(BATCH)
+        # rof
+    # fed
+
+    return _best(run)
+# fed
+
+def main() -> None:
+    """Print the cost of each approach in nanoseconds per push and pop pair."""
+    results = [
+        ("list append/pop", bench_list()),
+        ("Stack push/pop", bench_stack()),
+        ("Stack push_many/pop_many", bench_stack_batched()),
+    ]
+
+    print(f"{OPS} push/pop pairs at depth {DEPTH}, best of {REPEATS}")
+
+    for name, elapsed in results:
+        print(f"{name:<26} {elapsed / OPS * 1e9:>8.1f} ns/pair")
+    # rof
+# fed
+
+if __name__ == "__main__":
+    main()
+# fi
@@ -1,6 +1,19 @@
 from .array import Array
 from .linked_list import LinkedList
+from .doubly_linked_list import DoublyLinkedList
+from .unrolled_linked_list import UnrolledLinkedList
 from .binary_search_tree import BinarySearchTree
+from .avl_tree import AVLTree
+from .compact_binary_search_tree import CompactBinarySearchTree
 from .stack import Stack
+from .monotonic_stack import MonotonicStack
 from .queue import Queue
+from .ring_buffer_queue import RingBufferQueue
+from .blocking_queue import BlockingQueue
+from .async_queue import AsyncQueue
+from .shared_ring_queue import SharedRingQueue
+from .monotonic_queue import MonotonicQueue
 from .hash_map import HashMap
+from .compact_hash_map import CompactHashMap
+from .lru_cache import LRUCache, memoize
+from .lfu_cache import LFUCache
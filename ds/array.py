@@ -1,26 +1,155 @@
-from typing import Generic, List, TypeVar
+from __future__ import annotations
+from typing import Generic, List, TypeVar, Iterable
+from array import array as TypedArray
 
 T = TypeVar("T")
 
 class Array(Generic[T]):
-    """A class that implements an array with automatic resizing."""
+    """A class that implements an array with automatic resizing.
+
+    By default elements are stored as boxed Python objects in a list. If a typecode (see the standard library `array` module, e.g. "q" for signed 64 bit integers or "d" for doubles) is given, elements are instead stored unboxed in a compact contiguous buffer which can be handed off without copying. `as_memoryview()` gives a zero-copy view on any Python version, while `memoryview(arr)` and other buffer protocol consumers need Python 3.12 or later, which is the first version to honour `__buffer__` on Python classes.
+    """
 
     class ArrayIndexError(IndexError):
         """Custom error class for array index out of bounds errors."""
 
         def __init__(self):
             """Instantiate the parent error class with a custom index out of bounds message."""
-            super.__init__("Array index out of bounds")
+            super().__init__("Array index out of bounds")
         # fed
     # ssalc
 
-    _array: List[T] # The underlying container for the array
-    _length: int # The length of the array
+    class View(Generic[T]):
+        """A class that implements a zero-copy window over a contiguous range of an array.
+
+        A view supports the same `get`, `set`, `search` and `length` methods as an array with indices relative to the start of the window, so algorithms written against an array can run over a subarray without it being copied. Writes through a view modify the underlying array. The window is fixed when the view is created, so a view should not be used after elements have been inserted into or deleted from the underlying array.
+        """
+
+        _base: Array[T] # The array the view is over
+        _start: int # The index in the base array of the first element of the view
+        _length: int # The number of elements in the view
+
+        def __init__(self, base: Array[T], start: int, stop: int):
+            """Initialise the view over the elements of the base array from the start index up to but excluding the stop index."""
+            self._base = base
+            self._start = start
+            self._length = stop - start
+        # fed
+
+        def _validate_index(self, index: int) -> None:
+            """Do nothing if the given index is within valid bounds for the view or raise an ArrayIndexError."""
+            if index < 0 or index >= self._length:
+                raise Array.ArrayIndexError
+            # fi
+        # fed
+
+        def get(self, index: int) -> T:
+            """Get an element from the view at the specified index or raise an ArrayIndexError if out of bounds.
+
+            Time complexity is O(1) since the index is offset into the underlying array.
+            """
+            self._validate_index(index)
+
+            return self._base._array[self._start + index]
+        # fed
+
+        def set(self, index: int, value: T) -> None:
+            """Set an element in the view (and the underlying array) at the specified index or raise an ArrayIndexError if out of bounds."""
+            self._validate_index(index)
+
+            self._base._array[self._start + index] = value
+        # fed
+
+        def search(self, target: T) -> int:
+            """Search the view for a target linearly and return the index of the first occurence relative to the view or -1 if not in the view.
 
-    def __init__(self, elements: List[T] = []):
-        """Initialise the internal container with the given elements and sets the initial length of the array."""
-        self._array = elements
-        self._length = len(elements)
+            Time complexity mirrors the time complexity of the `search` method of the array so O(n) worst and average case and O(1) best case.
+            """
+            for i in range(self._length):
+                if self._base._array[self._start + i] == target:
+                    return i
+                # fi
+            # rof
+
+            return -1
+        # fed
+
+        def view(self, start: int = 0, stop: int | None = None) -> Array.View[T]:
+            """Get a view over a range of this view, with start and stop relative to this view, or raise an ArrayIndexError if the range is out of bounds."""
+            stop = self._length if stop is None else stop
+
+            if start < 0 or start > stop or stop > self._length:
+                raise Array.ArrayIndexError
+            # fi
+
+            return Array.View(self._base, self._start + start, self._start + stop)
+        # fed
+
+        def length(self) -> int:
+            """Get the length of the view."""
+            return self._length
+        # fed
+    # ssalc
+
+    _MIN_CAPACITY: int = 4 # The smallest capacity the array will grow to from empty
+    _GROWTH_FACTOR: int = 2 # The factor by which the capacity is multiplied when the array is full
+
+    _array: List[T] | TypedArray # The underlying container for the array, its length is the capacity of the array
+    _length: int # The length of the array (the number of slots of the container in use)
+    _typecode: str | None # The typecode of the typed storage or None if elements are stored as Python objects
+    _reserved: int # The capacity reserved with `reserve`, which the container is never shrunk below
+
+    def __init__(self, elements: List[T] = [], typecode: str | None = None):
+        """Initialise the internal container with a copy of the given elements and sets the initial length of the array.
+
+        If a typecode is given the elements are copied into a typed contiguous buffer.
+        """
+        self._array = list(elements) if typecode is None else TypedArray(typecode, elements)
+        self._length = len(self._array)
+        self._typecode = typecode
+        self._reserved = 0
+    # fed
+
+    def _resize_storage(self, capacity: int) -> None:
+        """Grow or truncate the internal container to exactly the given capacity, filling new slots with None or zeroes for typed storage."""
+        current: int = len(self._array)
+
+        if capacity < current:
+            del self._array[capacity:]
+        elif self._typecode is None:
+            self._array.extend([None] * (capacity - current))
+        else:
+            self._array.frombytes(bytes((capacity - current) * self._array.itemsize))
+        # fi
+    # fed
+
+    def _ensure_capacity(self, required: int) -> None:
+        """Geometrically grow the internal container if it cannot hold the required number of elements.
+
+        Multiplying the capacity rather than growing it by a constant means n pushes trigger only O(log(n)) reallocations which copy O(n) elements in total, so the cost of growth is amortized O(1) per element.
+        """
+        capacity: int = len(self._array)
+
+        if required > capacity:
+            self._resize_storage(max(required, capacity * Array._GROWTH_FACTOR, Array._MIN_CAPACITY))
+        # fi
+    # fed
+
+    def _shrink_if_sparse(self) -> None:
+        """Halve the internal container if at most a quarter of it is in use.
+
+        Shrinking at a quarter rather than at half leaves slack after the shrink so alternating pushes and pops at the boundary cannot trigger a reallocation each time. Shrinking is only an optimization, so it is skipped while a memoryview of typed storage is held, which locks the buffer against resizing, rather than failing a deletion that has already happened.
+        """
+        capacity: int = len(self._array)
+        floor: int = max(Array._MIN_CAPACITY, self._reserved)
+
+        if capacity > floor and self._length <= capacity // 4:
+            try:
+                self._resize_storage(max(capacity // 2, floor))
+            except BufferError:
+                pass # a memoryview is holding the buffer, try again on a later deletion
+            # yrt
+        # fi
     # fed
 
     def _validate_less_than_eq_to_n(self, value: int) -> None:
@@ -42,16 +171,20 @@ class Array(Generic[T]):
     def get(self, index: int) -> T:
         """Get an element from the array at the specified index and return it or raise an ArrayIndexError if out of bounds.
 
-        Time complexity is O(1) since array memory is contiguous. So, the memory address is computed instantly using the base array address and index.
+        Time complexity is O(1) since array memory is contiguous. So, the memory address is computed instantly using the base array address and index. The bounds check is done inline rather than through `_validate_index` since this is the hottest path of every structure built on arrays.
         """
-        self._validate_index(index)
-            
+        if index < 0 or index >= self._length:
+            raise self.ArrayIndexError
+        # fi
+
         return self._array[index]
     # fed
 
     def set(self, index: int, value: T) -> None:
         """Set an element in the array with the specified value at the specified index or raise an ArrayIndexError if index is out of bounds."""
-        self._validate_index(index)
+        if index < 0 or index >= self._length:
+            raise self.ArrayIndexError
+        # fi
 
         self._array[index] = value
     # fed
@@ -73,37 +206,93 @@ class Array(Generic[T]):
     def delete(self, index: int) -> T:
         """Delete an element from the array, resize it, and return the deleted element or raise an ArrayIndexError if index is out of bounds.
 
-        Time complexity is O(n) in the worst case as the target deletion index would be 0, so we would have to shift down n-1 elements. In the average case the deletion index would be around the middle so we would have to shift about n/2 elements so O(n) overall dropping the constant. And in the best case, O(1) as we would delete the last element so no elements would have to be shifted.
+        Time complexity is O(n) in the worst case as the target deletion index would be 0, so we would have to shift down n-1 elements. In the average case the deletion index would be around the middle so we would have to shift about n/2 elements so O(n) overall dropping the constant. And in the best case, O(1) as we would delete the last element so no elements would have to be shifted. The shift is done as one slice assignment so it is a single C-level memory move rather than n Python-level calls, and the container is halved once it is a quarter full so the shrink cost is amortized O(1).
         """
         self._validate_index(index)
 
         deleted: T = self._array[index]
 
-        for i in range(index, self._length - 1):
-            self.set(i, self.get(i + 1))
-        # rof
+        # shift the elements after the index down one slot in a single block move
+        self._array[index:self._length - 1] = self._array[index + 1:self._length]
+        self._length -= 1
+
+        if self._typecode is None:
+            self._array[self._length] = None # release the reference held by the now unused slot
+        # fi
 
-        del self._array[self._length - 1]
+        self._shrink_if_sparse()
 
-        self._length -= 1
-        
         return deleted
     # fed
 
     def insert(self, index: int, value: T) -> None:
         """Insert the given element into the array at the given index, automatically resizing the array or raise an ArrayIndexError if the index is out of bounds.
 
-        Time complexity is O(n) in the worst case as the target insertion index would be 0, so we would have to shift up n-1 elements. In the average case the insertion index would be around the middle so we would have to shift about n/2 elements so O(n) overall dropping the constant. And in the best case, O(1) as we would insert the last element so no elements would have to be shifted.
+        Time complexity is O(n) in the worst case as the target insertion index would be 0, so we would have to shift up n-1 elements. In the average case the insertion index would be around the middle so we would have to shift about n/2 elements so O(n) overall dropping the constant. And in the best case, amortized O(1) as we would insert the last element so no elements would have to be shifted and the container only occasionally has to grow. The shift is done as one slice assignment so it is a single C-level memory move rather than n Python-level calls.
         """
         self._validate_less_than_eq_to_n(index)
-        self._array += [None]
+        self._ensure_capacity(self._length + 1)
+
+        # store the value in the spare slot at the end first, so a value that typed storage rejects raises before any element moves
+        self._array[self._length] = value
+        value = self._array[self._length]
+
+        # shift the elements from the index up one slot in a single block move
+        self._array[index + 1:self._length + 1] = self._array[index:self._length]
+        self._array[index] = value
         self._length += 1
+    # fed
 
-        for i in range(index, self._length - 2):
-            self.set(i + 1, self.get(i))
-        # rof
+    def _to_storage(self, values: Iterable[T]) -> List[T] | TypedArray:
+        """Materialise the given values into a container of the same kind as the internal container."""
+        return list(values) if self._typecode is None else TypedArray(self._typecode, values)
+    # fed
+
+    def insert_many(self, index: int, values: Iterable[T]) -> None:
+        """Insert the given values into the array in order starting at the given index or raise an ArrayIndexError if the index is out of bounds.
+
+        Time complexity is O(n + k) where k is the number of values inserted. The elements after the index are shifted up by k slots in a single block move and the container grows at most once, rather than shifting n elements k times as repeated calls to `insert` would.
+        """
+        self._validate_less_than_eq_to_n(index)
 
-        self.set(index, value)
+        # materialise the values into storage of the same kind first, so a value that typed storage rejects raises before any element moves
+        block: List[T] | TypedArray = self._to_storage(values)
+        count: int = len(block)
+
+        self._ensure_capacity(self._length + count)
+
+        self._array[index + count:self._length + count] = self._array[index:self._length]
+        self._array[index:index + count] = block
+        self._length += count
+    # fed
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Insert the given values in order at the end of the array.
+
+        Time complexity is amortized O(k) where k is the number of values since it is the best case for the `insert_many` method.
+        """
+        self.insert_many(self._length, values)
+    # fed
+
+    def delete_range(self, start: int, stop: int) -> None:
+        """Delete the elements from the start index up to but excluding the stop index or raise an ArrayIndexError if the range is out of bounds.
+
+        Time complexity is O(n) since the elements after the range are shifted down in a single block move, rather than shifting them once per deleted element as repeated calls to `delete` would.
+        """
+        if start < 0 or start > stop or stop > self._length:
+            raise self.ArrayIndexError
+        # fi
+
+        count: int = stop - start
+
+        self._array[start:self._length - count] = self._array[stop:self._length]
+        self._length -= count
+
+        if self._typecode is None:
+            self._array[self._length:self._length + count] = [None] * count # release the references held by the now unused slots
+        # fi
+
+        self._shrink_if_sparse()
     # fed
 
     def unshift(self, value: T) -> None:
@@ -116,10 +305,15 @@ class Array(Generic[T]):
 
     def push(self, value: T) -> None:
         """Insert an array element at the end of the array.
-        
-        Time complexity is O(1) since it is the best case for the `insert` method.
+
+        Time complexity is amortized O(1) since it is the best case for the `insert` method. Nothing has to be shifted or validated at the end so the element is written straight into the next free slot, and the container is only grown when it is full.
         """
-        self.insert(self._length, value)
+        if self._length == len(self._array):
+            self._ensure_capacity(self._length + 1)
+        # fi
+
+        self._array[self._length] = value
+        self._length += 1
     # fed
 
     def shift(self) -> T:
@@ -131,15 +325,91 @@ class Array(Generic[T]):
     # fed
 
     def pop(self) -> T:
-        """Delete the last element from the array and return it.
+        """Delete the last element from the array and return it or raise an ArrayIndexError if the array is empty.
 
-        Time complexity is O(1) since it is the best case for `delete` method.
+        Time complexity is amortized O(1) since it is the best case for the `delete` method. Nothing has to be shifted at the end so the element is read straight out of the last used slot, and the container is only shrunk when it is a quarter full.
         """
-        return self.delete(self._length - 1)
+        if self._length == 0:
+            raise self.ArrayIndexError
+        # fi
+
+        self._length -= 1
+        popped: T = self._array[self._length]
+
+        if self._typecode is None:
+            self._array[self._length] = None # release the reference held by the now unused slot
+        # fi
+
+        capacity: int = len(self._array)
+
+        if self._length <= capacity // 4 and capacity > self._reserved:
+            self._shrink_if_sparse()
+        # fi
+
+        return popped
+    # fed
+
+    def view(self, start: int = 0, stop: int | None = None) -> Array.View[T]:
+        """Get a zero-copy view over the elements from the start index up to but excluding the stop index (the end of the array by default) or raise an ArrayIndexError if the range is out of bounds.
+
+        Time complexity is O(1) since no elements are copied.
+        """
+        stop = self._length if stop is None else stop
+
+        if start < 0 or start > stop or stop > self._length:
+            raise self.ArrayIndexError
+        # fi
+
+        return self.View(self, start, stop)
     # fed
 
     def length(self) -> int:
         """Get the length of the array."""
         return self._length
     # fed
+
+    def capacity(self) -> int:
+        """Get the number of elements the array can hold before it has to grow its internal container."""
+        return len(self._array)
+    # fed
+
+    def reserve(self, capacity: int) -> None:
+        """Grow the internal container so it can hold at least the given number of elements without reallocating.
+
+        Reserving up front when the final size is known avoids the intermediate reallocations of geometric growth. Deletions never shrink the container below the reserved capacity, so an array repeatedly filled and drained up to it never reallocates. Does nothing if the array can already hold that many elements.
+        """
+        self._reserved = max(self._reserved, capacity)
+
+        if capacity > len(self._array):
+            self._resize_storage(capacity)
+        # fi
+    # fed
+
+    def shrink_to_fit(self) -> None:
+        """Release any unused capacity, including reserved capacity, so the internal container holds exactly the elements of the array."""
+        self._reserved = 0
+        self._resize_storage(self._length)
+    # fed
+
+    def typecode(self) -> str | None:
+        """Get the typecode of the typed storage or None if the array stores Python objects."""
+        return self._typecode
+    # fed
+
+    def as_memoryview(self) -> memoryview:
+        """Get a zero-copy memoryview over the elements of a typed array or raise a TypeError if the array is untyped.
+
+        Time complexity is O(1) since the view shares the underlying buffer rather than copying it. The array must not be resized while the view is held.
+        """
+        if self._typecode is None:
+            raise TypeError("Only arrays with typed storage expose a buffer")
+        # fi
+
+        return memoryview(self._array)[:self._length]
+    # fed
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Expose the typed storage through the buffer protocol so `memoryview(arr)` and buffer consumers work without copying, which requires Python 3.12 or later."""
+        return self.as_memoryview()
+    # fed
  # ssalc
@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Callable
+import asyncio
+from .array import Array
+from .queue import Queue
+from .blocking_queue import BlockingQueue
+
+T = TypeVar("T")
+
+class AsyncQueue(Generic[T]):
+    """A class that implements a bounded queue for asyncio tasks whose operations wait for space or elements.
+
+    This is the asyncio counterpart of `BlockingQueue` with the same semantics for bounds, timeouts, batch draining with `get_many` and closing, except that waiting suspends the task instead of blocking the thread. It must only be used from tasks of a single event loop.
+    """
+
+    QueueFullError = BlockingQueue.QueueFullError
+    QueueEmptyError = BlockingQueue.QueueEmptyError
+    QueueClosedError = BlockingQueue.QueueClosedError
+
+    _queue: Queue[T] # The underlying container for the queue
+    _maxsize: int | None # The maximum number of elements in the queue or None if unbounded
+    _not_full: asyncio.Condition # The condition producers wait on for space in the queue
+    _not_empty: asyncio.Condition # The condition consumers wait on for elements in the queue
+    _closed: bool # Whether the queue has been closed
+
+    def __init__(self, maxsize: int | None = None):
+        """Initialise an empty open queue holding at most the given number of elements or raise a ValueError if the maximum size is not positive."""
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("Maximum size must be at least 1")
+        # fi
+
+        lock: asyncio.Lock = asyncio.Lock()
+
+        self._queue = Queue(engine=Queue.RING_BUFFER)
+        self._maxsize = maxsize
+        self._not_full = asyncio.Condition(lock)
+        self._not_empty = asyncio.Condition(lock)
+        self._closed = False
+    # fed
+
+    def _is_full(self) -> bool:
+        """Return a flag indicating whether the queue is at its maximum size."""
+        return self._maxsize is not None and self._queue.length() >= self._maxsize
+    # fed
+
+    async def _wait(self, condition: asyncio.Condition, ready: Callable[[], bool], timeout: float | None) -> bool:
+        """Wait on a condition, whose lock must be held, until ready or the timeout expires and return a flag indicating whether it became ready."""
+        try:
+            await asyncio.wait_for(condition.wait_for(ready), timeout)
+        except asyncio.TimeoutError:
+            return False
+        # yrt
+
+        return True
+    # fed
+
+    async def put(self, value: T, timeout: float | None = None) -> None:
+        """Add an element to the back of the queue, waiting up to the timeout (or indefinitely if None) for space.
+
+        Raises a QueueFullError if the timeout expires and a QueueClosedError if the queue is or becomes closed.
+        """
+        async with self._not_full:
+            if not await self._wait(self._not_full, lambda: self._closed or not self._is_full(), timeout):
+                raise self.QueueFullError
+            # fi
+
+            if self._closed:
+                raise self.QueueClosedError
+            # fi
+
+            self._queue.enqueue(value)
+            self._not_empty.notify()
+        # htiw
+    # fed
+
+    async def get(self, timeout: float | None = None) -> T:
+        """Remove and return the element at the front of the queue, waiting up to the timeout (or indefinitely if None) for one.
+
+        Raises a QueueEmptyError if the timeout expires and a QueueClosedError if the queue is closed and drained.
+        """
+        async with self._not_empty:
+            if not await self._wait(self._not_empty, lambda: self._closed or self._queue.length() > 0, timeout):
+                raise self.QueueEmptyError
+            # fi
+
+            if self._queue.length() == 0:
+                raise self.QueueClosedError
+            # fi
+
+            value: T = self._queue.dequeue()
+            self._not_full.notify()
+
+            return value
+        # htiw
+    # fed
+
+    async def get_many(self, max_n: int, timeout: float | None = None) -> Array[T]:
+        """Remove and return up to the given number of elements from the front of the queue at once, waiting up to the timeout (or indefinitely if None) for at least one.
+
+        Raises a ValueError if the number is less than 1, a QueueEmptyError if the timeout expires and a QueueClosedError if the queue is closed and drained.
+        """
+        if max_n < 1:
+            raise ValueError("Number of elements must be at least 1")
+        # fi
+
+        async with self._not_empty:
+            if not await self._wait(self._not_empty, lambda: self._closed or self._queue.length() > 0, timeout):
+                raise self.QueueEmptyError
+            # fi
+
+            if self._closed and self._queue.length() == 0:
+                raise self.QueueClosedError
+            # fi
+
+            count: int = min(max_n, self._queue.length())
+
+            values: Array[T] = Array()
+
+            values.reserve(count)
+
+            for i in range(count):
+                values.push(self._queue.dequeue())
+            # rof
+
+            self._not_full.notify(count)
+
+            return values
+        # htiw
+    # fed
+
+    async def close(self) -> None:
+        """Close the queue and wake every waiting producer and consumer."""
+        async with self._not_full:
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+        # htiw
+    # fed
+
+    def is_closed(self) -> bool:
+        """Return a flag indicating whether the queue has been closed."""
+        return self._closed
+    # fed
+
+    def length(self) -> int:
+        """Get the number of elements in the queue."""
+        return self._queue.length()
+    # fed
+# ssalc
@@ -0,0 +1,137 @@
+from __future__ import annotations
+from typing import TypeVar, List, Any
+from .binary_search_tree import BinarySearchTree
+
+T = TypeVar("T")
+
+class AVLTree(BinarySearchTree[T]):
+    """A class that implements a self-balancing binary search tree with AVL rotations.
+
+    Every node stores the height of its subtree as well as its size, and the balance factor of a node is the height of its left subtree minus that of its right. After an insert or delete, the nodes on the path walked down from the root are revisited from the bottom back up, their sizes and heights are refreshed and any node whose balance factor has reached 2 or -2 is fixed with one or two rotations, which only relink a constant number of nodes. This keeps the balance factor of every node between -1 and 1, which bounds the height h of a tree of n nodes below about 1.44 log(n), so insert, delete and search are O(log(n)) in the worst case, including for sorted input which degenerates the unbalanced tree into a linked list.
+
+    The API matches `BinarySearchTree` so the two are interchangeable.
+    """
+
+    class Node(BinarySearchTree.Node):
+        """Class that implements a node in the AVL tree."""
+
+        height: int # The height of the subtree rooted at the node, 1 for a leaf
+
+        def __init__(self, value: T, data: Any = None):
+            """Initialise the node with the given value and data, null leaf nodes and the height of a leaf."""
+            super().__init__(value, data)
+            self.height = 1
+        # fed
+    # ssalc
+
+    def __init__(self, balance: str | None = BinarySearchTree.AVL, storage: str = BinarySearchTree.NODES):
+        """Initialise an empty AVL tree or raise a ValueError if the balance is not `BinarySearchTree.AVL` or the storage is not `BinarySearchTree.NODES`."""
+        if balance != BinarySearchTree.AVL:
+            raise ValueError(f"Unknown binary search tree balance: {balance}")
+        # fi
+
+        if storage != BinarySearchTree.NODES:
+            raise ValueError(f"Unknown binary search tree storage: {storage}")
+        # fi
+
+        self.root = None
+    # fed
+
+    @staticmethod
+    def _height(node: AVLTree.Node | None) -> int:
+        """Get the height of the subtree rooted at the given node, which is 0 for an empty leaf node."""
+        return node.height if node is not None else 0
+    # fed
+
+    def _update(self, node: AVLTree.Node) -> None:
+        """Recompute the size and height of a node from those of its children."""
+        super()._update(node)
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+    # fed
+
+    def _balance_factor(self, node: AVLTree.Node) -> int:
+        """Get the height of the left subtree of a node minus the height of its right subtree."""
+        return self._height(node.left) - self._height(node.right)
+    # fed
+
+    def _rotate_left(self, node: AVLTree.Node) -> AVLTree.Node:
+        """Rotate a node down to the left so its right child takes its place, and return that child as the new root of the subtree."""
+        pivot: AVLTree.Node = node.right
+
+        node.right = pivot.left
+        pivot.left = node
+
+        self._update(node)
+        self._update(pivot)
+
+        return pivot
+    # fed
+
+    def _rotate_right(self, node: AVLTree.Node) -> AVLTree.Node:
+        """Rotate a node down to the right so its left child takes its place, and return that child as the new root of the subtree."""
+        pivot: AVLTree.Node = node.left
+
+        node.left = pivot.right
+        pivot.right = node
+
+        self._update(node)
+        self._update(pivot)
+
+        return pivot
+    # fed
+
+    def _rebalance(self, node: AVLTree.Node | None) -> AVLTree.Node | None:
+        """Refresh the size and height of a node whose subtree has changed and rotate it if it has become unbalanced, returning the new root of the subtree.
+
+        A left-heavy node is rotated right, after first rotating its left child left if that child is right-heavy (the left-right case), and a right-heavy node mirrors this. Time complexity is O(1).
+        """
+        if node is None:
+            return None
+        # fi
+
+        self._update(node)
+
+        balance: int = self._balance_factor(node)
+
+        if balance > 1:
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)
+            # fi
+
+            return self._rotate_right(node)
+        # fi
+
+        if balance < -1:
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)
+            # fi
+
+            return self._rotate_left(node)
+        # fi
+
+        return node
+    # fed
+
+    def _retrace(self, path: List[AVLTree.Node]) -> None:
+        """Rebalance each node on the path from the bottom back up to the root, linking the new root of each rotated subtree into its parent.
+
+        Time complexity is O(h), which is O(log(n)), with a constant amount of work per node.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node: AVLTree.Node = path[i]
+            subtree: AVLTree.Node = self._rebalance(node)
+
+            if subtree is not node:
+                self._replace_child(path[i - 1] if i > 0 else None, node, subtree)
+            # fi
+        # rof
+    # fed
+
+    def height(self) -> int:
+        """Get the height of the AVL tree, the number of nodes on its longest path from the root down, which is 0 for an empty tree.
+
+        Time complexity is O(1) since the root stores the height of the whole tree.
+        """
+        return self._height(self.root)
+    # fed
+# ssalc
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, List, Callable, Iterator, Iterable, Tuple, Any
+from operator import attrgetter
+from .array import Array
 
 T = TypeVar("T")
 
@@ -7,89 +9,200 @@ class BinarySearchTree(Generic[T]):
     """A class that implements a binary search tree.
 
     Let h be the height of the tree throughout. The approximate value of h thus depends of if the tree is balanced or not. If the tree is balanced, left and right subtrees for any node have roughly the same amount of nodes. Thus, level 0 (root) would have 1 node, level 1 would have about 2, level 2 about 4 and so on until we reach level h giving us about 2^h nodes. If n is the number of nodes then n ~= 2^0 + 2^1 + 2^2 + ... + 2^h = 2^(h+1) - 1. Performing some rough algebra, this would give us h ~= log(n) in the case that it is balanced. If the tree is unbalanced then let us assume the worst case where the tree looks like a linked list of nodes. This would mean that h = n.
+
+    This class never rebalances, so inserting values in sorted order (timestamps, increasing IDs) builds exactly that worst case. Passing `BinarySearchTree.AVL` as the balance instead constructs an `AVLTree` which rebalances on every insert and delete, keeping h below 1.44 log(n) whatever the insertion order. Passing `BinarySearchTree.COMPACT` as the storage constructs a `CompactBinarySearchTree` which has the same API but keeps its nodes in parallel typed arrays rather than as objects.
+
+    Every node also stores the size of its subtree, which is kept up to date along the path of each insert and delete. Knowing how many values lie to the left of each node answers order statistics (the k-th smallest value, the rank of a value and the number of values in a range) in O(h) by walking one path, rather than in O(n) by traversing the tree.
+
+    Each node can also carry data alongside its value, with the value acting as the ordering key, so the tree doubles as an ordered map: `put` and `get` store and look up data by value, and `floor`, `ceiling`, `min`, `max`, `range` and in-order iteration answer ordered queries that a hash map cannot.
+
+    Code outside the tree that walks its nodes, such as the traversals in `algo.trees`, should start from `root`, compare with `_NIL` for an empty leaf node and read nodes through the `_value_of`, `_data_of`, `_left_of` and `_right_of` hooks, which `CompactBinarySearchTree` overrides for its array storage. The methods of this class read node attributes directly, since a hook call per field would make every walk several times slower.
     """
 
     class BinarySearchTreeViolationError(ValueError):
         """Custom error class for a binary search tree violation (duplicate element)."""
 
         def __init__(self):
-            super.__init__("Binary search tree violation, attempted insert of duplicate element")
+            super().__init__("Binary search tree violation, attempted insert of duplicate element")
+        # fed
+    # ssalc
+
+    class BinarySearchTreeIndexError(IndexError):
+        """Custom error class for binary search tree index out of bounds errors."""
+
+        def __init__(self):
+            """Instantiate the parent error class with a custom out of bounds message."""
+            super().__init__("Binary search tree index out of bounds")
         # fed
     # ssalc
 
     class Node:
         """Class that implements a node in the binary search tree."""
 
-        value: T # The value of the node
+        value: T # The value of the node, which orders it in the tree
+        data: Any # The data associated with the value of the node
+        size: int # The number of nodes in the subtree rooted at the node, 1 for a leaf
         left: Node | None # The node left of the current in the tree
         right: Node | None # The node right of the current in the tree
 
-        def __init__(self, value: T):
-            """Initialise the node with the given value and null leaf nodes."""
+        def __init__(self, value: T, data: Any = None):
+            """Initialise the node with the given value and data and null leaf nodes."""
             self.value = value
+            self.data = data
+            self.size = 1
             self.left = None
             self.right = None
         # fed
     # ssalc
 
+    AVL: str = "avl" # Balancing by AVL rotations
+    NODES: str = "nodes" # Storage as linked node objects
+    COMPACT: str = "compact" # Storage as parallel typed arrays indexed by node
+
+    _NIL: Any = None # The reference standing for an empty leaf node
+
+    # attribute getters are C callables that are not bound as methods, so reading a field through a hook pushes no Python frame
+    _value_of: Callable[[BinarySearchTree.Node], T] = attrgetter("value") # Get the value of a node
+    _data_of: Callable[[BinarySearchTree.Node], Any] = attrgetter("data") # Get the data of a node
+    _left_of: Callable[[BinarySearchTree.Node], BinarySearchTree.Node | None] = attrgetter("left") # Get the left child of a node
+    _right_of: Callable[[BinarySearchTree.Node], BinarySearchTree.Node | None] = attrgetter("right") # Get the right child of a node
+
     root: BinarySearchTree.Node | None # The root node of the binary search tree
 
-    def __init__(self):
-        """Initialise an empty binary search tree."""
+    def __new__(cls, balance: str | None = None, storage: str = NODES, *args, **kwargs):
+        """Construct a `CompactBinarySearchTree` instead if compact storage is selected, or an `AVLTree` if AVL balancing is selected."""
+        if cls is BinarySearchTree and storage == BinarySearchTree.COMPACT:
+            from .compact_binary_search_tree import CompactBinarySearchTree
+
+            return super().__new__(CompactBinarySearchTree)
+        # fi
+
+        if cls is BinarySearchTree and balance == BinarySearchTree.AVL:
+            from .avl_tree import AVLTree
+
+            return super().__new__(AVLTree)
+        # fi
+
+        return super().__new__(cls)
+    # fed
+
+    def __init__(self, balance: str | None = None, storage: str = NODES):
+        """Initialise an empty binary search tree or raise a ValueError if the balance or storage is unknown."""
+        if balance is not None:
+            raise ValueError(f"Unknown binary search tree balance: {balance}")
+        # fi
+
+        if storage != BinarySearchTree.NODES:
+            raise ValueError(f"Unknown binary search tree storage: {storage}")
+        # fi
+
         self.root = None
     # fed
 
-    def _insert_rec(self, node: Node | None, value: T) -> Node:
-        """Recursively traverse a node's subtree to insert a node at the correct position.
+    def _descend(self, value: T) -> List[BinarySearchTree.Node]:
+        """Walk down from the root towards the given value and return the path of nodes visited.
 
-        In the base case, the given node will be an empty leaf node so the algorithm will have found the correct position to insert a node and return a new node. In the recursive case, we either traverse into the left subtree or right subtree by comparing the given value to insert with the value of the node. We return the given node in order to update it with any modifications from recursion in the previous method call.
+        The last node of the path holds the value if it is present, otherwise it is the node the value would be attached under. The path is empty if the tree is empty. Walking with a loop and keeping the path in a list means the depth of the tree is bounded by memory rather than the recursion limit, and no Python frame is pushed per level.
+        """
+        path: List[BinarySearchTree.Node] = []
+        node: BinarySearchTree.Node | None = self.root
+
+        while node is not None:
+            path.append(node)
+
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                node = node.right
+            else:
+                break
+            # fi
+        # elihw
 
-        Arguments
-        ---------
-        node
-            A node in the binary search tree or None representing an empty leaf node.
+        return path
+    # fed
+
+    def _replace_child(self, parent: BinarySearchTree.Node | None, child: BinarySearchTree.Node, replacement: BinarySearchTree.Node | None) -> None:
+        """Relink the given parent, or the root if the parent is None, to point at the replacement instead of the given child."""
+        if parent is None:
+            self.root = replacement
+        elif parent.left is child:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        # fi
+    # fed
 
-        value
-            The value to give to a new node being inserted into the tree.
+    @staticmethod
+    def _size(node: BinarySearchTree.Node | None) -> int:
+        """Get the number of nodes in the subtree rooted at the given node, which is 0 for an empty leaf node."""
+        return node.size if node is not None else 0
+    # fed
 
-        Raises
-        ------
-        BinarySearchTree.BinarySearchTreeViolationError
-            If a value trying to be inserted into the tree is already present.
+    def _update(self, node: BinarySearchTree.Node) -> None:
+        """Recompute the information a node keeps about its subtree from that of its children.
 
-        Returns
-        -------
-        The given node or a new node.
+        This is the hook through which subclasses keep further per-node information about subtrees up to date.
         """
-        if node is None:
-            # base recursion case - null leaf node found so return a new node to insert in the previous method call
-            return self.Node(value)
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+    # fed
+
+    def _retrace(self, path: List[BinarySearchTree.Node]) -> None:
+        """Visit the nodes whose subtrees changed after an insert or delete, from the bottom of the path back up to the root, and update each of them."""
+        for i in range(len(path) - 1, -1, -1):
+            self._update(path[i])
+        # rof
+    # fed
+
+    def _attach(self, path: List[BinarySearchTree.Node], value: T, data: Any) -> None:
+        """Attach a new node under the last node of the path returned by `_descend` for a value that is not in the tree, then retrace the path."""
+        if not path:
+            self.root = self.Node(value, data)
+
+            return
         # fi
 
-        if value < node.value:
-            # recursive case - if smaller, recurse into left subtree and update node.left (it will then point to newly inserted node or updated subtree)
-            node.left = self._insert_rec(node.left, value)
-        elif value > node.value:
-            # recusrive case - if bigger, recursive into right subtree and update node.right (it will then point to newly inserted node or updated subtree)
-            node.right = self._insert_rec(node.right, value)
+        parent: BinarySearchTree.Node = path[-1]
+
+        if value < parent.value:
+            parent.left = self.Node(value, data)
         else:
-            # else values are the same but no duplicates are allowed
+            parent.right = self.Node(value, data)
+        # fi
+
+        self._retrace(path)
+    # fed
+
+    def insert(self, value: T, data: Any = None) -> None:
+        """Insert a value, with any data associated with it, into the binary search tree or raise a BinarySearchTreeViolationError if the value is already present.
+
+        Time complexity is O(h) since we walk down the levels of the tree to find the correct position to insert the new value. The walk is a loop rather than recursion, so a degenerate tree of any depth is handled with constant call stack, and space complexity is O(h) for the path kept for `_retrace`.
+        """
+        path: List[BinarySearchTree.Node] = self._descend(value)
+
+        if path and path[-1].value == value:
+            # the values are the same but no duplicates are allowed
             raise self.BinarySearchTreeViolationError
         # fi
 
-        # return given node so its subtree can be re-registered with any modifications in the previous method call
-        return node
+        self._attach(path, value, data)
     # fed
 
-    def insert(self, value: T) -> None:
-        """Insert a value into the binary search tree or raise a BinarySearchTreeViolationError if the value is already present.
+    def put(self, value: T, data: Any) -> None:
+        """Associate data with a value, inserting the value into the binary search tree if it is not already present.
 
-        Time complexity is O(h) since we are relying on recursively iterating down the levels of the tree to find the correct position to insert the new value. Space complexity is also O(h) since each recusrive call adds an extra frame onto the call stack.
+        Time complexity mirrors the time complexity of the `insert` method so O(h).
         """
-        self.root = self._insert_rec(self.root, value)
+        path: List[BinarySearchTree.Node] = self._descend(value)
+
+        if path and path[-1].value == value:
+            path[-1].data = data
+        else:
+            self._attach(path, value, data)
+        # fi
     # fed
 
-    def _find_min(self, node: Node) -> T:
+    def _find_min(self, node: Node) -> Node:
         """Find the node with the smallest value in the subtree of the given node and return it."""
         while node.left is not None:
             node = node.left
@@ -98,97 +211,394 @@ class BinarySearchTree(Generic[T]):
         return node
     # fed
 
-    def _delete_rec(self, node: Node | None, value: T) -> Node | None:
-        """Recursively traverse a node's subtree to find and delete the given value if it exists.
-        
-        In the first base case, the given node will be an empty leaf node meaning that the algorithm won't have found the value so we return the same value for the node to preserve it. In the second case, the value/node is found and it has no children so we return None to remove the node. In the third base case the found node only has one child so we return that child to substitute the given node with it. In the first recursive case, the value is smaller than the given node's value so we recurse into the left subtree of the node to try and find the value there. The second recursive case mirros the first, so the value would be bigger and we would recurse into the right subtree of the give node to try and find the value there.
+    def delete(self, value: T) -> None:
+        """Delete a value from the binary search tree if it is present.
+
+        If the node holding the value has two children, the value of its in-order successor (the smallest value of its right subtree) is moved into it and the successor node is removed instead. Either way the node removed has at most one child, so it is removed by linking its parent straight to that child.
+
+        Time complexity is O(h) since we walk down the levels of the tree to find the value and its successor. The walk is a loop rather than recursion, so a degenerate tree of any depth is handled with constant call stack, and space complexity is O(h) for the path kept for `_retrace`.
+        """
+        path: List[BinarySearchTree.Node] = self._descend(value)
+
+        if not path or path[-1].value != value:
+            return
+        # fi
+
+        node: BinarySearchTree.Node = path[-1]
+
+        if node.left is not None and node.right is not None:
+            # extend the path down to the in-order successor and move its value into the node
+            successor: BinarySearchTree.Node = node.right
+            path.append(successor)
+
+            while successor.left is not None:
+                successor = successor.left
+                path.append(successor)
+            # elihw
 
-        Arguments
-        ---------
-        node
-            A node in the binary search tree or None representing an empty leaf node.
+            node.value = successor.value
+            node.data = successor.data
+        # fi
+
+        removed: BinarySearchTree.Node = path.pop()
+
+        self._replace_child(path[-1] if path else None, removed, removed.left if removed.left is not None else removed.right)
+        self._retrace(path)
+    # fed
 
-        value
-            The value to delete from the binary search tree.
+    def _find(self, value: T) -> BinarySearchTree.Node | None:
+        """Walk down from the root to the node holding the given value and return it or None if the value is not present.
 
-        Returns
-        -------
-        A node containing modifications.
+        The walk is a loop rather than recursion so space complexity is O(1).
         """
+        node: BinarySearchTree.Node | None = self.root
+
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                node = node.right
+            else:
+                return node
+            # fi
+        # elihw
+
+        return None
+    # fed
+
+    def search(self, value: T) -> bool:
+        """Search for a value in the binary tree and return a flag indicating whether it is present.
+
+        Time complexity is O(h) since we walk down the levels of the tree to find the target value, and space complexity is O(1).
+        """
+        return self._find(value) is not None
+    # fed
+
+    def get(self, value: T, default_data: Any = None) -> Any:
+        """Get the data associated with a value in the binary search tree or return the default if the value is not present.
+
+        Time complexity mirrors the time complexity of the `search` method so O(h).
+        """
+        node: BinarySearchTree.Node | None = self._find(value)
+
+        return node.data if node is not None else default_data
+    # fed
+
+    def floor(self, value: T) -> T | None:
+        """Get the largest value in the binary search tree that is less than or equal to the given value or None if there is none.
+
+        Time complexity is O(h) since we walk down one path, remembering the last value passed that was not too big.
+        """
+        best: T | None = None
+        node: BinarySearchTree.Node | None = self.root
+
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                best = node.value
+                node = node.right
+            else:
+                return node.value
+            # fi
+        # elihw
+
+        return best
+    # fed
+
+    def ceiling(self, value: T) -> T | None:
+        """Get the smallest value in the binary search tree that is greater than or equal to the given value or None if there is none.
+
+        Time complexity is O(h) since we walk down one path, remembering the last value passed that was not too small.
+        """
+        best: T | None = None
+        node: BinarySearchTree.Node | None = self.root
+
+        while node is not None:
+            if value < node.value:
+                best = node.value
+                node = node.left
+            elif value > node.value:
+                node = node.right
+            else:
+                return node.value
+            # fi
+        # elihw
+
+        return best
+    # fed
+
+    def min(self) -> T | None:
+        """Get the smallest value in the binary search tree or None if the tree is empty.
+
+        Time complexity is O(h) since we follow left children down from the root.
+        """
+        return self._find_min(self.root).value if self.root is not None else None
+    # fed
+
+    def max(self) -> T | None:
+        """Get the largest value in the binary search tree or None if the tree is empty.
+
+        Time complexity is O(h) since we follow right children down from the root.
+        """
+        node: BinarySearchTree.Node | None = self.root
+
         if node is None:
-            # base recursion case 1 - we have a reached a null leaf node without finding the given value so return None to preserve the node
             return None
         # fi
 
-        if value < node.value:
-            # recursive case 1 - if smaller, recurse into left subtree and update node.left (it will then point to an updated subtree with the value deleted)
-            node.left = self._delete_rec(node.left, value)
-        elif value > node.value:
-            # recursive case 2 - if bigger, recurse into right subtree and update node.right (it will then point to an updated subtree with the value deleted)
-            node.right = self._delete_rec(node.right, value)
-        else:
-            # base recursion case 2 - current node has no children, return None to delete the node by substituting it with an empty leaf node
-            if node.left is None and node.right is None:
-                return None
-            # fi
+        while node.right is not None:
+            node = node.right
+        # elihw
+
+        return node.value
+    # fed
+
+    def _in_order(self, lo: T | None = None, hi: T | None = None) -> Iterator[BinarySearchTree.Node]:
+        """Lazily yield the nodes of the binary search tree in order, only those with values from lo to hi inclusive if bounds are given.
 
-            # base recursion case 3.1 - current node only has a right child so return the right child to delete the node by substituting it with the right child
-            if node.left is None:
-                return node.right
+        The nodes whose left subtrees are being visited are kept on an explicit stack rather than the call stack, so a degenerate tree of any depth is handled without recursion. Subtrees that lie wholly outside the bounds are never entered: a node below lo is skipped together with its left subtree and the traversal stops at the first node above hi, so only O(h) nodes outside the bounds are visited. The tree must not be modified while the nodes are being yielded.
+        """
+        stack: List[BinarySearchTree.Node] = []
+        node: BinarySearchTree.Node | None = self.root
+
+        while stack or node is not None:
+            # go as far left as possible, stacking the nodes passed on the way, but skip left subtrees below the lower bound
+            while node is not None:
+                if lo is not None and node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+                # fi
+            # elihw
+
+            if not stack:
+                return # every remaining node was below the lower bound
             # fi
 
-            # base recursion case 3.2 - current node only has a left child so return the left child to delete the node by substituting it with the left child
-            if node.right is None:
-                return node.left
+            node = stack.pop()
+
+            if hi is not None and node.value > hi:
+                return
             # fi
-            
-            # recursive case 3 - current node has 2 children so find the in-order successor of the node (next smallest value) and replace the node's value with it then deleting the successor node
-            successor: Node = self._find_min(node.right) # find successor
-            node.value = successor.value # replace current node value with successor value
-            node.right = self._delete_rec(node.right, successor.value) # delete the successor
+
+            yield node
+            node = node.right
+        # elihw
+    # fed
+
+    def range(self, lo: T, hi: T) -> Iterator[T]:
+        """Lazily yield the values of the binary search tree from lo to hi inclusive in order.
+
+        Time complexity is O(h + k) where k is the number of values yielded, since only the nodes inside the range and those on the paths to its bounds are visited, rather than the O(n) of scanning every value.
+        """
+        for node in self._in_order(lo, hi):
+            yield node.value
+        # rof
+    # fed
+
+    def range_items(self, lo: T, hi: T) -> Iterator[Tuple[T, Any]]:
+        """Lazily yield each value of the binary search tree from lo to hi inclusive in order, together with its data.
+
+        Time complexity mirrors the time complexity of the `range` method so O(h + k).
+        """
+        for node in self._in_order(lo, hi):
+            yield node.value, node.data
+        # rof
+    # fed
+
+    def items(self) -> Iterator[Tuple[T, Any]]:
+        """Lazily yield each value of the binary search tree in order, together with its data.
+
+        Time complexity is O(n) to exhaust, with O(h) extra space for the traversal stack.
+        """
+        for node in self._in_order():
+            yield node.value, node.data
+        # rof
+    # fed
+
+    def for_each(self, callback: Callable[[T], None]) -> None:
+        """Traverse the binary search tree in order and run a callback for each value, passing the value.
+
+        Time complexity is O(n) since every node is visited once, and space complexity is O(h) for the traversal stack.
+        """
+        for node in self._in_order():
+            callback(node.value)
+        # rof
+    # fed
+
+    def _link_balanced(self, nodes: List[BinarySearchTree.Node], start: int, stop: int) -> BinarySearchTree.Node | None:
+        """Link the nodes from the start index up to but excluding the stop index of a list of nodes in order into a perfectly balanced subtree and return its root.
+
+        The middle node becomes the root and the nodes either side of it are linked into its left and right subtrees the same way, so the sizes of the two subtrees of every node differ by at most one. Each node is linked and updated once, so time complexity is O(n) with no comparisons, and the recursion only goes O(log(n)) deep since each call halves the range.
+        """
+        if start >= stop:
+            return None
         # fi
 
-        # return given node so its subtree can be re-registered with any modifications in the previous method call
+        mid: int = (start + stop) // 2
+        node: BinarySearchTree.Node = nodes[mid]
+
+        node.left = self._link_balanced(nodes, start, mid)
+        node.right = self._link_balanced(nodes, mid + 1, stop)
+        self._update(node)
+
         return node
     # fed
 
-    def delete(self, value: T) -> None:
-        """Delete a value from the binary search tree.
+    @classmethod
+    def from_sorted(cls, values: Array[T], data: Array[Any] | None = None, balance: str | None = None) -> BinarySearchTree[T]:
+        """Create a perfectly balanced binary search tree from an array of values in strictly increasing order, with the data at the same index of the data array if given.
+
+        Raises a BinarySearchTreeViolationError if a value is repeated and a ValueError if the values are otherwise out of order. Building the tree directly from sorted input takes O(n) time, one pass to check the order and one to link the nodes, rather than the O(n log(n)) of n inserts, and gives a tree of the minimum possible height however the values are ordered, whereas n inserts in sorted order give the maximum.
+        """
+        tree: BinarySearchTree[T] = cls(balance) if balance is not None else cls()
+        nodes: List[BinarySearchTree.Node] = []
+
+        for i in range(values.length()):
+            value: T = values.get(i)
+
+            if nodes and not nodes[-1].value < value:
+                if nodes[-1].value == value:
+                    raise cls.BinarySearchTreeViolationError
+                # fi
+
+                raise ValueError("Values must be in strictly increasing order")
+            # fi
+
+            nodes.append(tree.Node(value, data.get(i) if data is not None else None))
+        # rof
 
-        Time complexity is O(h) since we are relying on recursively iterating down the levels of the tree to find the correct position of the value to delete. Space complexity is also O(h) since each recursive call adds an extra frame onto the call stack.
+        tree.root = tree._link_balanced(nodes, 0, len(nodes))
+
+        return tree
+    # fed
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T], balance: str | None = None) -> BinarySearchTree[T]:
+        """Create a perfectly balanced binary search tree from values in any order or raise a BinarySearchTreeViolationError if a value is repeated.
+
+        The values are sorted and then bulk loaded with `from_sorted`, so time complexity is O(n log(n)) for the sort and O(n) for the build, with a tree of the minimum possible height.
         """
-        self.root = self._delete_rec(self.root, value)
-    # fed 
+        return cls.from_sorted(Array(sorted(values)), balance=balance)
+    # fed
+
+    def rebuild(self) -> None:
+        """Rebalance the binary search tree in place into a perfectly balanced tree holding the same values and data.
 
-    def _search_rec(self, node: Node | None, value: T) -> bool:
-        """Recursively traverse a node's subtree to search for a given value within it.
-        
-        In the first base case we reach a null leaf node so the target value won't have been found so we return False. In the second base case the target value equals the value of the current node so we return True. In the first recursive case the target value is less than the value of the given node so we recurse into its left subtree. The second recursive mirrors the first, so the target value would be greater than the value of the given node making us recurse into its right subtree.
+        The existing nodes are collected in order and relinked, so no node is allocated or compared and time complexity is O(n), with O(n) extra space for the list of nodes. This is useful after a run of inserts or deletes has skewed a tree that does not balance itself.
         """
-        if node is None:
-            # base recursion case 1 - we have reached a null leaf node so the value can't possible exist in the node's subtree; return False
-            return False
-        # fi
+        nodes: List[BinarySearchTree.Node] = list(self._in_order())
+
+        self.root = self._link_balanced(nodes, 0, len(nodes))
+    # fed
+
+    def height(self) -> int:
+        """Get the height of the binary search tree, the number of nodes on its longest path from the root down, which is 0 for an empty tree.
+
+        Time complexity is O(n) since every node is visited, one level at a time so that no recursion is needed even for a degenerate tree.
+        """
+        height: int = 0
+        level: List[BinarySearchTree.Node] = [self.root] if self.root is not None else []
+
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        # elihw
+
+        return height
+    # fed
+
+    def __iter__(self) -> Iterator[T]:
+        """Lazily yield each value of the binary search tree in order."""
+        for node in self._in_order():
+            yield node.value
+        # rof
+    # fed
+
+    def __contains__(self, value: T) -> bool:
+        """Return a flag indicating whether the value is present in the binary search tree."""
+        return self._find(value) is not None
+    # fed
 
-        if value < node.value:
-            # recursive case 1 - the target value is less than the given node's so recurse into the node's left subtree; return the result of subsequent recursion
-            return self._search_rec(node.left, value)
+    def select(self, k: int) -> T:
+        """Get the k-th smallest value in the binary search tree, counting from 0, or raise a BinarySearchTreeIndexError if k is out of bounds.
+
+        Time complexity is O(h) since the subtree sizes tell us at each node whether the k-th value is in the left subtree, is the node itself or is in the right subtree, so only one path is walked.
+        """
+        if k < 0 or k >= self._size(self.root):
+            raise self.BinarySearchTreeIndexError
         # fi
 
-        if value > node.value:
-            # recursive case 2 - the target value is greater than the given node's so recurse into the node's right subtree; return the result of subsequent recursion
-            return self._search_rec(node.right, value)
+        node: BinarySearchTree.Node = self.root
+
+        while True:
+            left: int = self._size(node.left)
+
+            if k < left:
+                node = node.left
+            elif k > left:
+                k -= left + 1 # skip the left subtree and the node itself
+                node = node.right
+            else:
+                return node.value
+            # fi
+        # elihw
+    # fed
+
+    def _count_below(self, value: T, inclusive: bool) -> int:
+        """Count the values in the binary search tree that are less than, or if inclusive less than or equal to, the given value.
+
+        Time complexity is O(h) since the whole left subtree of each node passed on the way right is counted at once from its size.
+        """
+        count: int = 0
+        node: BinarySearchTree.Node | None = self.root
+
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                count += self._size(node.left) + 1
+                node = node.right
+            else:
+                return count + self._size(node.left) + (1 if inclusive else 0)
+            # fi
+        # elihw
+
+        return count
+    # fed
+
+    def rank(self, value: T) -> int:
+        """Get the number of values in the binary search tree that are less than the given value, which is its index in sorted order if present.
+
+        Time complexity is O(h).
+        """
+        return self._count_below(value, False)
+    # fed
+
+    def count_range(self, lo: T, hi: T) -> int:
+        """Get the number of values in the binary search tree from lo to hi inclusive.
+
+        Time complexity is O(h) since it is the difference of two rank queries, however many values are in the range.
+        """
+        if hi < lo:
+            return 0
         # fi
 
-        # base recursion case 2 - the target value equals the value of the given node so it has been found; return True
-        return True
+        return self._count_below(hi, True) - self._count_below(lo, False)
     # fed
 
-    def search(self, value: T) -> bool:
-        """Search for a value in the binary tree and return a flag indicating whether it is present.
-        
-        Time complexity is O(h) since we are relying on recursively iterating down the levels of the tree to find the target value. Space complexity is also O(h) since each recursive call adds an extra frame onto the call stack.
+    def size(self) -> int:
+        """Get the number of values in the binary search tree.
+
+        Time complexity is O(1) since the root stores the size of the whole tree.
         """
-        return self._search_rec(self.root, value)
+        return self._size(self.root)
+    # fed
+
+    def __len__(self) -> int:
+        """Get the number of values in the binary search tree."""
+        return self._size(self.root)
     # fed
 # ssalc
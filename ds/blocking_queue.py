@@ -0,0 +1,164 @@
+from __future__ import annotations
+from typing import TypeVar, Generic
+import threading
+from .array import Array
+from .queue import Queue
+
+T = TypeVar("T")
+
+class BlockingQueue(Generic[T]):
+    """A class that implements a bounded, thread-safe queue whose operations wait for space or elements.
+
+    Elements are held in a ring buffer `Queue` guarded by a single lock, with one condition for waiting until the queue is not full and another for waiting until it is not empty, so producers only wake consumers and vice versa. `get_many` drains up to a batch of elements in one lock acquisition, which amortizes the locking and wake-up cost over the batch.
+
+    Closing the queue wakes every waiting thread. After it is closed, `put` fails immediately while `get` keeps returning the remaining elements and fails once the queue is drained, so consumers can finish the work already queued and then stop.
+    """
+
+    class QueueFullError(TimeoutError):
+        """Custom error class for a put that timed out waiting for space in the queue."""
+
+        def __init__(self):
+            """Instantiate the parent error class with a custom queue full message."""
+            super().__init__("Queue is full")
+        # fed
+    # ssalc
+
+    class QueueEmptyError(TimeoutError):
+        """Custom error class for a get that timed out waiting for an element in the queue."""
+
+        def __init__(self):
+            """Instantiate the parent error class with a custom queue empty message."""
+            super().__init__("Queue is empty")
+        # fed
+    # ssalc
+
+    class QueueClosedError(RuntimeError):
+        """Custom error class for a put to a closed queue or a get from a closed and drained queue."""
+
+        def __init__(self):
+            """Instantiate the parent error class with a custom queue closed message."""
+            super().__init__("Queue is closed")
+        # fed
+    # ssalc
+
+    _queue: Queue[T] # The underlying container for the queue
+    _maxsize: int | None # The maximum number of elements in the queue or None if unbounded
+    _lock: threading.Lock # The lock guarding the queue
+    _not_full: threading.Condition # The condition producers wait on for space in the queue
+    _not_empty: threading.Condition # The condition consumers wait on for elements in the queue
+    _closed: bool # Whether the queue has been closed
+
+    def __init__(self, maxsize: int | None = None):
+        """Initialise an empty open queue holding at most the given number of elements or raise a ValueError if the maximum size is not positive."""
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("Maximum size must be at least 1")
+        # fi
+
+        self._queue = Queue(engine=Queue.RING_BUFFER)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+        self._closed = False
+    # fed
+
+    def _is_full(self) -> bool:
+        """Return a flag indicating whether the queue is at its maximum size, the lock must be held."""
+        return self._maxsize is not None and self._queue.length() >= self._maxsize
+    # fed
+
+    def put(self, value: T, timeout: float | None = None) -> None:
+        """Add an element to the back of the queue, waiting up to the timeout (or indefinitely if None) for space.
+
+        Raises a QueueFullError if the timeout expires and a QueueClosedError if the queue is or becomes closed.
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: self._closed or not self._is_full(), timeout):
+                raise self.QueueFullError
+            # fi
+
+            if self._closed:
+                raise self.QueueClosedError
+            # fi
+
+            self._queue.enqueue(value)
+            self._not_empty.notify()
+        # htiw
+    # fed
+
+    def get(self, timeout: float | None = None) -> T:
+        """Remove and return the element at the front of the queue, waiting up to the timeout (or indefinitely if None) for one.
+
+        Raises a QueueEmptyError if the timeout expires and a QueueClosedError if the queue is closed and drained.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._closed or self._queue.length() > 0, timeout):
+                raise self.QueueEmptyError
+            # fi
+
+            if self._queue.length() == 0:
+                raise self.QueueClosedError
+            # fi
+
+            value: T = self._queue.dequeue()
+            self._not_full.notify()
+
+            return value
+        # htiw
+    # fed
+
+    def get_many(self, max_n: int, timeout: float | None = None) -> Array[T]:
+        """Remove and return up to the given number of elements from the front of the queue in one lock acquisition, waiting up to the timeout (or indefinitely if None) for at least one.
+
+        Raises a ValueError if the number is less than 1, a QueueEmptyError if the timeout expires and a QueueClosedError if the queue is closed and drained.
+        """
+        if max_n < 1:
+            raise ValueError("Number of elements must be at least 1")
+        # fi
+
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._closed or self._queue.length() > 0, timeout):
+                raise self.QueueEmptyError
+            # fi
+
+            if self._closed and self._queue.length() == 0:
+                raise self.QueueClosedError
+            # fi
+
+            count: int = min(max_n, self._queue.length())
+
+            values: Array[T] = Array()
+
+            values.reserve(count)
+
+            for i in range(count):
+                values.push(self._queue.dequeue())
+            # rof
+
+            self._not_full.notify(count)
+
+            return values
+        # htiw
+    # fed
+
+    def close(self) -> None:
+        """Close the queue and wake every waiting producer and consumer."""
+        with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+        # htiw
+    # fed
+
+    def is_closed(self) -> bool:
+        """Return a flag indicating whether the queue has been closed."""
+        return self._closed
+    # fed
+
+    def length(self) -> int:
+        """Get the number of elements in the queue."""
+        with self._lock:
+            return self._queue.length()
+        # htiw
+    # fed
+# ssalc
@@ -0,0 +1,256 @@
+from __future__ import annotations
+from typing import Generic, TypeVar, Callable
+from abc import ABC, abstractmethod
+import sys
+from .hash_map import HashMap
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+class Cache(ABC, Generic[K, V]):
+    """A base class for a size-bounded cache that maps keys to nodes of doubly linked lists through a hash map.
+
+    The cache can be bounded by its number of entries, by the total size in bytes of its values or by both. When inserting would exceed a bound, entries chosen by the eviction policy of the subclass are evicted until it no longer would. Hits, misses and evictions are counted.
+
+    Subclasses implement the eviction policy through the abstract `_attach`, `_detach`, `_touch` and `_victim` methods, which all run in O(1) so `get` and `put` run in O(1) on average.
+    """
+
+    class _Node:
+        """A class that implements a node in a circular doubly linked list of cache entries."""
+
+        __slots__ = ("key", "value", "size", "frequency", "prev", "next")
+
+        key: K # The key of the entry
+        value: V # The value of the entry
+        size: int # The size in bytes of the value, or 0 if the cache is not bounded by bytes
+        frequency: int # The number of times the entry has been used
+        prev: Cache._Node # The previous node in the list
+        next: Cache._Node # The next node in the list
+
+        def __init__(self, key: K = None, value: V = None, size: int = 0):
+            """Set the given key, value and size of the node and link it to itself, which makes a lone node the sentinel of an empty list."""
+            self.key = key
+            self.value = value
+            self.size = size
+            self.frequency = 1
+            self.prev = self
+            self.next = self
+        # fed
+    # ssalc
+
+    _map: HashMap[K, Cache._Node] # The hash map from keys to the nodes holding their entries
+    _max_entries: int | None # The maximum number of entries or None if unbounded
+    _max_bytes: int | None # The maximum total size in bytes of the values or None if unbounded
+    _sizeof: Callable[[V], int] # The function measuring the size in bytes of a value
+    _bytes: int # The total size in bytes of the values in the cache
+    _hits: int # The number of lookups that found their key
+    _misses: int # The number of lookups that did not find their key
+    _evictions: int # The number of entries evicted (or rejected for being too large) to stay within the bounds
+
+    def __init__(self, max_entries: int | None = 128, max_bytes: int | None = None, sizeof: Callable[[V], int] = sys.getsizeof):
+        """Initialise an empty cache with the given bounds or raise a ValueError if a bound is not positive.
+
+        Arguments
+        ---------
+        max_entries
+            The maximum number of entries or None for no bound on the number of entries.
+
+        max_bytes
+            The maximum total size in bytes of the values or None for no bound on the size of the values.
+
+        sizeof
+            The function used to measure the size in bytes of a value, only called when bounded by bytes. Defaults to the shallow `sys.getsizeof`.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Maximum entries must be at least 1")
+        # fi
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Maximum bytes must be at least 1")
+        # fi
+
+        self._map = HashMap()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    # fed
+
+    @staticmethod
+    def _link_after(node: Cache._Node, behind: Cache._Node) -> None:
+        """Link a node into a list directly after the given node."""
+        node.prev = behind
+        node.next = behind.next
+        behind.next.prev = node
+        behind.next = node
+    # fed
+
+    @staticmethod
+    def _unlink(node: Cache._Node) -> None:
+        """Unlink a node from its list by pointing its neighbours at each other."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node
+        node.next = node
+    # fed
+
+    @abstractmethod
+    def _attach(self, node: Cache._Node) -> None:
+        """Add a newly inserted node to the eviction order."""
+    # fed
+
+    @abstractmethod
+    def _detach(self, node: Cache._Node) -> None:
+        """Remove a node from the eviction order."""
+    # fed
+
+    @abstractmethod
+    def _touch(self, node: Cache._Node) -> None:
+        """Record a use of a node in the eviction order."""
+    # fed
+
+    @abstractmethod
+    def _victim(self) -> Cache._Node:
+        """Get the node that should be evicted next."""
+    # fed
+
+    def _exceeds_bounds(self, extra_entries: int = 0, extra_bytes: int = 0) -> bool:
+        """Return a flag indicating whether the cache would exceed a bound with the given number of extra entries and bytes."""
+        if self._max_entries is not None and self._map.size() + extra_entries > self._max_entries:
+            return True
+        # fi
+
+        return self._max_bytes is not None and self._bytes + extra_bytes > self._max_bytes
+    # fed
+
+    def _remove(self, node: Cache._Node) -> None:
+        """Remove a node from the eviction order and the hash map."""
+        self._detach(node)
+        self._map.delete(node.key)
+        self._bytes -= node.size
+    # fed
+
+    def _evict(self) -> None:
+        """Evict the entry chosen by the eviction policy."""
+        self._remove(self._victim())
+        self._evictions += 1
+    # fed
+
+    def get(self, key: K, default_value: V | None = None) -> V | None:
+        """Get the value cached for a key, recording a use of the entry, or return the default if the key isn't cached.
+
+        Time complexity is O(1) on average since it is a hash map lookup followed by O(1) list operations.
+        """
+        node: Cache._Node | None = self._map.get(key)
+
+        if node is None:
+            self._misses += 1
+
+            return default_value
+        # fi
+
+        self._hits += 1
+        self._touch(node)
+
+        return node.value
+    # fed
+
+    def put(self, key: K, value: V) -> None:
+        """Cache a value for a key, recording a use of the entry and evicting entries as needed to stay within the bounds.
+
+        A value larger than the byte bound on its own can never fit so it is rejected and counted as an eviction, and if the key was already cached its old entry is removed as well rather than evicting every other entry to make room. Time complexity is O(1) on average plus O(1) per evicted entry.
+        """
+        node: Cache._Node | None = self._map.get(key)
+        size: int = 0 if self._max_bytes is None else self._sizeof(value)
+
+        if self._max_bytes is not None and size > self._max_bytes:
+            if node is not None:
+                self._remove(node)
+            # fi
+
+            self._evictions += 1
+
+            return
+        # fi
+
+        if node is not None:
+            self._bytes += size - node.size
+            node.value = value
+            node.size = size
+            self._touch(node)
+
+            while self._map.size() > 0 and self._exceeds_bounds():
+                self._evict()
+            # elihw
+
+            return
+        # fi
+
+        # evict before inserting so a new entry is never chosen as its own victim
+        while self._map.size() > 0 and self._exceeds_bounds(1, size):
+            self._evict()
+        # elihw
+
+        node = self._Node(key, value, size)
+
+        self._map.set(key, node)
+        self._attach(node)
+        self._bytes += size
+    # fed
+
+    def delete(self, key: K) -> V | None:
+        """Remove the entry for a key from the cache and return its value or None if the key isn't cached."""
+        node: Cache._Node | None = self._map.get(key)
+
+        if node is None:
+            return None
+        # fi
+
+        self._remove(node)
+
+        return node.value
+    # fed
+
+    def contains(self, key: K) -> bool:
+        """Return a flag indicating whether a key is cached, without recording a use of the entry."""
+        return self._map.contains(key)
+    # fed
+
+    def size(self) -> int:
+        """Get the number of entries in the cache."""
+        return self._map.size()
+    # fed
+
+    def bytes(self) -> int:
+        """Get the total size in bytes of the values in the cache, which is 0 if the cache is not bounded by bytes."""
+        return self._bytes
+    # fed
+
+    def hits(self) -> int:
+        """Get the number of lookups that found their key."""
+        return self._hits
+    # fed
+
+    def misses(self) -> int:
+        """Get the number of lookups that did not find their key."""
+        return self._misses
+    # fed
+
+    def evictions(self) -> int:
+        """Get the number of entries evicted or rejected to stay within the bounds."""
+        return self._evictions
+    # fed
+
+    def __len__(self) -> int:
+        """Get the number of entries in the cache."""
+        return self._map.size()
+    # fed
+
+    def __contains__(self, key: K) -> bool:
+        """Return a flag indicating whether a key is cached."""
+        return self.contains(key)
+    # fed
+# ssalc
@@ -0,0 +1,599 @@
+from __future__ import annotations
+from typing import TypeVar, List, Callable, Iterator, Iterable, Tuple, Any
+from array import array as TypedArray
+from .array import Array
+from .binary_search_tree import BinarySearchTree
+
+T = TypeVar("T")
+
+class CompactBinarySearchTree(BinarySearchTree[T]):
+    """A class that implements an unbalanced binary search tree whose nodes are stored as parallel arrays rather than as objects.
+
+    A node is an index into five parallel columns (struct-of-arrays) holding its value, its data, the indices of its left and right children and the size of its subtree. The child and size columns are typed storage of 64 bit integers and the value array can be typed too if the values are numbers, so a node costs a few machine words instead of an object with its own header and attribute dictionary, and nodes created together sit next to each other in memory. The slots of deleted nodes are chained into a free list through their left child indices and reused by later inserts, so the arrays only grow when every slot is in use.
+
+    An empty leaf node is the largest 64 bit index rather than -1, which no column can reach, so reading a column with it by mistake raises an IndexError instead of wrapping around to the last slot. The columns are plain lists and standard library typed arrays that the tree owns and indexes directly, which keeps each field access a single subscription rather than a method call.
+
+    The API and the time complexities match `BinarySearchTree`. A node is an index, so `root` is the index of the root node and code walking the tree from outside must read nodes through the `_value_of`, `_data_of`, `_left_of` and `_right_of` hooks and compare with `_NIL`, which this class binds to its columns. `rebuild` additionally renumbers the nodes in sorted order, so after it an in-order traversal reads each column front to back.
+
+    Each field read boxes a Python object out of typed storage, so in CPython the columns save memory (about half the bytes per node of node objects) rather than time.
+    """
+
+    _NIL: int = 2 ** 63 - 1 # The index standing for an empty leaf node, out of range of every column
+
+    _values: List[T] | TypedArray # The value of each node
+    _data: List[Any] # The data associated with the value of each node
+    _left: TypedArray # The index of the left child of each node, or of the next free slot for a free slot
+    _right: TypedArray # The index of the right child of each node
+    _sizes: TypedArray # The number of nodes in the subtree rooted at each node
+    root: int # The index of the root node
+    _free: int # The index of the first free slot
+    _typecode: str | None # The typecode of the value array or None if values are stored as Python objects
+
+    def __init__(self, balance: str | None = None, storage: str = BinarySearchTree.COMPACT, typecode: str | None = None):
+        """Initialise an empty tree or raise a ValueError if a balance is given or the storage is not `BinarySearchTree.COMPACT`.
+
+        Arguments
+        ---------
+        balance
+            The balancing scheme, only None (no balancing) is implemented by this class.
+
+        storage
+            The node storage, only `BinarySearchTree.COMPACT` is implemented by this class.
+
+        typecode
+            If given, values are stored unboxed in typed storage with this typecode (see the standard library `array` module, e.g. "q" for signed 64 bit integers or "d" for doubles).
+        """
+        if balance is not None:
+            raise ValueError(f"Unknown binary search tree balance: {balance}")
+        # fi
+
+        if storage != BinarySearchTree.COMPACT:
+            raise ValueError(f"Unknown binary search tree storage: {storage}")
+        # fi
+
+        self._typecode = typecode
+        self._clear()
+    # fed
+
+    def _clear(self) -> None:
+        """Replace the arrays with empty ones."""
+        self._values = [] if self._typecode is None else TypedArray(self._typecode)
+        self._data = []
+        self._left = TypedArray("q")
+        self._right = TypedArray("q")
+        self._sizes = TypedArray("q")
+        self.root = self._NIL
+        self._free = self._NIL
+        self._value_of = self._values.__getitem__
+        self._data_of = self._data.__getitem__
+        self._left_of = self._left.__getitem__
+        self._right_of = self._right.__getitem__
+    # fed
+
+    def _new_slot(self, value: T, data: Any) -> int:
+        """Store a new leaf node in the first free slot, or in a new slot at the end of the arrays if none is free, and return its index."""
+        if self._free == self._NIL:
+            self._values.append(value)
+            self._data.append(data)
+            self._left.append(self._NIL)
+            self._right.append(self._NIL)
+            self._sizes.append(1)
+
+            return len(self._sizes) - 1
+        # fi
+
+        slot: int = self._free
+
+        self._free = self._left[slot]
+        self._values[slot] = value
+        self._data[slot] = data
+        self._left[slot] = self._NIL
+        self._right[slot] = self._NIL
+        self._sizes[slot] = 1
+
+        return slot
+    # fed
+
+    def _release(self, slot: int) -> None:
+        """Push the slot of a removed node onto the free list, dropping the references it holds."""
+        if self._typecode is None:
+            self._values[slot] = None
+        # fi
+
+        self._data[slot] = None
+        self._left[slot] = self._free
+        self._free = slot
+    # fed
+
+    def _size(self, slot: int) -> int:
+        """Get the number of nodes in the subtree rooted at the given node, which is 0 for an empty leaf node."""
+        return self._sizes[slot] if slot != self._NIL else 0
+    # fed
+
+    def _update(self, slot: int) -> None:
+        """Recompute the size of the subtree of a node from those of its children."""
+        sizes: TypedArray = self._sizes
+        left: int = self._left[slot]
+        right: int = self._right[slot]
+
+        sizes[slot] = 1 + (sizes[left] if left != self._NIL else 0) + (sizes[right] if right != self._NIL else 0)
+    # fed
+
+    def _descend(self, value: T) -> List[int]:
+        """Walk down from the root towards the given value and return the path of nodes visited.
+
+        The last node of the path holds the value if it is present, otherwise it is the node the value would be attached under. The path is empty if the tree is empty.
+        """
+        path: List[int] = []
+        slot: int = self.root
+
+        while slot != self._NIL:
+            path.append(slot)
+            current: T = self._values[slot]
+
+            if value < current:
+                slot = self._left[slot]
+            elif value > current:
+                slot = self._right[slot]
+            else:
+                break
+            # fi
+        # elihw
+
+        return path
+    # fed
+
+    def _replace_child(self, parent: int, child: int, replacement: int) -> None:
+        """Relink the given parent, or the root if the parent is `_NIL`, to point at the replacement instead of the given child."""
+        if parent == self._NIL:
+            self.root = replacement
+        elif self._left[parent] == child:
+            self._left[parent] = replacement
+        else:
+            self._right[parent] = replacement
+        # fi
+    # fed
+
+    def _attach(self, path: List[int], value: T, data: Any) -> None:
+        """Attach a new node under the last node of the path returned by `_descend` for a value that is not in the tree, then retrace the path."""
+        slot: int = self._new_slot(value, data)
+
+        if not path:
+            self.root = slot
+
+            return
+        # fi
+
+        parent: int = path[-1]
+
+        if value < self._values[parent]:
+            self._left[parent] = slot
+        else:
+            self._right[parent] = slot
+        # fi
+
+        self._retrace(path)
+    # fed
+
+    def insert(self, value: T, data: Any = None) -> None:
+        """Insert a value, with any data associated with it, into the tree or raise a BinarySearchTreeViolationError if the value is already present.
+
+        Time complexity is O(h).
+        """
+        path: List[int] = self._descend(value)
+
+        if path and self._values[path[-1]] == value:
+            raise self.BinarySearchTreeViolationError
+        # fi
+
+        self._attach(path, value, data)
+    # fed
+
+    def put(self, value: T, data: Any) -> None:
+        """Associate data with a value, inserting the value into the tree if it is not already present.
+
+        Time complexity is O(h).
+        """
+        path: List[int] = self._descend(value)
+
+        if path and self._values[path[-1]] == value:
+            self._data[path[-1]] = data
+        else:
+            self._attach(path, value, data)
+        # fi
+    # fed
+
+    def delete(self, value: T) -> None:
+        """Delete a value from the tree if it is present, moving the value and data of its in-order successor into its node if it has two children.
+
+        Time complexity is O(h). The slot of the node removed is put on the free list for reuse.
+        """
+        path: List[int] = self._descend(value)
+
+        if not path or self._values[path[-1]] != value:
+            return
+        # fi
+
+        slot: int = path[-1]
+
+        if self._left[slot] != self._NIL and self._right[slot] != self._NIL:
+            # extend the path down to the in-order successor and move its value and data into the node
+            successor: int = self._right[slot]
+            path.append(successor)
+
+            while self._left[successor] != self._NIL:
+                successor = self._left[successor]
+                path.append(successor)
+            # elihw
+
+            self._values[slot] = self._values[successor]
+            self._data[slot] = self._data[successor]
+        # fi
+
+        removed: int = path.pop()
+        child: int = self._left[removed] if self._left[removed] != self._NIL else self._right[removed]
+
+        self._replace_child(path[-1] if path else self._NIL, removed, child)
+        self._release(removed)
+        self._retrace(path)
+    # fed
+
+    def _find(self, value: T) -> int:
+        """Walk down from the root to the node holding the given value and return its index or `_NIL` if the value is not present."""
+        slot: int = self.root
+
+        while slot != self._NIL:
+            current: T = self._values[slot]
+
+            if value < current:
+                slot = self._left[slot]
+            elif value > current:
+                slot = self._right[slot]
+            else:
+                return slot
+            # fi
+        # elihw
+
+        return self._NIL
+    # fed
+
+    def search(self, value: T) -> bool:
+        """Search for a value in the tree and return a flag indicating whether it is present.
+
+        Time complexity is O(h) and space complexity is O(1).
+        """
+        return self._find(value) != self._NIL
+    # fed
+
+    def get(self, value: T, default_data: Any = None) -> Any:
+        """Get the data associated with a value in the tree or return the default if the value is not present.
+
+        Time complexity is O(h).
+        """
+        slot: int = self._find(value)
+
+        return self._data[slot] if slot != self._NIL else default_data
+    # fed
+
+    def floor(self, value: T) -> T | None:
+        """Get the largest value in the tree that is less than or equal to the given value or None if there is none.
+
+        Time complexity is O(h).
+        """
+        best: T | None = None
+        slot: int = self.root
+
+        while slot != self._NIL:
+            current: T = self._values[slot]
+
+            if value < current:
+                slot = self._left[slot]
+            elif value > current:
+                best = current
+                slot = self._right[slot]
+            else:
+                return current
+            # fi
+        # elihw
+
+        return best
+    # fed
+
+    def ceiling(self, value: T) -> T | None:
+        """Get the smallest value in the tree that is greater than or equal to the given value or None if there is none.
+
+        Time complexity is O(h).
+        """
+        best: T | None = None
+        slot: int = self.root
+
+        while slot != self._NIL:
+            current: T = self._values[slot]
+
+            if value < current:
+                best = current
+                slot = self._left[slot]
+            elif value > current:
+                slot = self._right[slot]
+            else:
+                return current
+            # fi
+        # elihw
+
+        return best
+    # fed
+
+    def _extreme(self, children: TypedArray) -> T | None:
+        """Follow the given child links down from the root and return the value at the end or None if the tree is empty."""
+        slot: int = self.root
+
+        if slot == self._NIL:
+            return None
+        # fi
+
+        while children[slot] != self._NIL:
+            slot = children[slot]
+        # elihw
+
+        return self._values[slot]
+    # fed
+
+    def min(self) -> T | None:
+        """Get the smallest value in the tree or None if the tree is empty.
+
+        Time complexity is O(h).
+        """
+        return self._extreme(self._left)
+    # fed
+
+    def max(self) -> T | None:
+        """Get the largest value in the tree or None if the tree is empty.
+
+        Time complexity is O(h).
+        """
+        return self._extreme(self._right)
+    # fed
+
+    def _in_order(self, lo: T | None = None, hi: T | None = None) -> Iterator[int]:
+        """Lazily yield the indices of the nodes of the tree in order, only those with values from lo to hi inclusive if bounds are given.
+
+        Subtrees that lie wholly outside the bounds are never entered. The tree must not be modified while the nodes are being yielded.
+        """
+        stack: List[int] = []
+        slot: int = self.root
+
+        while stack or slot != self._NIL:
+            # go as far left as possible, stacking the nodes passed on the way, but skip left subtrees below the lower bound
+            while slot != self._NIL:
+                if lo is not None and self._values[slot] < lo:
+                    slot = self._right[slot]
+                else:
+                    stack.append(slot)
+                    slot = self._left[slot]
+                # fi
+            # elihw
+
+            if not stack:
+                return # every remaining node was below the lower bound
+            # fi
+
+            slot = stack.pop()
+
+            if hi is not None and self._values[slot] > hi:
+                return
+            # fi
+
+            yield slot
+            slot = self._right[slot]
+        # elihw
+    # fed
+
+    def range(self, lo: T, hi: T) -> Iterator[T]:
+        """Lazily yield the values of the tree from lo to hi inclusive in order.
+
+        Time complexity is O(h + k) where k is the number of values yielded.
+        """
+        for slot in self._in_order(lo, hi):
+            yield self._values[slot]
+        # rof
+    # fed
+
+    def range_items(self, lo: T, hi: T) -> Iterator[Tuple[T, Any]]:
+        """Lazily yield each value of the tree from lo to hi inclusive in order, together with its data.
+
+        Time complexity is O(h + k) where k is the number of values yielded.
+        """
+        for slot in self._in_order(lo, hi):
+            yield self._values[slot], self._data[slot]
+        # rof
+    # fed
+
+    def items(self) -> Iterator[Tuple[T, Any]]:
+        """Lazily yield each value of the tree in order, together with its data.
+
+        Time complexity is O(n) to exhaust.
+        """
+        for slot in self._in_order():
+            yield self._values[slot], self._data[slot]
+        # rof
+    # fed
+
+    def for_each(self, callback: Callable[[T], None]) -> None:
+        """Traverse the tree in order and run a callback for each value, passing the value.
+
+        Time complexity is O(n).
+        """
+        for slot in self._in_order():
+            callback(self._values[slot])
+        # rof
+    # fed
+
+    def _link_balanced(self, start: int, stop: int) -> int:
+        """Link the nodes in the slots from the start index up to but excluding the stop index, which hold values in order, into a perfectly balanced subtree and return the index of its root.
+
+        Time complexity is O(n) and the recursion only goes O(log(n)) deep.
+        """
+        if start >= stop:
+            return self._NIL
+        # fi
+
+        mid: int = (start + stop) // 2
+
+        self._left[mid] = self._link_balanced(start, mid)
+        self._right[mid] = self._link_balanced(mid + 1, stop)
+        self._update(mid)
+
+        return mid
+    # fed
+
+    def _load_sorted(self, values: Array[T], data: Array[Any] | None) -> None:
+        """Replace the contents of the tree with values in strictly increasing order, and their data if given, stored in order in fresh arrays and linked into a perfectly balanced tree.
+
+        Raises a BinarySearchTreeViolationError if a value is repeated and a ValueError if the values are otherwise out of order.
+        """
+        count: int = values.length()
+
+        for i in range(1, count):
+            if not values.get(i - 1) < values.get(i):
+                if values.get(i - 1) == values.get(i):
+                    raise self.BinarySearchTreeViolationError
+                # fi
+
+                raise ValueError("Values must be in strictly increasing order")
+            # fi
+        # rof
+
+        self._clear()
+        self._values.extend(values.get(i) for i in range(count))
+        self._data.extend(data.get(i) if data is not None else None for i in range(count))
+        self._left.extend([self._NIL] * count)
+        self._right.extend([self._NIL] * count)
+        self._sizes.extend([1] * count)
+        self.root = self._link_balanced(0, count)
+    # fed
+
+    @classmethod
+    def from_sorted(cls, values: Array[T], data: Array[Any] | None = None, balance: str | None = None, typecode: str | None = None) -> CompactBinarySearchTree[T]:
+        """Create a perfectly balanced tree from an array of values in strictly increasing order, with the data at the same index of the data array if given.
+
+        Raises a BinarySearchTreeViolationError if a value is repeated and a ValueError if the values are otherwise out of order. Time complexity is O(n), and the nodes are stored in sorted order so in-order traversal reads each array front to back.
+        """
+        tree: CompactBinarySearchTree[T] = cls(balance, typecode=typecode)
+
+        tree._load_sorted(values, data)
+
+        return tree
+    # fed
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T], balance: str | None = None, typecode: str | None = None) -> CompactBinarySearchTree[T]:
+        """Create a perfectly balanced tree from values in any order or raise a BinarySearchTreeViolationError if a value is repeated.
+
+        Time complexity is O(n log(n)) for the sort and O(n) for the build.
+        """
+        return cls.from_sorted(Array(sorted(values)), balance=balance, typecode=typecode)
+    # fed
+
+    def rebuild(self) -> None:
+        """Rebalance the tree into a perfectly balanced tree holding the same values and data, renumbering the nodes in sorted order.
+
+        The values and data are copied out in order and reloaded into fresh arrays with no free slots, so time complexity is O(n) and the arrays shrink to exactly the number of values.
+        """
+        values: Array[T] = Array([], self._typecode)
+        data: Array[Any] = Array()
+
+        for slot in self._in_order():
+            values.push(self._values[slot])
+            data.push(self._data[slot])
+        # rof
+
+        self._load_sorted(values, data)
+    # fed
+
+    def height(self) -> int:
+        """Get the height of the tree, the number of nodes on its longest path from the root down, which is 0 for an empty tree.
+
+        Time complexity is O(n) since every node is visited, one level at a time.
+        """
+        height: int = 0
+        level: List[int] = [self.root] if self.root != self._NIL else []
+
+        while level:
+            height += 1
+            level = [child for slot in level for child in (self._left[slot], self._right[slot]) if child != self._NIL]
+        # elihw
+
+        return height
+    # fed
+
+    def select(self, k: int) -> T:
+        """Get the k-th smallest value in the tree, counting from 0, or raise a BinarySearchTreeIndexError if k is out of bounds.
+
+        Time complexity is O(h).
+        """
+        if k < 0 or k >= self._size(self.root):
+            raise self.BinarySearchTreeIndexError
+        # fi
+
+        slot: int = self.root
+
+        while True:
+            left: int = self._size(self._left[slot])
+
+            if k < left:
+                slot = self._left[slot]
+            elif k > left:
+                k -= left + 1 # skip the left subtree and the node itself
+                slot = self._right[slot]
+            else:
+                return self._values[slot]
+            # fi
+        # elihw
+    # fed
+
+    def _count_below(self, value: T, inclusive: bool) -> int:
+        """Count the values in the tree that are less than, or if inclusive less than or equal to, the given value."""
+        count: int = 0
+        slot: int = self.root
+
+        while slot != self._NIL:
+            current: T = self._values[slot]
+
+            if value < current:
+                slot = self._left[slot]
+            elif value > current:
+                count += self._size(self._left[slot]) + 1
+                slot = self._right[slot]
+            else:
+                return count + self._size(self._left[slot]) + (1 if inclusive else 0)
+            # fi
+        # elihw
+
+        return count
+    # fed
+
+    def size(self) -> int:
+        """Get the number of values in the tree.
+
+        Time complexity is O(1).
+        """
+        return self._size(self.root)
+    # fed
+
+    def __iter__(self) -> Iterator[T]:
+        """Lazily yield each value of the tree in order."""
+        for slot in self._in_order():
+            yield self._values[slot]
+        # rof
+    # fed
+
+    def __contains__(self, value: T) -> bool:
+        """Return a flag indicating whether the value is present in the tree."""
+        return self._find(value) != self._NIL
+    # fed
+
+    def __len__(self) -> int:
+        """Get the number of values in the tree."""
+        return self._size(self.root)
+    # fed
+# ssalc
@@ -0,0 +1,258 @@
+from __future__ import annotations
+from typing import TypeVar, Callable, Iterator, Tuple
+from .array import Array
+from .hash_map import HashMap
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+class CompactHashMap(HashMap[K, V]):
+    """A class that implements a hash map with open addressing over a compact index table, in the style of the CPython dict.
+
+    Entries are stored in three dense parallel arrays (hashes, keys and values) in insertion order, so iteration preserves insertion order. A separate index table, whose size is a power of two, maps probe positions to positions in the dense arrays. The index table is typed storage whose item size is the smallest that can address the dense arrays, so an empty slot costs as little as one byte and an entry costs three machine words rather than a linked list node and an entry object.
+
+    Probing follows the CPython scheme `i = 5 * i + 1 + perturb` where `perturb` starts as the hash and is shifted right on every probe, so all bits of the hash take part in resolving collisions and every slot is eventually visited.
+    """
+
+    _EMPTY: int = -1 # Index table marker for a slot that has never been used
+    _DUMMY: int = -2 # Index table marker for a slot whose entry has been deleted, probing must continue past it
+    _PERTURB_SHIFT: int = 5 # The number of bits the perturbation is shifted by on each probe
+    _DELETED: object = object() # Dense key array marker for a deleted entry
+
+    _indices: Array[int] # The index table mapping probe positions to positions in the dense arrays
+    _hashes: Array[int] # The cached hash of each entry
+    _keys: Array[K] # The key of each entry
+    _values: Array[V] # The value of each entry
+    _size: int # The number of live entries in the hash map
+
+    def __init__(self, engine: str = HashMap.OPEN_ADDRESSING, rehash_step: int | None = None):
+        """Initialise an empty index table with the initial number of slots and empty dense arrays or raise a ValueError if the engine or rehash step is invalid.
+
+        Arguments
+        ---------
+        engine
+            The storage engine, only `HashMap.OPEN_ADDRESSING` is implemented by this class.
+
+        rehash_step
+            Must be None, since the index table is always rebuilt at once. Incremental rehashing is only supported by the `HashMap.CHAINING` engine.
+        """
+        if engine != HashMap.OPEN_ADDRESSING:
+            raise ValueError(f"Unknown hash map engine: {engine}")
+        # fi
+
+        if rehash_step is not None:
+            raise ValueError("Incremental rehashing is only supported by the chaining engine")
+        # fi
+
+        self._initialise_new_tables(HashMap._INITIAL_BUCKETS)
+    # fed
+
+    @staticmethod
+    def _index_typecode(slots: int) -> str:
+        """Get the smallest signed typecode that can hold every position in the dense arrays for an index table with the given number of slots."""
+        if slots <= 2 ** 7:
+            return "b"
+        elif slots <= 2 ** 15:
+            return "h"
+        elif slots <= 2 ** 31:
+            return "i"
+        # fi
+
+        return "q"
+    # fed
+
+    def _initialise_new_tables(self, slots: int) -> None:
+        """Create and assign a new empty index table with the given number of slots and new empty dense arrays."""
+        self._indices = Array([CompactHashMap._EMPTY] * slots, typecode=self._index_typecode(slots))
+        self._hashes = Array(typecode="q")
+        self._keys = Array()
+        self._values = Array()
+        self._size = 0
+    # fed
+
+    def _usable(self) -> int:
+        """Get the number of dense entries (live or deleted) the index table can address before it must be resized."""
+        return int(self._indices.length() * HashMap._MAX_LOAD)
+    # fed
+
+    def _lookup(self, key: K, key_hash: int) -> Tuple[int, int]:
+        """Probe the index table for the given key and return the slot it occupies and its position in the dense arrays.
+
+        If the key is absent, the position is -1 and the slot is the first dummy or empty slot encountered on the probe sequence, which is where the key should be inserted. The search always terminates because the table is resized before every slot is in use.
+        """
+        mask: int = self._indices.length() - 1
+        perturb: int = key_hash & 0xFFFFFFFFFFFFFFFF # treat the hash as unsigned so the shifts below eventually reach zero
+        slot: int = key_hash & mask
+        free_slot: int = -1
+
+        while True:
+            index: int = self._indices.get(slot)
+
+            if index == CompactHashMap._EMPTY:
+                return (slot if free_slot == -1 else free_slot), -1
+            elif index == CompactHashMap._DUMMY:
+                if free_slot == -1:
+                    free_slot = slot
+                # fi
+            elif self._hashes.get(index) == key_hash:
+                # compare hashes first and identity before equality, since both are much cheaper than `==` on large keys
+                candidate: K = self._keys.get(index)
+
+                if candidate is key or candidate == key:
+                    return slot, index
+                # fi
+            # fi
+
+            perturb >>= CompactHashMap._PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+        # elihw
+    # fed
+
+    def _insert_slot(self, key_hash: int) -> int:
+        """Find the first empty slot on the probe sequence of the given hash, for use when the key is known to be absent and the table has no dummies."""
+        mask: int = self._indices.length() - 1
+        perturb: int = key_hash & 0xFFFFFFFFFFFFFFFF
+        slot: int = key_hash & mask
+
+        while self._indices.get(slot) != CompactHashMap._EMPTY:
+            perturb >>= CompactHashMap._PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+        # elihw
+
+        return slot
+    # fed
+
+    def _resize(self, minimum_size: int | None = None) -> None:
+        """Rebuild the index table so it can hold at least twice the live entries (or the given minimum) and compact the dense arrays.
+
+        Deleted entries are dropped from the dense arrays and the cached hashes are reused, so no key is re-hashed or compared. Time complexity is O(n) and space complexity is O(n) since new tables are built before the old ones are released.
+        """
+        required: int = max(self._size * 2, self._size + 1 if minimum_size is None else minimum_size)
+        slots: int = HashMap._INITIAL_BUCKETS
+
+        while slots * HashMap._MAX_LOAD < required:
+            slots *= 2
+        # elihw
+
+        old_hashes: Array[int] = self._hashes
+        old_keys: Array[K] = self._keys
+        old_values: Array[V] = self._values
+        size: int = self._size
+
+        self._initialise_new_tables(slots)
+
+        for i in range(old_keys.length()):
+            key: K = old_keys.get(i)
+
+            if key is CompactHashMap._DELETED:
+                continue
+            # fi
+
+            key_hash: int = old_hashes.get(i)
+
+            self._indices.set(self._insert_slot(key_hash), self._keys.length())
+            self._hashes.push(key_hash)
+            self._keys.push(key)
+            self._values.push(old_values.get(i))
+        # rof
+
+        self._size = size
+    # fed
+
+    def _reserve(self, expected_size: int) -> None:
+        """Rebuild the index table once so the given number of entries can be inserted without any further resize."""
+        if expected_size > self._usable():
+            self._resize(expected_size)
+        # fi
+    # fed
+
+    def set(self, key: K, value: V) -> None:
+        """Insert a key-value pair into the hash map, resizing the index table first if it is out of usable slots.
+
+        Time complexity is O(1) in the best and average case since with a load factor below 0.7 the expected probe sequence length is a small constant, and the new entry is appended to the dense arrays in amortized O(1). In the worst case all keys collide and the probe sequence visits O(n) slots.
+        """
+        key_hash: int = hash(key)
+        slot, index = self._lookup(key, key_hash)
+
+        if index != -1:
+            self._values.set(index, value)
+
+            return
+        # fi
+
+        if self._keys.length() >= self._usable():
+            self._resize()
+            slot = self._insert_slot(key_hash)
+        # fi
+
+        self._indices.set(slot, self._keys.length())
+        self._hashes.push(key_hash)
+        self._keys.push(key)
+        self._values.push(value)
+        self._size += 1
+    # fed
+
+    def get(self, key: K, default_value: V | None = None) -> V | None:
+        """Get a value associated with a key in the hash map or return the default if the key doesn't exist.
+
+        Time complexity mirrors the time complexity of the `set` method so O(1) best/average case and O(n) worst case.
+        """
+        index: int = self._lookup(key, hash(key))[1]
+
+        return default_value if index == -1 else self._values.get(index)
+    # fed
+
+    def delete(self, key: K) -> V | None:
+        """Delete a key-value pair from the hash map based on the given key and return its value, or None if the key doesn't exist.
+
+        The slot is marked as a dummy so probe sequences passing through it still continue, and the dense entry is marked deleted so iteration skips it until the next resize compacts it away. Time complexity mirrors the time complexity of the `set` method so O(1) best/average case and O(n) worst case.
+        """
+        slot, index = self._lookup(key, hash(key))
+
+        if index == -1:
+            return None
+        # fi
+
+        value: V = self._values.get(index)
+
+        self._indices.set(slot, CompactHashMap._DUMMY)
+        self._keys.set(index, CompactHashMap._DELETED)
+        self._values.set(index, None)
+        self._size -= 1
+
+        return value
+    # fed
+
+    def contains(self, key: K) -> bool:
+        """Return a flag indicating whether there is an entry in the hash map for the given key."""
+        return self._lookup(key, hash(key))[1] != -1
+    # fed
+
+    def for_each(self, callback: Callable[[K, V], None]) -> None:
+        """Run a callback function for each entry in the hash map passing the key and value of the entry.
+
+        Entries are visited in insertion order since the dense arrays are appended to in insertion order.
+        """
+        for i in range(self._keys.length()):
+            key: K = self._keys.get(i)
+
+            if key is not CompactHashMap._DELETED:
+                callback(key, self._values.get(i))
+            # fi
+        # rof
+    # fed
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """Lazily yield the key and value of each entry in the hash map in insertion order.
+
+        The hash map must not be modified while the iterator is in use.
+        """
+        for i in range(self._keys.length()):
+            key: K = self._keys.get(i)
+
+            if key is not CompactHashMap._DELETED:
+                yield key, self._values.get(i)
+            # fi
+        # rof
+    # fed
+# ssalc
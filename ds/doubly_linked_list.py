@@ -0,0 +1,325 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Callable, Iterator
+from .array import Array
+
+T = TypeVar("T")
+
+class DoublyLinkedList(Generic[T]):
+    """A class that implements a doubly linked list.
+
+    Every node points to both its neighbours and the list is circular around a sentinel node, so the nodes either side of any node are known without traversal and there are no special cases for the head, the tail or an empty list. This makes insertion and deletion at both ends O(1).
+
+    Methods that insert a value return its node, which is a stable handle: it stays valid until the value is deleted, however the rest of the list changes. Given a handle, the value can be unlinked or moved to either end in O(1).
+    """
+
+    class DoublyLinkedListIndexError(IndexError):
+        """Custom error class for doubly linked list index out of bounds errors."""
+
+        def __init__(self):
+            """Instantiate the parent error class with a custom out of bounds message."""
+            super().__init__("Doubly linked list index out of bounds")
+        # fed
+    # ssalc
+
+    class Node:
+        """A class that implements a node in the doubly linked list, which doubles as a handle to its value."""
+
+        __slots__ = ("value", "prev", "next")
+
+        value: T # The value of the node
+        prev: DoublyLinkedList.Node | None # A pointer to the previous node in the list or None if the node is not in a list
+        next: DoublyLinkedList.Node | None # A pointer to the next node in the list or None if the node is not in a list
+
+        def __init__(self, value: T):
+            """Set the given value of the node which is not yet in a list."""
+            self.value = value
+            self.prev = None
+            self.next = None
+        # fed
+    # ssalc
+
+    _length: int # The length of the doubly linked list
+    _sentinel: DoublyLinkedList.Node # The sentinel node, its next node is the head and its previous node is the tail
+
+    def __init__(self, values: Array[T] | None = None):
+        """Initialise the doubly linked list with the given elements if any and set the length."""
+        self._sentinel = self.Node(None)
+        self._sentinel.prev = self._sentinel
+        self._sentinel.next = self._sentinel
+        self._length = 0
+
+        if values is not None:
+            for i in range(values.length()):
+                self.append(values.get(i))
+            # rof
+        # fi
+    # fed
+
+    def _validate_index(self, index: int) -> None:
+        """Do nothing if the given index is within valid bounds for the doubly linked list or raise a DoublyLinkedListIndexError."""
+        if index < 0 or index >= self._length:
+            raise self.DoublyLinkedListIndexError
+        # fi
+    # fed
+
+    def _validate_node(self, node: DoublyLinkedList.Node) -> None:
+        """Do nothing if the given node is in a list or raise a ValueError if it has been unlinked or was never linked."""
+        if node.next is None:
+            raise ValueError("Node is not in a doubly linked list")
+        # fi
+    # fed
+
+    def _traverse(self, index: int) -> DoublyLinkedList.Node:
+        """Traverse the doubly linked list to the given index and return the node.
+
+        The traversal starts from whichever end is nearer to the index, so time complexity is O(min(i, n - i)) which is O(n) in the worst and average case and O(1) in the best case where the index is at either end.
+        """
+        self._validate_index(index)
+
+        if index < self._length // 2:
+            current: DoublyLinkedList.Node = self._sentinel.next
+
+            for i in range(index):
+                current = current.next
+            # rof
+        else:
+            current: DoublyLinkedList.Node = self._sentinel.prev
+
+            for i in range(self._length - 1 - index):
+                current = current.prev
+            # rof
+        # fi
+
+        return current
+    # fed
+
+    def _link_after(self, node: DoublyLinkedList.Node, behind: DoublyLinkedList.Node) -> DoublyLinkedList.Node:
+        """Link a node into the list directly after the given node and return it."""
+        node.prev = behind
+        node.next = behind.next
+        behind.next.prev = node
+        behind.next = node
+        self._length += 1
+
+        return node
+    # fed
+
+    def _detach(self, node: DoublyLinkedList.Node) -> None:
+        """Unlink a node from the list by pointing its neighbours at each other, leaving it with no neighbours."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = None
+        node.next = None
+        self._length -= 1
+    # fed
+
+    def insert(self, index: int, value: T) -> DoublyLinkedList.Node:
+        """Insert an item into the doubly linked list at the given index and return its node or raise a DoublyLinkedListIndexError if out of bounds.
+
+        Time complexity mirrors the time complexity of the `_traverse` method so worst and average case O(n) and best case O(1) at either end.
+        """
+        if index < 0 or index > self._length:
+            raise self.DoublyLinkedListIndexError
+        # fi
+
+        behind: DoublyLinkedList.Node = self._sentinel if index == 0 else self._traverse(index - 1)
+
+        return self._link_after(self.Node(value), behind)
+    # fed
+
+    def append(self, value: T) -> DoublyLinkedList.Node:
+        """Append an item at the end of the doubly linked list and return its node.
+
+        Time complexity is O(1) since the new node is linked after the tail which the sentinel points to.
+        """
+        return self._link_after(self.Node(value), self._sentinel.prev)
+    # fed
+
+    def prepend(self, value: T) -> DoublyLinkedList.Node:
+        """Prepend an item at the beginning of the doubly linked list and return its node.
+
+        Time complexity is O(1) since the new node is linked after the sentinel.
+        """
+        return self._link_after(self.Node(value), self._sentinel)
+    # fed
+
+    def delete(self, index: int) -> T:
+        """Delete an item from the doubly linked list at the given index and return its value or raise a DoublyLinkedListIndexError if out of bounds.
+
+        Time complexity mirrors the time complexity of the `_traverse` method so worst and average case O(n) and best case O(1) at either end.
+        """
+        return self.unlink(self._traverse(index))
+    # fed
+
+    def delete_first(self) -> T:
+        """Delete the head of the doubly linked list and return its value or raise a DoublyLinkedListIndexError if the list is empty.
+
+        Time complexity is O(1) since the head is the node after the sentinel.
+        """
+        if self._length == 0:
+            raise self.DoublyLinkedListIndexError
+        # fi
+
+        return self.unlink(self._sentinel.next)
+    # fed
+
+    def delete_last(self) -> T:
+        """Delete the tail of the doubly linked list and return its value or raise a DoublyLinkedListIndexError if the list is empty.
+
+        Time complexity is O(1) since the tail is the node before the sentinel and it points back to the node before it, so unlike a singly linked list no traversal is needed.
+        """
+        if self._length == 0:
+            raise self.DoublyLinkedListIndexError
+        # fi
+
+        return self.unlink(self._sentinel.prev)
+    # fed
+
+    def unlink(self, node: DoublyLinkedList.Node) -> T:
+        """Remove the given node from the doubly linked list and return its value or raise a ValueError if the node is not in a list.
+
+        Time complexity is O(1) since the node's neighbours are known from the node itself. The node must belong to this list.
+        """
+        self._validate_node(node)
+        self._detach(node)
+
+        return node.value
+    # fed
+
+    def move_to_front(self, node: DoublyLinkedList.Node) -> None:
+        """Move the given node of the doubly linked list to the head in O(1) or raise a ValueError if the node is not in a list."""
+        self._validate_node(node)
+        self._detach(node)
+        self._link_after(node, self._sentinel)
+    # fed
+
+    def move_to_back(self, node: DoublyLinkedList.Node) -> None:
+        """Move the given node of the doubly linked list to the tail in O(1) or raise a ValueError if the node is not in a list."""
+        self._validate_node(node)
+        self._detach(node)
+        self._link_after(node, self._sentinel.prev)
+    # fed
+
+    def first_node(self) -> DoublyLinkedList.Node | None:
+        """Get the node at the head of the doubly linked list or None if the list is empty."""
+        return None if self._length == 0 else self._sentinel.next
+    # fed
+
+    def last_node(self) -> DoublyLinkedList.Node | None:
+        """Get the node at the tail of the doubly linked list or None if the list is empty."""
+        return None if self._length == 0 else self._sentinel.prev
+    # fed
+
+    def get(self, index: int) -> T:
+        """Get an item from the doubly linked list at the specified index or raise a DoublyLinkedListIndexError if out of bounds.
+
+        Time complexity mirrors the time complexity of the `_traverse` method so worst and average case O(n) and best case O(1).
+        """
+        return self._traverse(index).value
+    # fed
+
+    def head(self) -> T:
+        """Get the value at the head of the doubly linked list or raise a DoublyLinkedListIndexError if the list is empty."""
+        return self.get(0)
+    # fed
+
+    def tail(self) -> T:
+        """Get the value at the tail of the doubly linked list or raise a DoublyLinkedListIndexError if the list is empty."""
+        return self.get(self._length - 1)
+    # fed
+
+    def set(self, index: int, value: T) -> None:
+        """Set the value of a node in the doubly linked list at the specified index or raise a DoublyLinkedListIndexError if out of bounds.
+
+        Time complexity mirrors the time complexity of the `_traverse` method so worst and average case O(n) and best case O(1).
+        """
+        self._traverse(index).value = value
+    # fed
+
+    def find(self, match: Callable[[T], bool]) -> T | None:
+        """Linearly search for an item in the doubly linked list based on a matching function and return the first match or None if none found.
+
+        Time complexity is O(n) in the worst and average case and O(1) in the best case with the target at the head.
+        """
+        current: DoublyLinkedList.Node = self._sentinel.next
+
+        while current is not self._sentinel:
+            if match(current.value):
+                return current.value
+            # fi
+
+            current = current.next
+        # elihw
+
+        return None
+    # fed
+
+    def map(self, mapper: Callable[[T], T]) -> None:
+        """Replace each item in the doubly linked list with the result of passing it to the mapper function.
+
+        Time complexity is O(n) since we traverse the whole list.
+        """
+        current: DoublyLinkedList.Node = self._sentinel.next
+
+        while current is not self._sentinel:
+            current.value = mapper(current.value)
+            current = current.next
+        # elihw
+    # fed
+
+    def filter(self, match: Callable[[T], bool]) -> None:
+        """Filter the doubly linked list to only items that pass the given matching function.
+
+        Time complexity is O(n) since we traverse the whole list and each unlink is O(1).
+        """
+        current: DoublyLinkedList.Node = self._sentinel.next
+
+        while current is not self._sentinel:
+            nxt: DoublyLinkedList.Node = current.next
+
+            if not match(current.value):
+                self._detach(current)
+            # fi
+
+            current = nxt
+        # elihw
+    # fed
+
+    def for_each(self, callback: Callable[[T], None]) -> None:
+        """Traverse the doubly linked list from head to tail and run a callback for each item, passing the item."""
+        current: DoublyLinkedList.Node = self._sentinel.next
+
+        while current is not self._sentinel:
+            callback(current.value)
+
+            current = current.next
+        # elihw
+    # fed
+
+    def length(self) -> int:
+        """Get the length of the doubly linked list."""
+        return self._length
+    # fed
+
+    def __iter__(self) -> Iterator[T]:
+        """Lazily yield each value in the doubly linked list from head to tail."""
+        current: DoublyLinkedList.Node = self._sentinel.next
+
+        while current is not self._sentinel:
+            yield current.value
+
+            current = current.next
+        # elihw
+    # fed
+
+    def __reversed__(self) -> Iterator[T]:
+        """Lazily yield each value in the doubly linked list from tail to head."""
+        current: DoublyLinkedList.Node = self._sentinel.prev
+
+        while current is not self._sentinel:
+            yield current.value
+
+            current = current.prev
+        # elihw
+    # fed
+# ssalc
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Generic, TypeVar, TypeAlias, Callable
+from typing import Generic, TypeVar, TypeAlias, Callable, Iterable, Iterator, Tuple
 from .linked_list import LinkedList
 from .array import Array
 
@@ -7,55 +7,130 @@ K = TypeVar("K")
 V = TypeVar("V")
 
 class HashMap(Generic[K, V]):
-    """A class that implements a hash map with separate chaining and automatic resizing."""
+    """A class that implements a hash map with separate chaining and automatic resizing.
+
+    The storage engine is selected at construction. The default `HashMap.CHAINING` engine is implemented by this class. Passing `HashMap.OPEN_ADDRESSING` instead constructs a `CompactHashMap` which uses open addressing over a compact index table and dense entry arrays, preserving insertion order and using far less memory per entry.
+    """
 
     class Entry:
         """A class that implements an entry in the hash map."""
 
+        __slots__ = ("key", "value", "hash")
+
         key: K # The key of the entry
         value: V # The value of the entry
+        hash: int # The cached hash of the key so it is computed once per entry rather than once per scan or resize
 
-        def __init__(self, key: K, value: V):
-            """Assign the given key and value to the entry."""
+        def __init__(self, key: K, value: V, key_hash: int):
+            """Assign the given key, value and hash of the key to the entry."""
             self.key = key
             self.value = value
+            self.hash = key_hash
+        # fed
+
+        def matches(self, key: K, key_hash: int) -> bool:
+            """Return a flag indicating whether the entry is for the given key with the given hash.
+
+            The cached hashes are compared first and then identity, both of which are much cheaper than `==` on large keys such as tuples and strings, so `==` only runs for keys that are almost certainly equal.
+            """
+            return self.hash == key_hash and (self.key is key or self.key == key)
         # fed
     # ssalc
 
-    _Bucket: TypeAlias = LinkedList[HashMap.Entry]
-    _BucketArray: TypeAlias = Array[HashMap._Bucket]
+    _Bucket: TypeAlias = LinkedList["HashMap.Entry"]
+    _BucketArray: TypeAlias = Array["HashMap._Bucket | None"]
+
+    CHAINING: str = "chaining" # Engine using separate chaining with a linked list per bucket
+    OPEN_ADDRESSING: str = "open_addressing" # Engine using open addressing with a compact index table
+
+    _MISSING: object = object() # Default value marker distinguishing a missing key from a key mapped to None
 
     _INITIAL_BUCKETS: int = 16 # The initial number of buckets
     _MAX_LOAD: float = 0.7 # The maximum load factor
 
     _bucket_array: HashMap._BucketArray # The array of buckets that holds entries
     _size: int # The size of the hash map
+    _rehash_step: int | None # The number of old buckets migrated per operation during an incremental resize or None to resize all at once
+    _old_bucket_array: HashMap._BucketArray | None # The bucket array being migrated from during an incremental resize
+    _rehash_index: int # The index of the next old bucket to migrate during an incremental resize
 
-    def __init__(self):
-        """Initialise the bucket array with the initial number of buckets."""
-        self._initialise_new_bucket_array()
+    def __new__(cls, engine: str = CHAINING, *args, **kwargs):
+        """Construct a `CompactHashMap` instead if the open addressing engine is selected."""
+        if cls is HashMap and engine == HashMap.OPEN_ADDRESSING:
+            from .compact_hash_map import CompactHashMap
+
+            return super().__new__(CompactHashMap)
+        # fi
+
+        return super().__new__(cls)
     # fed
 
-    def _initialise_new_bucket_array(self, length: int | None = None) -> None:
-        """Create and assign a new bucket array with the given length or the initial number of buckets if none given."""
-        bucket_array: HashMap._BucketArray = Array()
+    def __init__(self, engine: str = CHAINING, rehash_step: int | None = None):
+        """Initialise the bucket array with the initial number of buckets or raise a ValueError if the engine or rehash step is invalid.
 
-        for i in range(HashMap._INITIAL_BUCKETS if length is None else length):
-            bucket_array.push(LinkedList())
-        # rof
+        Arguments
+        ---------
+        engine
+            The storage engine, only `HashMap.CHAINING` is implemented by this class.
+
+        rehash_step
+            If given, resizing is incremental and this many old buckets are migrated to the new bucket array on each `set`, `get` or `delete`. If None, resizing rehashes every entry at once.
+        """
+        if engine != HashMap.CHAINING:
+            raise ValueError(f"Unknown hash map engine: {engine}")
+        # fi
+
+        if rehash_step is not None and rehash_step < 1:
+            raise ValueError("Rehash step must be at least 1")
+        # fi
 
-        self._bucket_array = bucket_array
+        self._rehash_step = rehash_step
+        self._old_bucket_array = None
+        self._rehash_index = 0
         self._size = 0
+        self._initialise_new_bucket_array()
+    # fed
+
+    def _initialise_new_bucket_array(self, length: int | None = None) -> None:
+        """Create and assign a new bucket array with the given length or the initial number of buckets if none given.
+
+        Every bucket starts out as None and its linked list is only created when the first entry is inserted into it, so the array is filled in a single C-level operation rather than by constructing a linked list per bucket in a Python loop, which for large tables costs about as much as the resize it is part of.
+        """
+        self._bucket_array = Array([None] * (HashMap._INITIAL_BUCKETS if length is None else length))
     # fed
     
-    def _get_bucket_index(self, key: K) -> int:
-        """Get the index of the associated bucket for the given key via hashing."""
-        return hash(key) % self._bucket_array.length()
+    def _get_bucket_index(self, key_hash: int) -> int:
+        """Get the index of the associated bucket for the given hash of a key."""
+        return key_hash % self._bucket_array.length()
+    # fed
+
+    @staticmethod
+    def _bucket_at(bucket_array: HashMap._BucketArray, index: int, create: bool) -> HashMap._Bucket | None:
+        """Get the bucket at the given index of a bucket array, creating it first if it has not been created yet and the create flag is set, or None otherwise."""
+        bucket: HashMap._Bucket | None = bucket_array.get(index)
+
+        if bucket is None and create:
+            bucket = LinkedList()
+            bucket_array.set(index, bucket)
+        # fi
+
+        return bucket
     # fed
 
-    def _get_bucket(self, key: K)  -> HashMap._Bucket:
-        """Get a reference to the bucket associated with the given key."""
-        return self._bucket_array.get(self._get_bucket_index(key))
+    def _get_bucket(self, key_hash: int, create: bool = False)  -> HashMap._Bucket | None:
+        """Get a reference to the bucket associated with the given hash of a key, creating it if the create flag is set, or None if it has not been created.
+
+        During an incremental resize, the key belongs to its bucket in the old bucket array if that bucket has not been migrated yet, or else to its bucket in the new bucket array. So each key lives in exactly one bucket and only one bucket is ever searched.
+        """
+        if self._old_bucket_array is not None:
+            old_index: int = key_hash % self._old_bucket_array.length()
+
+            if old_index >= self._rehash_index:
+                return self._bucket_at(self._old_bucket_array, old_index, create)
+            # fi
+        # fi
+
+        return self._bucket_at(self._bucket_array, self._get_bucket_index(key_hash), create)
     # fed
     
     def _calculate_load_factor(self) -> float:
@@ -68,21 +143,65 @@ class HashMap(Generic[K, V]):
         return self._calculate_load_factor() > HashMap._MAX_LOAD
     # fi
 
-    def _resize(self) -> None:
-        """Double the size of the bucket array and re-hash all keys.
+    def _migrate_bucket(self, bucket: HashMap._Bucket | None) -> None:
+        """Move every entry of a bucket, if it was ever created, from the old bucket array into its bucket in the current bucket array."""
+        if bucket is not None:
+            bucket.for_each(lambda entry: self._bucket_at(self._bucket_array, self._get_bucket_index(entry.hash), True).append(entry)) # reuse the cached hash, no key is re-hashed
+        # fi
+    # fed
+
+    def _rehash(self, steps: int) -> None:
+        """Migrate up to the given number of buckets from the old bucket array during an incremental resize, ending the resize once every bucket has been migrated.
+
+        Time complexity is O(steps) on average since each bucket holds a constant number of entries on average.
+        """
+        while steps > 0 and self._old_bucket_array is not None:
+            self._migrate_bucket(self._old_bucket_array.get(self._rehash_index))
+            self._old_bucket_array.set(self._rehash_index, None) # release the migrated bucket
+            self._rehash_index += 1
+            steps -= 1
+
+            if self._rehash_index == self._old_bucket_array.length():
+                self._old_bucket_array = None
+                self._rehash_index = 0
+            # fi
+        # elihw
+    # fed
+
+    def _finish_rehash(self) -> None:
+        """Migrate every remaining bucket if an incremental resize is in progress, ending the resize.
+
+        Iteration calls this before visiting any bucket. Lookups during a resize migrate buckets, so a lookup made while iterating could otherwise move an entry from a bucket not yet visited into one already passed, and the entry would be skipped. Once no resize is in progress, lookups never move entries.
+        """
+        if self._old_bucket_array is not None:
+            self._rehash(self._old_bucket_array.length())
+        # fi
+    # fed
+
+    def _rehash_step_if_resizing(self) -> None:
+        """Perform one bounded step of migration if an incremental resize is in progress."""
+        if self._old_bucket_array is not None:
+            self._rehash(self._rehash_step)
+        # fi
+    # fed
+
+    def _resize(self, new_bucket_array_length: int | None = None) -> None:
+        """Double the size of the bucket array (or grow it to the given length) and redistribute all entries using their cached hashes.
         
-        Time complexity is O(n) since for each entry we have to re-insert it into a newly created bucket array. Space complexity is O(n) since we clone the old bucket array before replacing it with a new one.
+        If no rehash step is set, every entry is moved at once so time complexity is O(n). Space complexity is O(n) since we clone the old bucket array before replacing it with a new one. Otherwise, the old bucket array is kept alive and its buckets are migrated a rehash step at a time by subsequent operations (as in Redis), so apart from filling the new bucket array with empty slots in C no single operation pays more than O(rehash step) for resizing and latency stays flat as the hash map grows. Must not be called while an incremental resize is in progress.
         """
         old_bucket_array: HashMap._BucketArray = self._bucket_array
-        new_bucket_array_length: int = old_bucket_array.length() * 2
+
+        if new_bucket_array_length is None:
+            new_bucket_array_length = old_bucket_array.length() * 2
+        # fi
 
         self._initialise_new_bucket_array(new_bucket_array_length)
-        
-        for i in range(old_bucket_array.length()):
-            bucket: HashMap._Bucket = old_bucket_array.get(i)
 
-            bucket.for_each(lambda entry: self.set(entry.key, entry.value))
-        # rof
+        self._old_bucket_array = old_bucket_array
+        self._rehash_index = 0
+
+        self._rehash(old_bucket_array.length() if self._rehash_step is None else self._rehash_step)
     # fed
             
     def set(self, key: K, value: V) -> None:
@@ -90,31 +209,25 @@ class HashMap(Generic[K, V]):
 
         Time complexity in the best case is O(1) since when we insert we always insert at the end of the bucket (linked list) or if we are updating then the bucket is of length 1. In the average case, the average length of a chain in a bucket is equal to the number of elements divided by the number of buckets which is any number less than or equal to the load factor (0.7) so time taken to insert or update is proportional to the load factor giving us O(1). Worst case, all keys in the hash map hash to the same bucket and so if we update the second to last item in the bucket's chain, we have to traverse roughly n elements giving us O(n).
         """
-        bucket: HashMap._Bucket = self._get_bucket(key)
-        replaced: bool = False
+        self._rehash_step_if_resizing()
 
-        def _mapper(entry: HashMap.Entry) -> Entry:
-            nonlocal replaced
-            
-            if entry.key == key:
-                entry.value = value
-                replaced = True
-            # fi
-            
-            return entry
-        # fed
+        key_hash: int = hash(key)
+        bucket: HashMap._Bucket = self._get_bucket(key_hash, True)
+        entry: HashMap.Entry | None = bucket.find(lambda entry: entry.matches(key, key_hash)) # O(n) worst, O(1) best/average
 
-        bucket.map(_mapper) # O(n) worst, O(1) best/average
+        if entry is not None:
+            entry.value = value
 
-        if replaced:
             return
         # fi
 
-        bucket.append(self.Entry(key, value)) # O(1)
+        bucket.append(self.Entry(key, value, key_hash)) # O(1)
 
         self._size += 1
 
-        if self._load_factor_exceeded():
+        # as in Redis, a resize is deferred rather than forcing an incremental one in progress to finish, the new bucket array has
+        # twice the buckets so the load factor stays bounded until the migration completes and the next insert starts another resize
+        if self._old_bucket_array is None and self._load_factor_exceeded():
             self._resize()
         # fi
     # fed
@@ -124,8 +237,16 @@ class HashMap(Generic[K, V]):
 
         Time complexity mirrors the time complexity of the `set` method so O(1) best/average case and O(n) worst case.
         """
-        bucket: HashMap._Bucket = self._get_bucket(key)
-        entry: HashMap.Entry | None = bucket.find(lambda entry: entry.key == key)
+        self._rehash_step_if_resizing()
+
+        key_hash: int = hash(key)
+        bucket: HashMap._Bucket | None = self._get_bucket(key_hash)
+
+        if bucket is None:
+            return default_value
+        # fi
+
+        entry: HashMap.Entry | None = bucket.find(lambda entry: entry.matches(key, key_hash))
         
         return default_value if entry is None else entry.value
     # fed
@@ -135,7 +256,15 @@ class HashMap(Generic[K, V]):
 
         Time complexity mirros the time complexity of the `set` method so O(1) best/average case and O(n) worst case.
         """
-        bucket: HashMap._Bucket = self._get_bucket(key)
+        self._rehash_step_if_resizing()
+
+        key_hash: int = hash(key)
+        bucket: HashMap._Bucket | None = self._get_bucket(key_hash)
+
+        if bucket is None:
+            return None
+        # fi
+
         deleted_val: V | None = None
         deleted: bool = False
 
@@ -143,7 +272,7 @@ class HashMap(Generic[K, V]):
             nonlocal deleted
             nonlocal deleted_val
 
-            if entry.key == key:
+            if not deleted and entry.matches(key, key_hash):
                 deleted_val = entry.value
                 deleted = True
 
@@ -163,19 +292,130 @@ class HashMap(Generic[K, V]):
     # fed
 
     def contains(self, key: K) -> bool:
-        """Return a flag indicating whether there is an entry in the hash map for the given key."""
-        return self.get(key) is not None
+        """Return a flag indicating whether there is an entry in the hash map for the given key, including keys mapped to None."""
+        return self.get(key, HashMap._MISSING) is not HashMap._MISSING
+    # fed
+
+    def _reserve(self, expected_size: int) -> None:
+        """Grow the bucket array once so the given number of entries can be held without exceeding the maximum load factor.
+
+        Presizing replaces the O(log(n)) successive doublings that n individual inserts would trigger with a single resize. Since the caller is about to insert in bulk, any incremental resize in progress is finished first.
+        """
+        self._finish_rehash()
+
+        length: int = self._bucket_array.length()
+
+        while expected_size / length > HashMap._MAX_LOAD:
+            length *= 2
+        # elihw
+
+        if length > self._bucket_array.length():
+            self._resize(length)
+        # fi
+    # fed
+
+    def set_many(self, pairs: Iterable[Tuple[K, V]]) -> None:
+        """Insert each key-value pair of the given iterable into the hash map.
+
+        If the number of pairs is known the hash map is presized for all of them up front, so no resize happens during the loop. Time complexity is O(k) on average where k is the number of pairs.
+        """
+        if hasattr(pairs, "__len__"):
+            self._reserve(self._size + len(pairs))
+        # fi
+
+        set_pair: Callable[[K, V], None] = self.set # bind once rather than looking up the method for every pair
+
+        for key, value in pairs:
+            set_pair(key, value)
+        # rof
+    # fed
+
+    def get_many(self, keys: Iterable[K], default_value: V | None = None) -> Array[V | None]:
+        """Get the values associated with each of the given keys, in order, using the default for keys that don't exist.
+
+        Time complexity is O(k) on average where k is the number of keys.
+        """
+        get_value: Callable[[K, V | None], V | None] = self.get
+
+        return Array([get_value(key, default_value) for key in keys])
+    # fed
+
+    def delete_many(self, keys: Iterable[K]) -> Array[V | None]:
+        """Delete the key-value pairs for each of the given keys and return the deleted values in order, with None for keys that didn't exist.
+
+        Time complexity is O(k) on average where k is the number of keys.
+        """
+        delete_key: Callable[[K], V | None] = self.delete
+
+        return Array([delete_key(key) for key in keys])
+    # fed
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[K, V]], expected_size: int | None = None, engine: str | None = None) -> HashMap[K, V]:
+        """Create a hash map from an iterable of key-value pairs, presized for the expected number of entries.
+
+        If no expected size is given, the number of pairs is used when it is known. Presizing means the hash map is built with a single allocation of its table rather than repeated doublings, so time complexity is O(n) on average without the resizing overhead. If no engine is given, the default engine of the class it is called on is used, so `CompactHashMap.from_pairs` builds a `CompactHashMap`.
+        """
+        hash_map: HashMap[K, V] = cls() if engine is None else cls(engine)
+
+        if expected_size is None and hasattr(pairs, "__len__"):
+            expected_size = len(pairs)
+        # fi
+
+        if expected_size is not None:
+            hash_map._reserve(expected_size)
+        # fi
+
+        hash_map.set_many(pairs)
+
+        return hash_map
     # fed
 
     def for_each(self, callback: Callable[[K, V], None]) -> None:
         """Run a callback function for each entry in the hash map passing the key and value of the entry.
 
-        Insertion order is not preserved so order of iteration may appear to be random.
+        Insertion order is not preserved so order of iteration may appear to be random. Any incremental resize in progress is finished first, so lookups made by the callback cannot move entries between buckets.
         """
+        self._finish_rehash()
+
         for i in range(self._bucket_array.length()):
-            bucket: HashMap._Bucket = self._bucket_array.get(i)
+            bucket: HashMap._Bucket | None = self._bucket_array.get(i)
 
-            bucket.for_each(lambda entry: callback(entry.key, entry.value))
+            if bucket is not None:
+                bucket.for_each(lambda entry: callback(entry.key, entry.value))
+            # fi
+        # rof
+    # fed
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """Lazily yield the key and value of each entry in the hash map.
+
+        Insertion order is not preserved so order of iteration may appear to be random. Any incremental resize in progress is finished first, so lookups made while iterating cannot move entries between buckets, but the hash map must not be modified while the iterator is in use.
+        """
+        self._finish_rehash()
+
+        for i in range(self._bucket_array.length()):
+            bucket: HashMap._Bucket | None = self._bucket_array.get(i)
+
+            if bucket is not None:
+                for entry in bucket:
+                    yield entry.key, entry.value
+                # rof
+            # fi
+        # rof
+    # fed
+
+    def keys(self) -> Iterator[K]:
+        """Lazily yield the key of each entry in the hash map."""
+        for key, _ in self.items():
+            yield key
+        # rof
+    # fed
+
+    def values(self) -> Iterator[V]:
+        """Lazily yield the value of each entry in the hash map."""
+        for _, value in self.items():
+            yield value
         # rof
     # fed
 
@@ -183,6 +423,46 @@ class HashMap(Generic[K, V]):
         """Get the number of key-value pairs in the hash map."""
         return self._size
     # fed
+
+    def __iter__(self) -> Iterator[K]:
+        """Lazily yield the key of each entry in the hash map."""
+        return self.keys()
+    # fed
+
+    def __len__(self) -> int:
+        """Get the number of key-value pairs in the hash map."""
+        return self._size
+    # fed
+
+    def __contains__(self, key: K) -> bool:
+        """Return a flag indicating whether there is an entry in the hash map for the given key."""
+        return self.contains(key)
+    # fed
+
+    def __getitem__(self, key: K) -> V:
+        """Get the value associated with a key in the hash map or raise a KeyError if the key doesn't exist."""
+        value: V | object = self.get(key, HashMap._MISSING)
+
+        if value is HashMap._MISSING:
+            raise KeyError(key)
+        # fi
+
+        return value
+    # fed
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Insert a key-value pair into the hash map."""
+        self.set(key, value)
+    # fed
+
+    def __delitem__(self, key: K) -> None:
+        """Delete the key-value pair for a key from the hash map or raise a KeyError if the key doesn't exist."""
+        if not self.contains(key):
+            raise KeyError(key)
+        # fi
+
+        self.delete(key)
+    # fed
 # ssalc
 
 
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import TypeVar, Callable
+import sys
+from .cache import Cache
+from .hash_map import HashMap
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+class LFUCache(Cache[K, V]):
+    """A class that implements a least frequently used cache.
+
+    Nodes are grouped into one circular doubly linked list per use frequency, each ordered from most to least recently used, and the lists are found through a hash map from frequency to list. A use moves the entry's node from its list to the front of the list for the next frequency and eviction removes the least recently used node of the lowest frequency, so ties between equally frequent entries are broken by recency. Tracking the lowest frequency as entries are used keeps both operations O(1).
+    """
+
+    _frequencies: HashMap[int, Cache._Node] # The hash map from a use frequency to the sentinel of the list of nodes with that frequency
+    _min_frequency: int # The lowest use frequency of any entry in the cache
+
+    def __init__(self, max_entries: int | None = 128, max_bytes: int | None = None, sizeof: Callable[[V], int] = sys.getsizeof):
+        """Initialise an empty cache with the given bounds, see `Cache`."""
+        super().__init__(max_entries, max_bytes, sizeof)
+
+        self._frequencies = HashMap()
+        self._min_frequency = 0
+    # fed
+
+    def _link_front(self, node: Cache._Node) -> None:
+        """Link a node at the front of the list for its frequency, creating the list if needed."""
+        order: Cache._Node | None = self._frequencies.get(node.frequency)
+
+        if order is None:
+            order = self._Node()
+            self._frequencies.set(node.frequency, order)
+        # fi
+
+        self._link_after(node, order)
+    # fed
+
+    def _attach(self, node: Cache._Node) -> None:
+        """Add a newly inserted node to the list for a frequency of 1, which becomes the lowest frequency."""
+        node.frequency = 1
+        self._link_front(node)
+        self._min_frequency = 1
+    # fed
+
+    def _unlink_from_frequency(self, node: Cache._Node) -> bool:
+        """Unlink a node from the list for its frequency, deleting the list if it is left empty, and return a flag indicating whether it was."""
+        order: Cache._Node = self._frequencies.get(node.frequency)
+
+        self._unlink(node)
+
+        if order.next is order:
+            self._frequencies.delete(node.frequency)
+
+            return True
+        # fi
+
+        return False
+    # fed
+
+    def _detach(self, node: Cache._Node) -> None:
+        """Unlink a node from the list for its frequency, deleting the list if it is left empty."""
+        self._unlink_from_frequency(node)
+    # fed
+
+    def _touch(self, node: Cache._Node) -> None:
+        """Move a used node to the front of the list for the next frequency, raising the lowest frequency if its list was emptied."""
+        if self._unlink_from_frequency(node) and self._min_frequency == node.frequency:
+            self._min_frequency += 1
+        # fi
+
+        node.frequency += 1
+        self._link_front(node)
+    # fed
+
+    def _victim(self) -> Cache._Node:
+        """Get the least recently used node with the lowest frequency.
+
+        The lowest frequency goes stale whenever the last node with that frequency is removed rather than used, whether by an explicit delete or by an earlier eviction, such as during a multi-entry eviction or an eviction after an update grew a value. In that case it is recomputed from the remaining frequencies, which is O(f) where f is the number of distinct frequencies, and every other call is O(1).
+        """
+        order: Cache._Node | None = self._frequencies.get(self._min_frequency)
+
+        if order is None:
+            self._min_frequency = min(self._frequencies.keys())
+            order = self._frequencies.get(self._min_frequency)
+        # fi
+
+        return order.prev
+    # fed
+# ssalc
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, List, Callable
+from typing import TypeVar, Generic, List, Callable, Iterator
 from .array import Array
 
 T = TypeVar("T")
@@ -12,12 +12,17 @@ class LinkedList(Generic[T]):
         
         def __init__(self):
             """Instantiate the parent error class with a custom out of bounds message."""
-            super.__init__("Linked list index out of bounds")
+            super().__init__("Linked list index out of bounds")
         # fed
     # ssalc
 
     class _Node:
-        """A class that implements a node in the linked list."""
+        """A class that implements a node in the linked list.
+
+        Nodes use `__slots__` so they carry no per-instance `__dict__`, which makes each node a fraction of the size and its attributes faster to access.
+        """
+
+        __slots__ = ("value", "next")
 
         value: T # The value of the node
         next: _Node | None # A pointer to the next node in the linked list
@@ -32,33 +37,68 @@ class LinkedList(Generic[T]):
     _length: int # The length of the linked list
     _head: LinkedList._Node | None # A pointer to the head of the linked list
     _tail: LinkedList._Node | None # A pointer to the tail of the linked list
+    _pool: LinkedList._Node | None # The head of the free list of released nodes available for reuse
+    _pool_length: int # The number of nodes in the free list
+    _pool_size: int # The maximum number of nodes kept in the free list
 
-    def __init__(self, values: Array[T] | None = None):
-        """Initialises the linked list with the given elements if any and sets the length."""
-        if values:
-            self._length = values.length
-            self._head = self._Node(values.get(0))
-            
-            current: LinkedList._Node = self._head
+    def __init__(self, values: Array[T] | None = None, pool_size: int = 0):
+        """Initialises the linked list with the given elements if any and sets the length.
 
-            for i in range(1, values.length):
-                current.next = self._Node(values.get(i))
+        Arguments
+        ---------
+        values
+            The initial values of the linked list.
 
-                current = current.next
+        pool_size
+            The maximum number of deleted nodes to keep in a free list and reuse for later insertions. A pool lets a high-churn linked list, such as one backing a queue, stop allocating and freeing a node object on every insertion and deletion. Defaults to 0 which disables pooling.
+        """
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._pool = None
+        self._pool_length = 0
+        self._pool_size = pool_size
+
+        if values is not None:
+            for i in range(values.length()):
+                self.append(values.get(i))
             # rof
+        # fi
+    # fed
+
+    def _new_node(self, value: T, nxt: LinkedList._Node | None = None) -> LinkedList._Node:
+        """Take a node from the free list if there is one or else create a node, and set its value and next node."""
+        node: LinkedList._Node | None = self._pool
+
+        if node is None:
+            return self._Node(value, nxt)
+        # fi
+
+        self._pool = node.next
+        self._pool_length -= 1
+        node.value = value
+        node.next = nxt
+
+        return node
+    # fed
+
+    def _release(self, node: LinkedList._Node) -> None:
+        """Clear a node removed from the linked list and keep it in the free list if it is not full."""
+        node.value = None # release the reference to the value so it can be garbage collected
 
-            self._tail = current
+        if self._pool_length < self._pool_size:
+            node.next = self._pool
+            self._pool = node
+            self._pool_length += 1
         else:
-            self._head = None
-            self._tail = None
-            self._length = 0
+            node.next = None
         # fi
     # fed
 
     def _validate_less_than_eq_to_n(self, value: int) -> None:
         """Do nothing if the given value is between 0 and the linked list length inclusive or raise a LinkedListIndexError."""
         if value < 0 or value > self._length:
-            raise self.inkedListIndexError
+            raise self.LinkedListIndexError
         # fi
     # fed
 
@@ -102,22 +142,18 @@ class LinkedList(Generic[T]):
         """
         self._validate_less_than_eq_to_n(index)
 
-        if index == 0:
-            new_node: LinkedList._Node = self._Node(value, self._head)
-            self._head = new_node
+        if index == self._length:
+            self.append(value)
 
-            if self._length == 0:
-                self._tail = self._head
-            # fi
+            return
+        # fi
+
+        if index == 0:
+            self._head = self._new_node(value, self._head)
         else:
             node_behind: LinkedList._Node = self._traverse(index - 1)
-            new_node: LinkedList._Node = self._Node(value, node_behind.next)
 
-            node_behind.next = new_node
-
-            if index == self._length:
-                self._tail = self._tail.next
-            # fi
+            node_behind.next = self._new_node(value, node_behind.next)
         # fi
 
         self._length += 1
@@ -126,9 +162,18 @@ class LinkedList(Generic[T]):
     def append(self, value: T) -> None:
         """Append an item at the end of the linked list.
 
-        Time complexity is the worst case time complexity of the `insert` method so O(n).
+        Time complexity is O(1) since the new node is linked directly after the tail which we have a reference to, without any traversal or index validation.
         """
-        self.insert(self._length, value)
+        node: LinkedList._Node = self._new_node(value)
+
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail.next = node
+        # fi
+
+        self._tail = node
+        self._length += 1
     # fed
 
     def prepend(self, value: T) -> None:
@@ -147,29 +192,21 @@ class LinkedList(Generic[T]):
         self._validate_index(index)
 
         if index == 0:
-            value: T = self._head.value
-            head: LinkedList._Node = self._head
-            self._head = self._head.next # move head pointer to next node
-            head.next = None # detach old head from linked list
-
-            # if the head was the only node (which we just removed), nullify the tail
-            if self._length == 1:
-                self._tail = None
-            # fi
-        else:
-            node_behind: LinkedList._Node = self._traverse(index - 1)
-            node: LinkedList._Node = node_behind.next
-            value: T = node.value
+            return self.delete_first()
+        # fi
 
-            node_behind.next = node.next # point node behind to node ahead
-            node.next = None # detach old node
+        node_behind: LinkedList._Node = self._traverse(index - 1)
+        node: LinkedList._Node = node_behind.next
+        value: T = node.value
 
-            # if we just removed the tail, make the tail point to the node behind
-            if index == self._length - 1:
-                self._tail = node_behind
-            # fi
+        node_behind.next = node.next # point node behind to node ahead
+
+        # if we just removed the tail, make the tail point to the node behind
+        if index == self._length - 1:
+            self._tail = node_behind
         # fi
 
+        self._release(node) # detach old node
         self._length -= 1
 
         return value
@@ -178,15 +215,32 @@ class LinkedList(Generic[T]):
     def delete_first(self) -> T:
         """Delete the head of the linked list and return its value or raise a LinkedListIndexError if the linked list is empty.
         
-        Time complexity is the best case time complexity of the `delete` method so O(1).
+        Time complexity is O(1) since the head is unlinked directly without any traversal.
         """
-        return self.delete(0)
+        head: LinkedList._Node | None = self._head
+
+        if head is None:
+            raise self.LinkedListIndexError
+        # fi
+
+        value: T = head.value
+        self._head = head.next # move head pointer to next node
+
+        # if the head was the only node (which we just removed), nullify the tail
+        if self._head is None:
+            self._tail = None
+        # fi
+
+        self._release(head) # detach old head from linked list
+        self._length -= 1
+
+        return value
     # fed
 
     def delete_last(self) -> T:
         """Delete the tail of the linked list and return its value or raise a LinkedListIndexError if the linked list is empty.
         
-        Time complexity is the worst case time complexity of the `delete` method so O(1).
+        Time complexity is the worst case time complexity of the `delete` method so O(n), since the list is singly linked the node before the tail can only be found by traversing from the head.
         """
         return self.delete(self._length - 1)
     # fed
@@ -292,11 +346,18 @@ class LinkedList(Generic[T]):
 
         while node_behind and node_behind.next:
             if not match(node_behind.next.value):
-                node_behind.next = node_behind.next.next
+                removed: LinkedList._Node = node_behind.next
+
+                node_behind.next = removed.next
+                self._release(removed)
+                self._length -= 1
             else:
                 node_behind = node_behind.next
             # fi
         # elihw
+
+        # the last node kept (if any) is the new tail
+        self._tail = node_behind
     # fed
 
     def for_each(self, callback: Callable[[T], None]) -> None:
@@ -320,4 +381,18 @@ class LinkedList(Generic[T]):
         """Get the length of the linked list."""
         return self._length
     # fed
+
+    def __iter__(self) -> Iterator[T]:
+        """Lazily yield each value in the linked list from head to tail.
+
+        Time complexity is O(n) to exhaust the iterator but each value is produced in O(1), so iteration can stop early without visiting the rest of the list.
+        """
+        current: LinkedList._Node | None = self._head
+
+        while current:
+            yield current.value
+
+            current = current.next
+        # elihw
+    # fed
 # ssalc
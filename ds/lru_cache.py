@@ -0,0 +1,77 @@
+from __future__ import annotations
+from typing import TypeVar, Callable, Any
+import functools
+import sys
+from .cache import Cache
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+class LRUCache(Cache[K, V]):
+    """A class that implements a least recently used cache.
+
+    Entries are kept in a circular doubly linked list ordered from most to least recently used. A use moves the entry's node to the front and eviction removes the node at the back, both in O(1) given the node from the hash map.
+    """
+
+    _order: Cache._Node # The sentinel of the list of nodes, its next node is the most recently used and its previous node the least
+
+    def __init__(self, max_entries: int | None = 128, max_bytes: int | None = None, sizeof: Callable[[V], int] = sys.getsizeof):
+        """Initialise an empty cache with the given bounds, see `Cache`."""
+        super().__init__(max_entries, max_bytes, sizeof)
+
+        self._order = self._Node()
+    # fed
+
+    def _attach(self, node: Cache._Node) -> None:
+        """Add a newly inserted node at the front as the most recently used."""
+        self._link_after(node, self._order)
+    # fed
+
+    def _detach(self, node: Cache._Node) -> None:
+        """Unlink a node from the list."""
+        self._unlink(node)
+    # fed
+
+    def _touch(self, node: Cache._Node) -> None:
+        """Move a used node to the front as the most recently used."""
+        self._unlink(node)
+        self._link_after(node, self._order)
+    # fed
+
+    def _victim(self) -> Cache._Node:
+        """Get the node at the back as the least recently used."""
+        return self._order.prev
+    # fed
+# ssalc
+
+_KWARGS_MARK: object = object() # Separates positional from keyword arguments in memoization keys
+
+def memoize(max_entries: int | None = 128, max_bytes: int | None = None) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """Create a decorator that caches the results of a function in an `LRUCache` keyed on its arguments.
+
+    The arguments must be hashable. The cache is exposed as the `cache` attribute of the decorated function so its counters can be inspected.
+    """
+    def decorator(function: Callable[..., V]) -> Callable[..., V]:
+        cache: LRUCache[Any, V] = LRUCache(max_entries, max_bytes)
+        missing: object = object()
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> V:
+            key: tuple = args if not kwargs else args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            value: V | object = cache.get(key, missing)
+
+            if value is missing:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+            # fi
+
+            return value
+        # fed
+
+        wrapper.cache = cache
+
+        return wrapper
+    # fed
+
+    return decorator
+# fed
@@ -0,0 +1,76 @@
+from __future__ import annotations
+from typing import TypeVar, Generic
+from .queue import Queue
+
+T = TypeVar("T")
+
+class MonotonicQueue(Generic[T]):
+    """A class that implements a double-ended queue whose elements stay sorted from front to back.
+
+    Enqueueing an element first drops every element at the back that would break the order, so the front is always the minimum (or maximum) of the elements still queued, while elements leave from the front in the order they arrived. Each element is enqueued and dropped or dequeued at most once, so n enqueues take O(n) time in total.
+
+    This is the structure behind sliding window minimum and maximum: an element is dropped once a later element beats it, since it can never be the extreme of a window that also holds the later one. Storing `(value, index)` pairs lets the caller dequeue the front once its index leaves the window.
+
+    Elements are held in a ring buffer `Queue` so both ends are O(1) without allocating per element.
+    """
+
+    _queue: Queue[T] # The underlying container for the queue
+    _increasing: bool # Whether the elements are non-decreasing from front to back, rather than non-increasing
+
+    def __init__(self, increasing: bool = True):
+        """Initialise an empty queue keeping its elements non-decreasing from front to back if increasing, so the front is the minimum, or non-increasing otherwise, so the front is the maximum."""
+        self._queue = Queue(engine=Queue.RING_BUFFER)
+        self._increasing = increasing
+    # fed
+
+    def _breaks_order(self, back: T, value: T) -> bool:
+        """Return a flag indicating whether enqueueing the value behind the given element would break the order of the queue."""
+        return back > value if self._increasing else back < value
+    # fed
+
+    def enqueue(self, value: T) -> int:
+        """Drop every element at the back that would break the order of the queue, add the item to the back and return how many elements were dropped.
+
+        Time complexity is O(k) where k is the number of elements dropped, which is amortized O(1) since every element is dropped at most once.
+        """
+        dropped: int = 0
+
+        while self._queue.length() > 0 and self._breaks_order(self._queue.back(), value):
+            self._queue.dequeue_last()
+            dropped += 1
+        # elihw
+
+        self._queue.enqueue(value)
+
+        return dropped
+    # fed
+
+    def dequeue(self) -> T:
+        """Remove the element at the front of the queue and return it or raise a Queue.QueueIndexError if the queue is empty.
+
+        Time complexity is O(1).
+        """
+        return self._queue.dequeue()
+    # fed
+
+    def front(self) -> T:
+        """Get the element at the front of the queue, the minimum if increasing or the maximum otherwise, or raise a Queue.QueueIndexError if the queue is empty.
+
+        Time complexity is O(1).
+        """
+        return self._queue.front()
+    # fed
+
+    def back(self) -> T:
+        """Get the element at the back of the queue, the most recently enqueued, or raise a Queue.QueueIndexError if the queue is empty.
+
+        Time complexity is O(1).
+        """
+        return self._queue.back()
+    # fed
+
+    def length(self) -> int:
+        """Get the length of the queue."""
+        return self._queue.length()
+    # fed
+# ssalc
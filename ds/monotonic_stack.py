@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import TypeVar, Generic
+from .array import Array
+from .stack import Stack
+
+T = TypeVar("T")
+
+class MonotonicStack(Generic[T]):
+    """A class that implements a stack whose elements stay sorted from bottom to top.
+
+    Pushing an element first pops every element on top that would break the order, so the stack is always non-decreasing (or non-increasing) from bottom to top, and the popped elements are returned to the caller. Each element is pushed and popped at most once, so n pushes take O(n) time in total, which is what makes the structure the standard tool for next greater or smaller element problems: an element is popped exactly when the first element after it that beats it arrives.
+    """
+
+    _stack: Stack[T] # The underlying container for the stack
+    _increasing: bool # Whether the elements are non-decreasing from bottom to top, rather than non-increasing
+
+    def __init__(self, increasing: bool = True):
+        """Initialise an empty stack keeping its elements non-decreasing from bottom to top if increasing, or non-increasing otherwise."""
+        self._stack = Stack()
+        self._increasing = increasing
+    # fed
+
+    def _breaks_order(self, top: T, value: T) -> bool:
+        """Return a flag indicating whether pushing the value on top of the given element would break the order of the stack."""
+        return top > value if self._increasing else top < value
+    # fed
+
+    def push(self, value: T) -> Array[T]:
+        """Pop every element that would break the order of the stack, push the item and return the popped elements from the top down.
+
+        Time complexity is O(k) where k is the number of elements popped, which is amortized O(1) since every element is popped at most once.
+        """
+        size: int = self._stack.size()
+        count: int = 0
+
+        while count < size and self._breaks_order(self._stack.get(size - 1 - count), value):
+            count += 1
+        # elihw
+
+        popped: Array[T] = self._stack.pop_many(count)
+
+        self._stack.push(value)
+
+        return popped
+    # fed
+
+    def pop(self) -> T:
+        """Remove and return the item at the top of the stack or raise a Stack.StackIndexError if the stack is empty.
+
+        Time complexity is amortized O(1).
+        """
+        return self._stack.pop()
+    # fed
+
+    def peek(self) -> T:
+        """Return the item at the top of the stack or raise a Stack.StackIndexError if the stack is empty.
+
+        Time complexity is O(1).
+        """
+        return self._stack.peek()
+    # fed
+
+    def get(self, index: int) -> T:
+        """Get the item in the stack at the given index from the bottom or raise a Stack.StackIndexError if out of bounds.
+
+        Time complexity is O(1).
+        """
+        return self._stack.get(index)
+    # fed
+
+    def size(self) -> int:
+        """Get the size of the stack."""
+        return self._stack.size()
+    # fed
+# ssalc
@@ -1,3 +1,4 @@
+from __future__ import annotations
 from typing import TypeVar, Generic
 from .linked_list import LinkedList
 from .array import Array
@@ -5,7 +6,10 @@ from .array import Array
 T = TypeVar("T")
 
 class Queue(Generic[T]):
-    """A class that implements a linked-list-based double-ended queue."""
+    """A class that implements a linked-list-based double-ended queue.
+
+    The storage engine is selected at construction. The default `Queue.LINKED_LIST` engine is implemented by this class. Passing `Queue.RING_BUFFER` instead constructs a `RingBufferQueue` which stores elements in a circular buffer over a contiguous array, giving O(1) operations at both ends and O(1) random access without allocating per element.
+    """
  
     class QueueIndexError(IndexError):
         """Custom error class for queue index out of bounds errors."""
@@ -13,12 +17,33 @@ class Queue(Generic[T]):
         def __init__(self):
             super().__init__("Queue index out of bounds")
         # fed
+    # ssalc
+
+    LINKED_LIST: str = "linked_list" # Engine using a singly linked list
+    RING_BUFFER: str = "ring_buffer" # Engine using a circular buffer over a contiguous array
+
+    _NODE_POOL_SIZE: int = 64 # The number of dequeued nodes the internal linked list keeps for reuse by later enqueues
 
     _queue: LinkedList[T] # The underlying container for the queue
 
-    def __init__(self, values: Array[T] | None = None):
-        """Initialise the internal container of the queue to the given elements if any."""
-        self._queue = LinkedList(values)
+    def __new__(cls, values: Array[T] | None = None, engine: str = LINKED_LIST, *args, **kwargs):
+        """Construct a `RingBufferQueue` instead if the ring buffer engine is selected."""
+        if cls is Queue and engine == Queue.RING_BUFFER:
+            from .ring_buffer_queue import RingBufferQueue
+
+            return super().__new__(RingBufferQueue)
+        # fi
+
+        return super().__new__(cls)
+    # fed
+
+    def __init__(self, values: Array[T] | None = None, engine: str = LINKED_LIST):
+        """Initialise the internal container of the queue to the given elements if any or raise a ValueError if the engine is unknown."""
+        if engine != Queue.LINKED_LIST:
+            raise ValueError(f"Unknown queue engine: {engine}")
+        # fi
+
+        self._queue = LinkedList(values, Queue._NODE_POOL_SIZE)
     # fed
 
     def enqueue(self, value: T) -> None:
@@ -52,7 +77,7 @@ class Queue(Generic[T]):
     def dequeue_last(self) -> T:
         """Remove an element from the back of the queue and return it or raise a QueueIndexError if the queue is empty.
         
-        The back of the queue is at the tail of the internal linked list. So, dequeue time complexity is O(1) given that we are deleting and retrieving the tail which we have a reference to.
+        The back of the queue is at the tail of the internal linked list. Although we have a reference to the tail, the linked list is singly linked so the node before it has to be found by traversal, making dequeue time complexity O(n). A `DoublyLinkedList` supports this in O(1).
         """
         try:
             return self._queue.delete_last()
@@ -84,7 +109,7 @@ class Queue(Generic[T]):
         """
         try:
             return self._queue.get(index)
-        except LinkedList.LinkedListError as e:
+        except LinkedList.LinkedListIndexError as e:
             raise self.QueueIndexError from e
         # yrt
     # fed
@@ -0,0 +1,164 @@
+from __future__ import annotations
+from typing import TypeVar
+from .array import Array
+from .queue import Queue
+
+T = TypeVar("T")
+
+class RingBufferQueue(Queue[T]):
+    """A class that implements a double-ended queue as a circular buffer over a contiguous array.
+
+    The elements occupy a run of slots starting at the head index and wrapping around the end of the buffer, so adding or removing at either end only moves the head index or the length and never shifts elements, and the element at any index is found with one modulo. When a growable buffer is full its capacity is doubled, so enqueues are amortized O(1) with no allocation per element.
+
+    If a fixed capacity is given the buffer never grows. Instead, enqueueing onto a full queue overwrites the oldest element at the front (and enqueueing at the front of a full queue drops the element at the back), which keeps a rolling window of the most recent elements.
+    """
+
+    _INITIAL_CAPACITY: int = 8 # The initial capacity of a growable buffer
+
+    _buffer: Array[T | None] # The circular buffer, its length is the capacity of the queue
+    _head: int # The index in the buffer of the front of the queue
+    _length: int # The length of the queue
+    _fixed: bool # Whether the capacity is fixed, in which case the oldest elements are overwritten instead of growing
+
+    def __init__(self, values: Array[T] | None = None, engine: str = Queue.RING_BUFFER, capacity: int | None = None):
+        """Initialise the buffer and enqueue the given elements if any or raise a ValueError if the capacity is not positive.
+
+        Arguments
+        ---------
+        values
+            The initial elements of the queue from front to back.
+
+        engine
+            The storage engine, only `Queue.RING_BUFFER` is implemented by this class.
+
+        capacity
+            A fixed capacity for the queue with overwrite-oldest semantics, or None for a growable queue.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        # fi
+
+        self._buffer = Array([None] * (RingBufferQueue._INITIAL_CAPACITY if capacity is None else capacity))
+        self._head = 0
+        self._length = 0
+        self._fixed = capacity is not None
+
+        if values is not None:
+            for i in range(values.length()):
+                self.enqueue(values.get(i))
+            # rof
+        # fi
+    # fed
+
+    def _slot(self, index: int) -> int:
+        """Get the slot in the buffer holding the element at the given index of the queue."""
+        return (self._head + index) % self._buffer.length()
+    # fed
+
+    def _grow(self) -> None:
+        """Double the capacity of a full buffer while keeping the elements in order.
+
+        Empty slots are inserted in a single block move at the head index, which shifts the run from the head to the end of the buffer up into the new upper half. The run that had wrapped around to the start of the buffer stays where it is and now follows that run modulo the new capacity. Time complexity is O(n).
+        """
+        capacity: int = self._buffer.length()
+
+        self._buffer.insert_many(self._head, [None] * capacity)
+        self._head += capacity
+    # fed
+
+    def enqueue(self, value: T) -> None:
+        """Add an element to the back of the queue, overwriting the front element if the queue has a fixed capacity and is full.
+
+        Time complexity is amortized O(1) since the element is written to the slot after the back and the buffer only occasionally has to grow.
+        """
+        if self._length == self._buffer.length():
+            if self._fixed:
+                self._buffer.set(self._head, value)
+                self._head = self._slot(1)
+
+                return
+            # fi
+
+            self._grow()
+        # fi
+
+        self._buffer.set(self._slot(self._length), value)
+        self._length += 1
+    # fed
+
+    def dequeue(self) -> T:
+        """Remove an element from the front of the queue and return it or raise a QueueIndexError if the queue is empty.
+
+        Time complexity is O(1) since the head index is moved forward one slot.
+        """
+        if self._length == 0:
+            raise self.QueueIndexError
+        # fi
+
+        value: T = self._buffer.get(self._head)
+
+        self._buffer.set(self._head, None) # release the reference held by the slot
+        self._head = self._slot(1)
+        self._length -= 1
+
+        return value
+    # fed
+
+    def enqueue_first(self, value: T) -> None:
+        """Add an element to the front of the queue, dropping the back element if the queue has a fixed capacity and is full.
+
+        Time complexity is amortized O(1) since the element is written to the slot before the front.
+        """
+        if self._length == self._buffer.length():
+            if self._fixed:
+                self._length -= 1
+            else:
+                self._grow()
+            # fi
+        # fi
+
+        self._head = self._slot(-1)
+        self._buffer.set(self._head, value)
+        self._length += 1
+    # fed
+
+    def dequeue_last(self) -> T:
+        """Remove an element from the back of the queue and return it or raise a QueueIndexError if the queue is empty.
+
+        Time complexity is O(1) since the length is reduced by one, unlike the linked list engine no traversal is needed.
+        """
+        if self._length == 0:
+            raise self.QueueIndexError
+        # fi
+
+        slot: int = self._slot(self._length - 1)
+        value: T = self._buffer.get(slot)
+
+        self._buffer.set(slot, None)
+        self._length -= 1
+
+        return value
+    # fed
+
+    def get(self, index: int) -> T:
+        """Get the element in the queue at the specified index or raise a QueueIndexError if out of bounds.
+
+        Time complexity is O(1) since the slot is computed directly from the head index.
+        """
+        if index < 0 or index >= self._length:
+            raise self.QueueIndexError
+        # fi
+
+        return self._buffer.get(self._slot(index))
+    # fed
+
+    def length(self) -> int:
+        """Get the length of the queue."""
+        return self._length
+    # fed
+
+    def capacity(self) -> int:
+        """Get the number of elements the queue can hold before it grows or, for a fixed capacity, starts overwriting."""
+        return self._buffer.length()
+    # fed
+# ssalc
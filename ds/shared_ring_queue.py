@@ -0,0 +1,282 @@
+from __future__ import annotations
+from typing import Iterable, Tuple
+from itertools import islice
+import multiprocessing
+import platform
+from multiprocessing import shared_memory, resource_tracker
+import struct
+from .array import Array
+
+class SharedRingQueue:
+    """A class that implements a single-producer/single-consumer ring buffer of fixed-size records in shared memory.
+
+    Records are tuples packed with a `struct` format into slots of a circular buffer in a `multiprocessing.shared_memory` block, so they pass between processes without pickling or a pipe. One process creates the queue and another attaches to it by name.
+
+    The queue is lock-free in the single-producer/single-consumer case: the producer only ever writes the tail index and the consumer only ever writes the head index, each a monotonically increasing counter on its own cache line. The indices are read and written as elements of an 8-byte aligned `memoryview` cast to unsigned 64 bit integers, which is a single 8-byte load or store, so the other side never sees a half-written index. A record is written into its slot before the tail is advanced past it and read out of its slot before the head is advanced past it, so each side only sees slots the other has finished with. This relies on the stores of one process becoming visible to the other in program order, which holds on x86 but not on weakly ordered architectures such as ARM, where the consumer could see an advanced tail before the record bytes and read a torn record, and pure Python has no memory fence to enforce it. Constructing the queue on anything other than x86 therefore raises a RuntimeError. Each side also caches the last index it read from the other side and only re-reads it when the queue looks full or empty, which keeps the two cache lines from bouncing between cores on every operation.
+
+    The batch methods copy many records with a single index update, amortizing the cross-process synchronization over the batch.
+    """
+
+    class QueueIndexError(IndexError):
+        """Custom error class for dequeueing from an empty queue or enqueueing onto a full queue."""
+
+        def __init__(self):
+            """Instantiate the parent error class with a custom out of bounds message."""
+            super().__init__("Shared ring queue index out of bounds")
+        # fed
+    # ssalc
+
+    _X86_MACHINES: Tuple[str, ...] = ("x86_64", "amd64", "x64", "i386", "i486", "i586", "i686", "x86") # The machine names of x86, whose stores are seen by other cores in program order
+
+    _INDEX_SIZE: int = 8 # The size in bytes of an index or size field in the header, an unsigned 64 bit integer
+    _HEAD_OFFSET: int = 0 # The offset of the head index, written only by the consumer
+    _TAIL_OFFSET: int = 64 # The offset of the tail index, written only by the producer, a cache line away from the head
+    _CAPACITY_OFFSET: int = 128 # The offset of the capacity, used to validate attaching processes
+    _RECORD_SIZE_OFFSET: int = 136 # The offset of the record size, used to validate attaching processes
+    _FORMAT_OFFSET: int = 144 # The offset of the record format, zero padded, used to validate attaching processes
+    _FORMAT_SIZE: int = 48 # The maximum size in bytes of the record format
+    _DATA_OFFSET: int = 192 # The offset of the first slot
+
+    _memory: shared_memory.SharedMemory # The shared memory block holding the header and slots
+    _buffer: memoryview # The buffer of the shared memory block
+    _header: memoryview # The header of the buffer cast to unsigned 64 bit integers, through which every index is read and written
+    _record: struct.Struct # The layout of a record
+    _capacity: int # The number of slots
+    _head: int # The consumer's own copy of the head index, which only it writes
+    _tail: int # The producer's own copy of the tail index, which only it writes
+    _cached_head: int # The producer's last read of the head index
+    _cached_tail: int # The consumer's last read of the tail index
+
+    def __init__(self, record_format: str, capacity: int, name: str | None = None, create: bool = True):
+        """Create a new queue in a new shared memory block or attach to the existing queue with the given name.
+
+        Raises a RuntimeError if not running on x86, whose store ordering the queue relies on, and a ValueError if the capacity is not positive, if the record format is longer than 48 bytes or, when attaching, if the record format or capacity differ from the queue's.
+
+        Arguments
+        ---------
+        record_format
+            The `struct` format of a record, e.g. "qd" for a signed 64 bit integer and a double.
+
+        capacity
+            The maximum number of records in the queue.
+
+        name
+            The name of the shared memory block, which is generated if creating and None.
+
+        create
+            Whether to create the shared memory block or attach to an existing one.
+        """
+        if platform.machine().lower() not in self._X86_MACHINES:
+            raise RuntimeError(f"Shared ring queue requires x86 store ordering, not supported on {platform.machine()}")
+        # fi
+
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        # fi
+
+        self._record = struct.Struct(record_format)
+        self._capacity = capacity
+        encoded_format: bytes = self._record.format.encode("ascii").ljust(self._FORMAT_SIZE, b"\0")
+
+        if len(encoded_format) > self._FORMAT_SIZE:
+            raise ValueError(f"Record format must be at most {self._FORMAT_SIZE} bytes")
+        # fi
+
+        if create:
+            self._memory = shared_memory.SharedMemory(name, create=True, size=self._DATA_OFFSET + capacity * self._record.size)
+            self._map_header()
+            self._write_index(self._HEAD_OFFSET, 0)
+            self._write_index(self._TAIL_OFFSET, 0)
+            self._write_index(self._CAPACITY_OFFSET, capacity)
+            self._write_index(self._RECORD_SIZE_OFFSET, self._record.size)
+            self._buffer[self._FORMAT_OFFSET:self._FORMAT_OFFSET + self._FORMAT_SIZE] = encoded_format
+        else:
+            self._memory = shared_memory.SharedMemory(name)
+            self._map_header()
+
+            # only the creating process should unlink the block, so stop an unrelated process's resource tracker from unlinking it at exit,
+            # a multiprocessing child shares its parent's tracker which already tracks the block once however many times it is registered
+            if multiprocessing.parent_process() is None:
+                resource_tracker.unregister(self._memory._name, "shared_memory")
+            # fi
+
+            if (
+                self._read_index(self._CAPACITY_OFFSET) != capacity
+                or self._read_index(self._RECORD_SIZE_OFFSET) != self._record.size
+                or bytes(self._buffer[self._FORMAT_OFFSET:self._FORMAT_OFFSET + self._FORMAT_SIZE]) != encoded_format
+            ):
+                self.close()
+
+                raise ValueError("Record format or capacity does not match the shared queue")
+            # fi
+        # fi
+
+        self._head = self._cached_head = self._read_index(self._HEAD_OFFSET)
+        self._tail = self._cached_tail = self._read_index(self._TAIL_OFFSET)
+    # fed
+
+    def _map_header(self) -> None:
+        """Take the buffer of the shared memory block and view its index and size fields as unsigned 64 bit integers.
+
+        The block starts on a page boundary and every field offset is a multiple of 8, so each element of the view is naturally aligned and is read or written by a single 8-byte load or store. Packing with `struct` gives no such guarantee, and a torn index would let the other side see a count that is far too large or negative.
+        """
+        self._buffer = self._memory.buf
+        self._header = self._buffer[:self._DATA_OFFSET].cast("Q")
+    # fed
+
+    def _read_index(self, offset: int) -> int:
+        """Read an index or size field from the header in a single load."""
+        return self._header[offset // self._INDEX_SIZE]
+    # fed
+
+    def _write_index(self, offset: int, value: int) -> None:
+        """Write an index or size field to the header in a single store."""
+        self._header[offset // self._INDEX_SIZE] = value
+    # fed
+
+    def _slot_offset(self, index: int) -> int:
+        """Get the offset in the buffer of the slot for the record with the given index."""
+        return self._DATA_OFFSET + (index % self._capacity) * self._record.size
+    # fed
+
+    def _free_slots(self, tail: int) -> int:
+        """Get the number of slots free for the producer, re-reading the head index only if the cached one shows none.
+
+        A count outside 0 to the capacity can only come from a bad read of the other side's index, so it is never used as a count: the index is re-read, and if the count is still out of range no slots are reported free and the caller tries again later.
+        """
+        free: int = self._capacity - (tail - self._cached_head)
+
+        if 0 < free <= self._capacity:
+            return free
+        # fi
+
+        self._cached_head = self._read_index(self._HEAD_OFFSET)
+        free = self._capacity - (tail - self._cached_head)
+
+        return free if 0 <= free <= self._capacity else 0
+    # fed
+
+    def _available(self, head: int) -> int:
+        """Get the number of records available to the consumer, re-reading the tail index only if the cached one shows none.
+
+        As with `_free_slots`, a count outside 0 to the capacity is never used: the index is re-read, and if the count is still out of range no records are reported available.
+        """
+        available: int = self._cached_tail - head
+
+        if 0 < available <= self._capacity:
+            return available
+        # fi
+
+        self._cached_tail = self._read_index(self._TAIL_OFFSET)
+        available = self._cached_tail - head
+
+        return available if 0 <= available <= self._capacity else 0
+    # fed
+
+    def enqueue(self, record: Tuple) -> None:
+        """Add a record to the back of the queue or raise a QueueIndexError if the queue is full. Must only be called by the producer.
+
+        Time complexity is O(1).
+        """
+        tail: int = self._tail
+
+        if self._free_slots(tail) == 0:
+            raise self.QueueIndexError
+        # fi
+
+        self._record.pack_into(self._buffer, self._slot_offset(tail), *record)
+        self._tail = tail + 1
+        self._write_index(self._TAIL_OFFSET, self._tail) # publish the record only once it is written
+    # fed
+
+    def enqueue_many(self, records: Iterable[Tuple]) -> int:
+        """Add as many of the given records as fit to the back of the queue and return how many were added. Must only be called by the producer.
+
+        The tail index is advanced once for the whole batch. Time complexity is O(k) where k is the number of records added.
+        """
+        tail: int = self._tail
+        free: int = self._free_slots(tail)
+        count: int = 0
+
+        # take at most as many records as fit, so no record is pulled from an iterator and then dropped
+        for record in islice(records, free):
+            self._record.pack_into(self._buffer, self._slot_offset(tail + count), *record)
+            count += 1
+        # rof
+
+        self._tail = tail + count
+        self._write_index(self._TAIL_OFFSET, self._tail)
+
+        return count
+    # fed
+
+    def dequeue(self) -> Tuple:
+        """Remove the record at the front of the queue and return it or raise a QueueIndexError if the queue is empty. Must only be called by the consumer.
+
+        Time complexity is O(1).
+        """
+        head: int = self._head
+
+        if self._available(head) == 0:
+            raise self.QueueIndexError
+        # fi
+
+        record: Tuple = self._record.unpack_from(self._buffer, self._slot_offset(head))
+        self._head = head + 1
+        self._write_index(self._HEAD_OFFSET, self._head) # free the slot only once it is read
+
+        return record
+    # fed
+
+    def dequeue_many(self, max_n: int) -> Array[Tuple]:
+        """Remove up to the given number of records from the front of the queue and return them, which may be none, or raise a ValueError if the number is negative. Must only be called by the consumer.
+
+        The head index is advanced once for the whole batch. Time complexity is O(k) where k is the number of records removed.
+        """
+        if max_n < 0:
+            raise ValueError("Number of records must not be negative")
+        # fi
+
+        head: int = self._head
+        count: int = min(max_n, self._available(head))
+        records: Array[Tuple] = Array()
+
+        records.reserve(count)
+
+        for i in range(count):
+            records.push(self._record.unpack_from(self._buffer, self._slot_offset(head + i)))
+        # rof
+
+        self._head = head + count
+        self._write_index(self._HEAD_OFFSET, self._head)
+
+        return records
+    # fed
+
+    def length(self) -> int:
+        """Get the number of records in the queue, which may be stale by the time it is used if the other side is active."""
+        return self._read_index(self._TAIL_OFFSET) - self._read_index(self._HEAD_OFFSET)
+    # fed
+
+    def capacity(self) -> int:
+        """Get the maximum number of records in the queue."""
+        return self._capacity
+    # fed
+
+    def name(self) -> str:
+        """Get the name of the shared memory block, for other processes to attach with."""
+        return self._memory.name
+    # fed
+
+    def close(self) -> None:
+        """Detach this process from the shared memory block."""
+        self._header.release()
+        self._buffer.release()
+        self._memory.close()
+    # fed
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block, which should be done once by the creating process after every process has closed it."""
+        self._memory.unlink()
+    # fed
+# ssalc
@@ -1,74 +1,108 @@
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterable, List
 from .array import Array
 
 T = TypeVar("T")
 
 class Stack(Generic[T]):
-    """A class that implements a stack with automatic resizing and a dynamic array."""
+    """A class that implements a stack with automatic resizing and a dynamic array.
+
+    The elements are kept in a Python list whose end is the top of the stack, so a push or pop is a single C-level `append` or `pop` behind one emptiness check, with the list growing and shrinking its own over-allocated storage in amortized O(1). Going through `Array` instead costs an extra method call and its bookkeeping per operation, and managing a pre-sized slot array by hand costs more in interpreted stores than it saves in allocations, so neither is used on the hot path.
+    """
 
     class StackIndexError(IndexError):
         """Custom error class for stack index errors."""
 
         def __init__(self):
             """Instantiates the parent class with a custom out of bounds error message"""
-            super.__init__("Stack index out of bounds")
+            super().__init__("Stack index out of bounds")
         # fed
     # ssalc
 
-    _stack: Array[T] # The underlying container for the stack
+    _elements: List[T] # The underlying container for the stack, with the top of the stack at its end
 
     def __init__(self, elements: Array[T] | None = None):
-        """Put the given elements into the stack if any or initialise an empty stack."""
-        self._stack = elements if elements else Array()
-    # fed
-
-    def _top(self) -> int:
-        """Get the index of the element at the top of the stack."""
-        return self._stack.length() - 1
+        """Put a copy of the given elements into the stack if any or initialise an empty stack."""
+        self._elements = [] if elements is None else [elements.get(i) for i in range(elements.length())]
     # fed
 
     def push(self, value: T) -> None:
         """Push an item onto the top of the stack.
-        
-        Time complexity mirrors the time complexity for a push operation on the internal array so O(1).
+
+        Time complexity is amortized O(1) since it is an append to the end of the internal list.
         """
-        self._stack.push(value)
+        self._elements.append(value)
     # fed
 
     def pop(self) -> T:
         """Remove and return the item at the top of the stack or raise a StackIndexError if the stack is empty.
-        
-        Time complexity mirrors the time complexity for a pop operation on the internal array so O(1).
+
+        Time complexity is amortized O(1) since it is a pop from the end of the internal list. Emptiness is checked up front rather than by translating the list's error, which keeps the common path free of exception handling.
+        """
+        elements: List[T] = self._elements
+
+        if not elements:
+            raise self.StackIndexError
+        # fi
+
+        return elements.pop()
+    # fed
+
+    def push_many(self, values: Iterable[T]) -> None:
+        """Push the given items onto the stack in order, so the last one ends up on top.
+
+        Time complexity is amortized O(k) where k is the number of items, with the items copied onto the internal list in a single block rather than one push at a time.
         """
-        try:
-            return self._stack.pop()
-        except Array.ArrayIndexError as e:
-            raise self.StackIndexError from e
-        # yrt
+        self._elements.extend(values)
+    # fed
+
+    def pop_many(self, n: int) -> Array[T]:
+        """Remove the given number of items from the top of the stack and return them in the order they would have been popped or raise a StackIndexError if the stack has fewer items.
+
+        Time complexity is O(k) where k is the number of items, with the items removed from the internal list in a single block rather than one pop at a time.
+        """
+        elements: List[T] = self._elements
+        length: int = len(elements)
+
+        if n < 0 or n > length:
+            raise self.StackIndexError
+        # fi
+
+        top: List[T] = elements[length - n:]
+
+        del elements[length - n:]
+        top.reverse()
+
+        return Array(top)
     # fed
 
     def peek(self) -> T:
         """Return the item at the top of the stack or raise a StackIndexError if the stack is empty.
-        
-        Time complexity mirrors the time complexity of the `get` method so O(1).
+
+        Time complexity is O(1).
         """
-        return self.get(self._top())
+        elements: List[T] = self._elements
+
+        if not elements:
+            raise self.StackIndexError
+        # fi
+
+        return elements[-1]
     # fed
 
     def get(self, index: int) -> T:
-        """Get the item in the stack at the given index or raise a StackIndexError if out of bounds.
+        """Get the item in the stack at the given index, counted from the bottom, or raise a StackIndexError if out of bounds.
 
-        Time complexity mirrors the time complexity for a get operation on the internal array so O(1).
+        Time complexity is O(1).
         """
-        try:
-            return self._stack.get(index)
-        except Array.ArrayIndexError as e:
-            raise self.StackIndexError from e
-        # yrt
+        if index < 0 or index >= len(self._elements):
+            raise self.StackIndexError
+        # fi
+
+        return self._elements[index]
     # fed
 
     def size(self) -> int:
         """Get the size of the stack."""
-        return self._stack.length()
+        return len(self._elements)
     # fed
 # ssalc
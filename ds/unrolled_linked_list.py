@@ -0,0 +1,349 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, List, Callable, Iterator, Tuple
+from .array import Array
+
+T = TypeVar("T")
+
+class UnrolledLinkedList(Generic[T]):
+    """A class that implements an unrolled singly linked list.
+
+    Each node holds a block of up to a fixed number of values in a contiguous list rather than a single value. Indexed access skips a whole block per step and traversal walks each block with a tight loop over contiguous memory, so per-element object and pointer-chasing overhead drops roughly by a factor of the block capacity. Blocks are split when an insertion overfills them and merged with their successor when deletions leave them under half full, which keeps them between half and completely full in the steady state.
+
+    The API matches `LinkedList` so the two are interchangeable.
+    """
+
+    class UnrolledLinkedListIndexError(IndexError):
+        """Custom error class for unrolled linked list index out of bounds errors."""
+
+        def __init__(self):
+            """Instantiate the parent error class with a custom out of bounds message."""
+            super().__init__("Unrolled linked list index out of bounds")
+        # fed
+    # ssalc
+
+    class _Node:
+        """A class that implements a node holding a block of values in the unrolled linked list."""
+
+        __slots__ = ("values", "next")
+
+        values: List[T] # The block of values of the node
+        next: UnrolledLinkedList._Node | None # A pointer to the next node in the unrolled linked list
+
+        def __init__(self, values: List[T], nxt: UnrolledLinkedList._Node | None = None):
+            """Set the given block of values of the node and the node it points to in the unrolled linked list."""
+            self.values = values
+            self.next = nxt
+        # fed
+    # ssalc
+
+    _DEFAULT_BLOCK_CAPACITY: int = 64 # The default maximum number of values in a block
+
+    _length: int # The length of the unrolled linked list
+    _block_capacity: int # The maximum number of values in a block
+    _head: UnrolledLinkedList._Node | None # A pointer to the first node of the unrolled linked list
+    _tail: UnrolledLinkedList._Node | None # A pointer to the last node of the unrolled linked list
+
+    def __init__(self, values: Array[T] | None = None, block_capacity: int = _DEFAULT_BLOCK_CAPACITY):
+        """Initialise the unrolled linked list with the given elements if any or raise a ValueError if the block capacity is less than 2."""
+        if block_capacity < 2:
+            raise ValueError("Block capacity must be at least 2")
+        # fi
+
+        self._length = 0
+        self._block_capacity = block_capacity
+        self._head = None
+        self._tail = None
+
+        if values is not None:
+            for i in range(values.length()):
+                self.append(values.get(i))
+            # rof
+        # fi
+    # fed
+
+    def _validate_index(self, index: int) -> None:
+        """Do nothing if the given index is within valid bounds for the unrolled linked list or raise an UnrolledLinkedListIndexError."""
+        if index < 0 or index >= self._length:
+            raise self.UnrolledLinkedListIndexError
+        # fi
+    # fed
+
+    def _locate(self, index: int) -> Tuple[UnrolledLinkedList._Node | None, UnrolledLinkedList._Node, int]:
+        """Find the node holding the given index and return the node before it, the node and the offset of the index within its block.
+
+        Time complexity is O(n / b) where b is the block capacity since a whole block is skipped per step.
+        """
+        self._validate_index(index)
+
+        behind: UnrolledLinkedList._Node | None = None
+        current: UnrolledLinkedList._Node = self._head
+
+        while index >= len(current.values):
+            index -= len(current.values)
+            behind = current
+            current = current.next
+        # elihw
+
+        return behind, current, index
+    # fed
+
+    def _split(self, node: UnrolledLinkedList._Node) -> None:
+        """Move the upper half of a full block into a new node linked directly after it."""
+        half: int = len(node.values) // 2
+
+        node.next = self._Node(node.values[half:], node.next)
+        del node.values[half:]
+
+        if self._tail is node:
+            self._tail = node.next
+        # fi
+    # fed
+
+    def _rebalance(self, behind: UnrolledLinkedList._Node | None, node: UnrolledLinkedList._Node) -> None:
+        """Unlink a node whose block has been emptied or merge an under half full block with its successor if they fit in one block."""
+        if not node.values:
+            if behind is None:
+                self._head = node.next
+            else:
+                behind.next = node.next
+            # fi
+
+            if self._tail is node:
+                self._tail = behind
+            # fi
+
+            return
+        # fi
+
+        nxt: UnrolledLinkedList._Node | None = node.next
+
+        if nxt is not None and len(node.values) < self._block_capacity // 2 and len(node.values) + len(nxt.values) <= self._block_capacity:
+            node.values.extend(nxt.values)
+            node.next = nxt.next
+
+            if self._tail is nxt:
+                self._tail = node
+            # fi
+        # fi
+    # fed
+
+    def insert(self, index: int, value: T) -> None:
+        """Insert an item into the unrolled linked list at the given index or raise an UnrolledLinkedListIndexError if out of bounds.
+
+        Time complexity is O(n / b + b) where b is the block capacity, to find the block and then shift values within it.
+        """
+        if index == self._length:
+            self.append(value)
+
+            return
+        # fi
+
+        behind, node, offset = self._locate(index)
+
+        node.values.insert(offset, value)
+        self._length += 1
+
+        if len(node.values) > self._block_capacity:
+            self._split(node)
+        # fi
+    # fed
+
+    def append(self, value: T) -> None:
+        """Append an item at the end of the unrolled linked list.
+
+        Time complexity is O(1) since the value is added to the block of the tail, or a new tail if that block is full.
+        """
+        if self._tail is None:
+            self._head = self._tail = self._Node([value])
+        elif len(self._tail.values) < self._block_capacity:
+            self._tail.values.append(value)
+        else:
+            self._tail.next = self._Node([value])
+            self._tail = self._tail.next
+        # fi
+
+        self._length += 1
+    # fed
+
+    def prepend(self, value: T) -> None:
+        """Prepend an item at the beginning of the unrolled linked list.
+
+        Time complexity is O(b) where b is the block capacity, to shift the values of the first block.
+        """
+        self.insert(0, value)
+    # fed
+
+    def delete(self, index: int) -> T:
+        """Delete an item from the unrolled linked list at the given index and return its value or raise an UnrolledLinkedListIndexError if out of bounds.
+
+        Time complexity is O(n / b + b) where b is the block capacity, to find the block and then shift values within it.
+        """
+        behind, node, offset = self._locate(index)
+        value: T = node.values.pop(offset)
+
+        self._length -= 1
+        self._rebalance(behind, node)
+
+        return value
+    # fed
+
+    def delete_first(self) -> T:
+        """Delete the first item of the unrolled linked list and return its value or raise an UnrolledLinkedListIndexError if the list is empty.
+
+        Time complexity is O(b) where b is the block capacity.
+        """
+        return self.delete(0)
+    # fed
+
+    def delete_last(self) -> T:
+        """Delete the last item of the unrolled linked list and return its value or raise an UnrolledLinkedListIndexError if the list is empty.
+
+        Time complexity is O(1) unless the last block is emptied, in which case the node before it has to be found which is O(n / b).
+        """
+        if self._length == 0:
+            raise self.UnrolledLinkedListIndexError
+        # fi
+
+        if len(self._tail.values) > 1:
+            self._length -= 1
+
+            return self._tail.values.pop()
+        # fi
+
+        return self.delete(self._length - 1)
+    # fed
+
+    def get(self, index: int) -> T:
+        """Get an item from the unrolled linked list at the specified index or raise an UnrolledLinkedListIndexError if out of bounds.
+
+        Time complexity is O(n / b) where b is the block capacity, and O(1) for the last item.
+        """
+        if index == self._length - 1 and index >= 0:
+            return self._tail.values[-1]
+        # fi
+
+        behind, node, offset = self._locate(index)
+
+        return node.values[offset]
+    # fed
+
+    def head(self) -> T:
+        """Get the first item of the unrolled linked list or raise an UnrolledLinkedListIndexError if the list is empty."""
+        return self.get(0)
+    # fed
+
+    def tail(self) -> T:
+        """Get the last item of the unrolled linked list or raise an UnrolledLinkedListIndexError if the list is empty."""
+        return self.get(self._length - 1)
+    # fed
+
+    def set(self, index: int, value: T) -> None:
+        """Set an item in the unrolled linked list at the specified index or raise an UnrolledLinkedListIndexError if out of bounds.
+
+        Time complexity is O(n / b) where b is the block capacity.
+        """
+        behind, node, offset = self._locate(index)
+
+        node.values[offset] = value
+    # fed
+
+    def find(self, match: Callable[[T], bool]) -> T | None:
+        """Linearly search for an item in the unrolled linked list based on a matching function and return the first match or None if none found.
+
+        Time complexity is O(n) in the worst and average case and O(1) in the best case with the target first.
+        """
+        current: UnrolledLinkedList._Node | None = self._head
+
+        while current:
+            for value in current.values:
+                if match(value):
+                    return value
+                # fi
+            # rof
+
+            current = current.next
+        # elihw
+
+        return None
+    # fed
+
+    def map(self, mapper: Callable[[T], T]) -> None:
+        """Replace each item in the unrolled linked list with the result of passing it to the mapper function.
+
+        Time complexity is O(n) since we traverse the whole list, one block at a time.
+        """
+        current: UnrolledLinkedList._Node | None = self._head
+
+        while current:
+            current.values = [mapper(value) for value in current.values]
+            current = current.next
+        # elihw
+    # fed
+
+    def filter(self, match: Callable[[T], bool]) -> None:
+        """Filter the unrolled linked list to only items that pass the given matching function.
+
+        Time complexity is O(n) since we traverse the whole list, one block at a time, and then once more to unlink emptied blocks and merge sparse ones.
+        """
+        behind: UnrolledLinkedList._Node | None = None
+        current: UnrolledLinkedList._Node | None = self._head
+
+        while current:
+            kept: List[T] = [value for value in current.values if match(value)]
+            nxt: UnrolledLinkedList._Node | None = current.next
+
+            self._length -= len(current.values) - len(kept)
+            current.values = kept
+
+            if kept:
+                behind = current
+            else:
+                self._rebalance(behind, current) # unlink the emptied block
+            # fi
+
+            current = nxt
+        # elihw
+
+        # merge the sparse blocks left behind, a block is only advanced past once it can't absorb its successor
+        current = self._head
+
+        while current:
+            nxt: UnrolledLinkedList._Node | None = current.next
+
+            self._rebalance(None, current)
+
+            if current.next is nxt:
+                current = nxt
+            # fi
+        # elihw
+    # fed
+
+    def for_each(self, callback: Callable[[T], None]) -> None:
+        """Traverse the unrolled linked list and run a callback for each item, passing the item."""
+        current: UnrolledLinkedList._Node | None = self._head
+
+        while current:
+            for value in current.values:
+                callback(value)
+            # rof
+
+            current = current.next
+        # elihw
+    # fed
+
+    def length(self) -> int:
+        """Get the length of the unrolled linked list."""
+        return self._length
+    # fed
+
+    def __iter__(self) -> Iterator[T]:
+        """Lazily yield each value in the unrolled linked list from first to last."""
+        current: UnrolledLinkedList._Node | None = self._head
+
+        while current:
+            yield from current.values
+
+            current = current.next
+        # elihw
+    # fed
+# ssalc
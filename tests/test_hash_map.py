@@ -0,0 +1,34 @@
+import unittest
+from ds import HashMap, CompactHashMap
+
+class TestFromPairs(unittest.TestCase):
+    """Check that `from_pairs` builds the right kind of hash map with the given entries."""
+
+    def test_default_engine_of_each_class(self):
+        for cls in (HashMap, CompactHashMap):
+            hash_map = cls.from_pairs([(1, 2), (3, 4)])
+
+            self.assertIs(type(hash_map), cls)
+            self.assertEqual(hash_map.get(1), 2)
+            self.assertEqual(hash_map.get(3), 4)
+        # rof
+    # fed
+
+    def test_explicit_engine(self):
+        self.assertIs(type(HashMap.from_pairs([(1, 2)], engine=HashMap.OPEN_ADDRESSING)), CompactHashMap)
+        self.assertIs(type(CompactHashMap.from_pairs([(1, 2)], engine=HashMap.OPEN_ADDRESSING)), CompactHashMap)
+        self.assertIs(type(HashMap.from_pairs([(1, 2)], engine=HashMap.CHAINING)), HashMap)
+    # fed
+
+    def test_presized_from_generator(self):
+        for cls in (HashMap, CompactHashMap):
+            hash_map = cls.from_pairs(((i, i * i) for i in range(1000)), expected_size=1000)
+
+            self.assertEqual([hash_map.get(i) for i in range(1000)], [i * i for i in range(1000)])
+        # rof
+    # fed
+# ssalc
+
+if __name__ == "__main__":
+    unittest.main()
+# fi
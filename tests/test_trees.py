@@ -0,0 +1,63 @@
+import unittest
+from ds import BinarySearchTree, AVLTree, CompactBinarySearchTree
+from algo.trees import bfs_iter, level_order, breadth_first_search, dfs_iter, PRE_ORDER, IN_ORDER, POST_ORDER
+
+VALUES = [50, 30, 70, 20, 40, 60, 80, 35, 45, 65]
+
+class TestTraversals(unittest.TestCase):
+    """Check that the traversals in `algo.trees` give the same results on node and compact trees."""
+
+    def trees(self):
+        """Build a node tree and compact trees with and without typed value storage from the same insertions."""
+        trees = [BinarySearchTree(), CompactBinarySearchTree(), CompactBinarySearchTree(typecode="q")]
+
+        for tree in trees:
+            for value in VALUES:
+                tree.insert(value)
+            # rof
+        # rof
+
+        return trees
+    # fed
+
+    def test_empty_compact_tree(self):
+        tree = CompactBinarySearchTree()
+
+        self.assertEqual(list(bfs_iter(tree)), [])
+        self.assertEqual(list(level_order(tree)), [])
+        self.assertFalse(breadth_first_search(tree, 1))
+
+        for order in (PRE_ORDER, IN_ORDER, POST_ORDER):
+            self.assertEqual(list(dfs_iter(tree, order)), [])
+        # rof
+    # fed
+
+    def test_compact_matches_nodes(self):
+        nodes, *compacts = self.trees()
+
+        for tree in compacts:
+            self.assertEqual(list(bfs_iter(tree)), list(bfs_iter(nodes)))
+            self.assertEqual([[level.get(i) for i in range(level.length())] for level in level_order(tree)], [[50], [30, 70], [20, 40, 60, 80], [35, 45, 65]])
+            self.assertTrue(breadth_first_search(tree, 65))
+            self.assertFalse(breadth_first_search(tree, 66))
+            self.assertEqual(list(dfs_iter(tree, IN_ORDER)), sorted(VALUES))
+            self.assertEqual(list(dfs_iter(tree, PRE_ORDER)), [50, 30, 20, 40, 35, 45, 70, 60, 65, 80])
+            self.assertEqual(list(dfs_iter(tree, POST_ORDER)), [20, 35, 45, 40, 30, 65, 60, 80, 70, 50])
+        # rof
+
+        for order in (PRE_ORDER, IN_ORDER, POST_ORDER):
+            self.assertEqual(list(dfs_iter(nodes, order)), list(dfs_iter(compacts[0], order)))
+        # rof
+    # fed
+
+    def test_avl_tree(self):
+        tree = AVLTree.from_iterable(range(100))
+
+        self.assertEqual(list(dfs_iter(tree, IN_ORDER)), list(range(100)))
+        self.assertEqual(sorted(bfs_iter(tree)), list(range(100)))
+    # fed
+# ssalc
+
+if __name__ == "__main__":
+    unittest.main()
+# fi